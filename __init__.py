@@ -47,6 +47,9 @@ import os
 if "bpy" in locals():
     import importlib as imp
     imp.reload(archipack_progressbar)
+    imp.reload(archipack_scheduler)
+    imp.reload(archipack_object)
+    imp.reload(archipack_instances)
     imp.reload(archipack_material)
     imp.reload(archipack_snap)
     imp.reload(archipack_manipulator)
@@ -78,12 +81,16 @@ if "bpy" in locals():
     imp.reload(archipack_2d_layout)
     imp.reload(archipack_io_export_svg)
     imp.reload(archipack_polylines)
+    imp.reload(archipack_profiler)
     imp.reload(addon_updater_ops)
     # imp.reload(archipack_i18n)
 
     print("archipack: reload ready")
 else:
     from . import archipack_progressbar
+    from . import archipack_scheduler
+    from . import archipack_object
+    from . import archipack_instances
     from . import archipack_material
     from . import archipack_snap
     from . import archipack_manipulator
@@ -115,6 +122,7 @@ else:
     from . import archipack_2d_layout
     from . import archipack_io_export_svg
     from . import archipack_polylines
+    from . import archipack_profiler
     from . import addon_updater_ops
     # from . import archipack_i18n
 
@@ -268,6 +276,27 @@ class Archipack_Pref(AddonPreferences):
         description="Enable experimental features (may be unstable)",
         default=False
         )
+    # level of detail
+    lod_enable = BoolProperty(
+        name="Preview while dragging",
+        description="Build coarse geometry of heavy objects while dragging manipulators, "
+                    "full detail on release",
+        default=True
+        )
+    lod_threshold = IntProperty(
+        name="Threshold",
+        description="Preview objects with more vertices than this (object and childs)",
+        min=0,
+        default=20000
+        )
+    synch_delay = FloatProperty(
+        name="Linked copies delay",
+        description="Delay in seconds before propagation of changes to linked copies, "
+                    "0 to synch immediately",
+        min=0,
+        max=10,
+        default=0
+        )
     # addon updater preferences
     auto_check_update = BoolProperty(
         name="Auto-check for Update",
@@ -350,6 +379,10 @@ class Archipack_Pref(AddonPreferences):
         col.label(text="Manipulators:")
         col.prop(self, "arrow_size")
         col.prop(self, "handle_size")
+        col.prop(self, "lod_enable")
+        if self.lod_enable:
+            col.prop(self, "lod_threshold")
+        col.prop(self, "synch_delay")
         addon_updater_ops.update_settings_ui(self, context)
 
 
@@ -396,6 +429,7 @@ class TOOLS_PT_Archipack_PolyLib(Panel):
             box.prop(params, "polygonize_bezier_resolution")
             box.prop(params, "polygonize_extend")
             box.prop(params, "polygonize_all_segs")
+            box.prop(params, "polygonize_batch")
 
             box.operator(
                 "archipack.polylib_pick_2d_polygons",
@@ -524,6 +558,9 @@ class TOOLS_PT_Archipack_Tools(Panel):
             row.operator("archipack.animation", text="Add", icon='ZOOMIN').mode = 'ENABLE'
             row.operator("archipack.animation", text="Remove", icon='ZOOMOUT').mode = 'DISABLE'
             row.operator("archipack.animation", text="Clear", icon='X').mode = 'CLEAR'
+
+        if prefs.experimental_features:
+            archipack_profiler.draw_profiler(layout)
         
         """
         box = layout.box()
@@ -817,6 +854,9 @@ def register():
     icons_collection["main"] = icons
 
     archipack_progressbar.register()
+    archipack_scheduler.register()
+    archipack_object.register()
+    archipack_instances.register()
     archipack_material.register()
     archipack_snap.register()
     archipack_manipulator.register()
@@ -847,6 +887,7 @@ def register():
     archipack_2d_layout.register()
     archipack_io_export_svg.register()
     archipack_polylines.register()
+    archipack_profiler.register()
 
     bpy.utils.register_class(archipack_data)
     WindowManager.archipack = PointerProperty(type=archipack_data)
@@ -869,6 +910,9 @@ def unregister():
     bpy.utils.unregister_class(Archipack_Pref)
     # unregister subs
     archipack_progressbar.unregister()
+    archipack_object.unregister()
+    archipack_scheduler.unregister()
+    archipack_instances.unregister()
     archipack_material.unregister()
     archipack_snap.unregister()
     archipack_autoboolean.unregister()
@@ -896,6 +940,7 @@ def unregister():
     archipack_2d_layout.unregister()
     archipack_io_export_svg.unregister()
     archipack_polylines.unregister()
+    archipack_profiler.unregister()
     archipack_manipulator.unregister()
     archipack_dimension.unregister()
     archipack_curveman.unregister()
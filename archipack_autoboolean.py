@@ -28,7 +28,143 @@ import bpy
 import numpy as np
 from bpy.types import Operator
 from bpy.props import BoolProperty
+from bpy.app.handlers import persistent
 from mathutils import Vector
+from .spatialindex import GridIndex3d
+from .pygeos.prepared import PreparedGeometryFactory, RectangleIntersects
+
+
+def world_bounding_box(o):
+    tM = o.matrix_world
+    bpts = np.array([list(tM * Vector(b)) for b in o.bound_box]).transpose()
+    minx, miny, minz = bpts.min(axis=1)
+    maxx, maxy, maxz = bpts.max(axis=1)
+    return minx, miny, minz, maxx, maxy, maxz
+
+
+class ArchipackSceneIndex():
+    """
+        Scene level index of objects world bounding boxes
+        objects boxes are refreshed lazily, on first query
+        after scene_update_post handler or operator tag scene:
+        - added, removed and renamed objects are found comparing names
+        - moved objects are found comparing boxes
+        objects tagged by name are refreshed on next query
+        Removed or moved objects leave stale entries in grid,
+        filtered out on query, grid is rebuilt when stale entries
+        outnumber valid ones.
+    """
+    types = {'MESH', 'CURVE', 'FONT'}
+
+    def __init__(self, cell_size=4.0):
+        self.cell_size = cell_size
+        self.clear()
+
+    def clear(self):
+        self._index = GridIndex3d(self.cell_size)
+        # object name: world bounding box
+        self._boxes = {}
+        self._dirty = set()
+        self._stale = 0
+        self._names = set()
+        self._updated = True
+
+    def tag(self, name):
+        self._dirty.add(name)
+
+    def tag_scene(self):
+        self._updated = True
+
+    def _set(self, o):
+        name = o.name
+        bbox = world_bounding_box(o)
+        old = self._boxes.get(name)
+        if old == bbox:
+            return
+        if old is not None:
+            self._stale += 1
+        self._boxes[name] = bbox
+        self._index._insert(name, bbox)
+
+    def _remove(self, name):
+        if self._boxes.pop(name, None) is not None:
+            self._stale += 1
+
+    def _rebuild(self):
+        self._index = GridIndex3d(self.cell_size)
+        for name, bbox in self._boxes.items():
+            self._index._insert(name, bbox)
+        self._stale = 0
+
+    def ensure(self, scene):
+        objs = scene.objects
+        if self._updated:
+            # added / removed / renamed / moved objects
+            names = {o.name for o in objs if o.type in self.types}
+            for name in self._names - names:
+                self._remove(name)
+            for name in names:
+                self._set(objs[name])
+            self._names = names
+            self._updated = False
+
+        for name in self._dirty:
+            o = objs.get(name)
+            if o is None:
+                self._remove(name)
+            elif o.type in self.types:
+                self._set(o)
+        self._dirty.clear()
+
+        if self._stale > len(self._boxes):
+            self._rebuild()
+
+    def intersect(self, scene, bbox):
+        """
+            Return names of objects whose world bounding box
+            may intersect bbox (minx, miny, minz, maxx, maxy, maxz)
+        """
+        self.ensure(scene)
+        boxes = self._boxes
+        x0, y0, z0, x1, y1, z1 = bbox
+        found = []
+        for name in self._index._intersect(bbox):
+            b = boxes.get(name)
+            # skip stale entries
+            if (b is not None and
+                    b[3] >= x0 and b[0] <= x1 and
+                    b[4] >= y0 and b[1] <= y1 and
+                    b[5] >= z0 and b[2] <= z1):
+                found.append(name)
+        return sorted(found)
+
+
+# scene name: ArchipackSceneIndex
+scene_indexes = {}
+
+
+def get_scene_index(scene):
+    index = scene_indexes.get(scene.name)
+    if index is None:
+        index = ArchipackSceneIndex()
+        scene_indexes[scene.name] = index
+    return index
+
+
+@persistent
+def archipack_scene_index_update(scene):
+    """
+        Tag indexed scene for refresh when objects did change,
+        objects are compared once on next query, not on each update
+    """
+    index = scene_indexes.get(scene.name)
+    if index is not None and bpy.data.objects.is_updated:
+        index.tag_scene()
+
+
+@persistent
+def archipack_scene_index_clear(dummy):
+    scene_indexes.clear()
 
 
 class ArchipackBoolManager():
@@ -48,13 +184,12 @@ class ArchipackBoolManager():
         self.max_x = 0
         self.max_y = 0
         self.max_z = 0
+        # wall 2d polygon and its prepared version
+        self.wall2d = None
+        self.prepared_wall2d = None
 
     def _world_bounding_box(self, o):
-        tM = o.matrix_world
-        bpts = np.array([list(tM * Vector(b)) for b in o.bound_box]).transpose()
-        minx, miny, minz = bpts.min(axis=1)
-        maxx, maxy, maxz = bpts.max(axis=1)
-        return minx, miny, minz, maxx, maxy, maxz
+        return world_bounding_box(o)
 
     def _init_bounding_box(self, wall):
         self.minx, self.miny, self.minz, \
@@ -75,6 +210,50 @@ class ArchipackBoolManager():
 
         return True
 
+    def objects_in_bounds(self, scene, types={'MESH'}):
+        """
+            Objects of types found in bounding box
+            use scene index to get candidates, check current bounding box
+        """
+        index = get_scene_index(scene)
+        objs = scene.objects
+        found = []
+        for name in index.intersect(scene, (
+                self.minx, self.miny, self.minz,
+                self.maxx, self.maxy, self.maxz)):
+            o = objs.get(name)
+            if o is not None and o.type in types and self._contains(o):
+                found.append(o)
+        return found
+
+    def tag_openings(self, scene):
+        """
+            Tag scene index for refresh once per operator,
+            so doors, windows and custom holes created or moved
+            by the calling operator, not yet seen by
+            scene_update_post handler, are up to date
+        """
+        get_scene_index(scene).tag_scene()
+
+    def prepare_wall2d(self, wall2d):
+        """
+            Prepare wall 2d polygon once for all holes tests
+        """
+        self.wall2d = wall2d
+        self.prepared_wall2d = None
+        if wall2d is None:
+            return
+        self.prepared_wall2d = PreparedGeometryFactory.prepare(wall2d)
+
+    def hole_intersects(self, hole2d):
+        """
+            Test hole 2d polygon against prepared wall
+            rectangle holes (axis aligned) use RectangleIntersects
+        """
+        if hole2d.is_rectangle:
+            return RectangleIntersects.intersects(hole2d, self.wall2d)
+        return self.prepared_wall2d.intersects(hole2d)
+
     def filter_wall(self, wall):
         d = wall.data
         return d is not None and (
@@ -249,6 +428,7 @@ class ArchipackBoolManager():
             m = wall.modifiers.get("Wall")
             wd = wall.data.archipack_wall2[0]
             io, wall2d, childs = wd.as_geom(context, wall, 'BOTH', [], [], [])
+            self.prepare_wall2d(wall2d)
             if m is None:
                 wall.select = True
                 context.scene.objects.active = wall
@@ -262,26 +442,25 @@ class ArchipackBoolManager():
         self._init_bounding_box(wall)
 
         # either generate hole or get existing one
-        for o in context.scene.objects:
-            # filter holes found in wall bounding box
-            if o.type == 'MESH' and self._contains(o):
-
-                d = self.datablock(o)
-                intersect = True
-
-                # deep check to ensure neighboors walls
-                # dosent interfer with this one
-                # using a pygeos based 2d check
-                if d is not None and wall2d is not None:
-                    coords = d.hole_2d('BOUND')
-                    hole2d = io.coords_to_polygon(o.matrix_world, coords)
-                    intersect = wall2d.intersects(hole2d)
-
-                if intersect:
-                    h = self._generate_hole(context, o)
-                    if h is not None:
-                        holes.append(h)
-                        childs.append(o)
+        # for holes found in wall bounding box
+        for o in self.objects_in_bounds(context.scene):
+
+            d = self.datablock(o)
+            intersect = True
+
+            # deep check to ensure neighboors walls
+            # dosent interfer with this one
+            # using a pygeos based 2d check
+            if d is not None and wall2d is not None:
+                coords = d.hole_2d('BOUND')
+                hole2d = io.coords_to_polygon(o.matrix_world, coords)
+                intersect = self.hole_intersects(hole2d)
+
+            if intersect:
+                h = self._generate_hole(context, o)
+                if h is not None:
+                    holes.append(h)
+                    childs.append(o)
 
         # sort from center to border
         self.sort_holes(wall, holes)
@@ -343,6 +522,8 @@ class ArchipackBoolManager():
         if hole is None:
             return
 
+        get_scene_index(context.scene).tag(hole.name)
+
         hole.data.materials.clear()
         for mat in wall.data.materials:
             hole.data.materials.append(mat)
@@ -456,6 +637,7 @@ class ARCHIPACK_OT_auto_boolean(Operator):
             manager = ArchipackBoolManager()
             active = context.scene.objects.active
             walls = [wall for wall in context.selected_objects if manager.filter_wall(wall)]
+            manager.tag_openings(context.scene)
             bpy.ops.object.select_all(action='DESELECT')
             for wall in walls:
                 manager.autoboolean(context, wall)
@@ -626,6 +808,8 @@ def register():
     bpy.utils.register_class(ARCHIPACK_OT_auto_boolean)
     bpy.utils.register_class(ARCHIPACK_OT_custom_hole)
     bpy.utils.register_class(ARCHIPACK_OT_apply_holes)
+    bpy.app.handlers.scene_update_post.append(archipack_scene_index_update)
+    bpy.app.handlers.load_post.append(archipack_scene_index_clear)
 
 
 def unregister():
@@ -634,3 +818,6 @@ def unregister():
     bpy.utils.unregister_class(ARCHIPACK_OT_auto_boolean)
     bpy.utils.unregister_class(ARCHIPACK_OT_custom_hole)
     bpy.utils.unregister_class(ARCHIPACK_OT_apply_holes)
+    bpy.app.handlers.scene_update_post.remove(archipack_scene_index_update)
+    bpy.app.handlers.load_post.remove(archipack_scene_index_clear)
+    scene_indexes.clear()
@@ -42,7 +42,7 @@ from mathutils.geometry import (
 from .archipack_manipulator import Manipulable
 # from .archipack_preset import ArchipackPreset, PresetMenuOperator
 from .archipack_gl import FeedbackPanel, GlPolygon, SquareHandle, GlLine, GlText
-from .archipack_object import ArchipackObject, ArchipackDrawTool
+from .archipack_object import ArchipackObject, ArchipackDrawTool, update_versions
 from .archipack_keymaps import Keymaps
 from .archipack_dimension import DimensionProvider
 xAxis = Vector((1, 0, 0))
@@ -256,6 +256,8 @@ class archipack_custom(ArchipackObject, Manipulable, DimensionProvider, Property
         if o is None:
             return
 
+        update_versions.bump(o.name)
+
         self.setup_manipulators()
 
         parts = self.find_parts(o)
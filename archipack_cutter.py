@@ -28,12 +28,13 @@ from mathutils import Vector, Matrix
 from mathutils.geometry import interpolate_bezier
 from math import cos, sin, pi, atan2
 import bmesh
-from random import uniform
+import numpy as np
 from bpy.props import (
     FloatProperty, IntProperty, BoolProperty,
     StringProperty, EnumProperty
     )
 from .archipack_2d import Line
+from .bmesh_utils import BmeshEdit as bmed
 from .archipack_curveman import ArchipackUserDefinedPath
 
 
@@ -204,6 +205,73 @@ class CutterGenerator():
             edges.append([i, i + 1])
 
 
+class CutAbleLocator():
+    """
+        Prepared point inside poly locator
+        Build once a y sorted edge table of segments,
+        then answer batches of points queries in O(1 + k)
+        where k is the number of edges in point's row
+        Use same half open crossing rule as CutAblePolygon.inside
+        segs: segments of one or more rings, holes
+        are handled by the crossing rule
+    """
+    def __init__(self, segs):
+        self.p0 = np.array([tuple(s.p0) for s in segs], dtype=np.float64).reshape(-1, 2)
+        self.p1 = np.array([tuple(s.p1) for s in segs], dtype=np.float64).reshape(-1, 2)
+        n_segs = len(self.p0)
+        y0 = np.minimum(self.p0[:, 1], self.p1[:, 1])
+        y1 = np.maximum(self.p0[:, 1], self.p1[:, 1])
+        if n_segs > 0:
+            self.ymin, self.ymax = y0.min(), y1.max()
+        else:
+            self.ymin, self.ymax = 0, 0
+        self.n_rows = max(1, n_segs)
+        self.row_size = max((self.ymax - self.ymin) / self.n_rows, 1e-12)
+        # store each edge in all rows it overlap
+        r0 = self._row(y0)
+        r1 = self._row(y1)
+        counts = r1 - r0 + 1
+        first = np.cumsum(counts) - counts
+        rows = np.repeat(r0, counts) + np.arange(counts.sum()) - np.repeat(first, counts)
+        order = np.argsort(rows, kind='stable')
+        self.edges = np.repeat(np.arange(n_segs), counts)[order]
+        self.offsets = np.searchsorted(rows[order], np.arange(self.n_rows + 1))
+
+    def _row(self, y):
+        return np.clip(
+            np.floor((y - self.ymin) / self.row_size).astype(np.int64),
+            0, self.n_rows - 1)
+
+    def inside(self, pts):
+        """
+            pts: array of n x 2 points
+            return boolean array, True when point is inside
+        """
+        pts = np.asarray(pts, dtype=np.float64).reshape(-1, 2)
+        res = np.zeros(len(pts), dtype=np.bool_)
+        valid = np.flatnonzero((pts[:, 1] >= self.ymin) & (pts[:, 1] <= self.ymax))
+        if len(valid) < 1 or len(self.edges) < 1:
+            return res
+        rows = self._row(pts[valid, 1])
+        order = np.argsort(rows, kind='stable')
+        valid, rows = valid[order], rows[order]
+        row_ids, starts = np.unique(rows, return_index=True)
+        ends = np.append(starts[1:], len(rows))
+        for row, i0, i1 in zip(row_ids, starts, ends):
+            edges = self.edges[self.offsets[row]:self.offsets[row + 1]]
+            if len(edges) < 1:
+                continue
+            q = valid[i0:i1]
+            x, y = pts[q, 0:1], pts[q, 1:2]
+            x0, y0 = self.p0[edges, 0], self.p0[edges, 1]
+            x1, y1 = self.p1[edges, 0], self.p1[edges, 1]
+            cross = (y0 > y) != (y1 > y)
+            dy = np.where(y1 == y0, 1, y1 - y0)
+            cross &= x < x0 + (y - y0) * (x1 - x0) / dy
+            res[q] = (np.count_nonzero(cross, axis=1) % 2) == 1
+        return res
+
+
 class CutAblePolygon():
     """
         Simple boolean operations
@@ -232,21 +300,32 @@ class CutAblePolygon():
 
     def inside(self, pt, segs=None):
         """
-            Point inside poly (raycast method)
+            Point inside poly (crossing number)
             support concave polygons
-            TODO:
-            make s1 angle different than all othr segs
+            use a half open rule so points on
+            vertices are counted once
+            For many points use locator()
         """
-        s1 = Line(pt, Vector((min(10000, 100 * self.xsize), uniform(-0.5, 0.5))))
         counter = 0
+        x, y = pt[0], pt[1]
         if segs is None:
             segs = self.segs
         for s in segs:
-            res, p, t, u = s.intersect_ext(s1)
-            if res:
+            x0, y0 = s.p0
+            x1, y1 = s.p1
+            if (y0 > y) != (y1 > y) and x < x0 + (y - y0) * (x1 - x0) / (y1 - y0):
                 counter += 1
         return counter % 2 == 1
 
+    def locator(self, segs=None):
+        """
+            Prepared point inside poly locator
+            for batch queries
+        """
+        if segs is None:
+            segs = self.segs
+        return CutAbleLocator(segs)
+
     def get_index(self, index):
         n_segs = len(self.segs)
         if index >= n_segs:
@@ -468,8 +547,125 @@ class CutAblePolygon():
         return True
 
 
+class CutAbleClassifier():
+    """
+        Classify faces against a polygon and its holes
+        Boundary segments are rasterized into a uniform grid,
+        faces whose bounding box touch a boundary cell are
+        straddling, others are located using their center
+        segs: list of boundary segments
+        holes: list of list of hole segments
+        cell_size: grid cell size, about face size
+        margin: distance to boundary where faces are straddling
+    """
+    OUTSIDE = 0
+    INSIDE = 1
+    BOUNDARY = 2
+
+    def __init__(self, segs, holes, cell_size, margin=0, max_cells=2048):
+        self.locator = CutAbleLocator([s for ring in [segs] + list(holes) for s in ring])
+        p0, p1 = self.locator.p0, self.locator.p1
+        pts = np.vstack((p0, p1))
+        border = margin + cell_size
+        if len(pts) > 0:
+            self.origin = pts.min(axis=0) - border
+            size = pts.max(axis=0) + border - self.origin
+        else:
+            self.origin = np.zeros(2)
+            size = np.ones(2)
+        self.cell_size = max(cell_size, float(size.max()) / max_cells, 1e-6)
+        self.shape = np.maximum(np.ceil(size / self.cell_size).astype(np.int64), 1)
+        mask = np.zeros((self.shape[1], self.shape[0]), dtype=np.int32)
+        # rasterize segments using samples closer than half a cell
+        for a, b in zip(p0, p1):
+            n = 2 + int(2 * np.linalg.norm(b - a) / self.cell_size)
+            t = np.linspace(0, 1, n)[:, None]
+            ij = self._cell(a + t * (b - a))
+            mask[ij[:, 1], ij[:, 0]] = 1
+        # dilate boundary cells by margin
+        r = 1 + int(np.ceil(margin / self.cell_size))
+        self.sat = self._summed_area(mask)
+        self.sat = self._summed_area((self._box(self._cell_range(r)) > 0).astype(np.int32))
+
+    def _cell(self, pts):
+        ij = np.floor((pts - self.origin) / self.cell_size).astype(np.int64)
+        return np.clip(ij, 0, self.shape - 1)
+
+    def _cell_range(self, r):
+        ny, nx = self.shape[1], self.shape[0]
+        j, i = np.mgrid[0:ny, 0:nx]
+        return (
+            np.clip(i - r, 0, nx - 1), np.clip(j - r, 0, ny - 1),
+            np.clip(i + r, 0, nx - 1), np.clip(j + r, 0, ny - 1)
+            )
+
+    @staticmethod
+    def _summed_area(mask):
+        sat = np.zeros((mask.shape[0] + 1, mask.shape[1] + 1), dtype=np.int64)
+        sat[1:, 1:] = mask.cumsum(axis=0).cumsum(axis=1)
+        return sat
+
+    def _box(self, box):
+        i0, j0, i1, j1 = box
+        sat = self.sat
+        return sat[j1 + 1, i1 + 1] - sat[j0, i1 + 1] - sat[j1 + 1, i0] + sat[j0, i0]
+
+    def classify(self, bmin, bmax):
+        """
+            Classify bounding boxes
+            bmin, bmax: arrays of n x 2 bounding box corners
+            return array of OUTSIDE, INSIDE, BOUNDARY states
+        """
+        bmin = np.asarray(bmin, dtype=np.float64).reshape(-1, 2)
+        bmax = np.asarray(bmax, dtype=np.float64).reshape(-1, 2)
+        i0, j0 = self._cell(bmin).T
+        i1, j1 = self._cell(bmax).T
+        state = np.where(self.locator.inside(0.5 * (bmin + bmax)), self.INSIDE, self.OUTSIDE)
+        state[self._box((i0, j0, i1, j1)) > 0] = self.BOUNDARY
+        return state
+
+
 class CutAbleGenerator():
 
+    def cull(self, arrays, segs, holes, groups=None, margin=0):
+        """
+            Pre cull faces against a boundary and holes before bissect
+            Fully outside faces are removed, fully inside ones
+            do not need any bissect, only boundary straddling ones do.
+            arrays: faces arrays as returned by BmeshEdit.as_arrays
+            segs: list of boundary segments
+            holes: list of list of hole segments
+            groups: optional sorted group index of faces,
+                faces of a group (eg: a tile) share the same state
+            return arrays of straddling faces, arrays of inside faces
+        """
+        coords, loop_start, loop_total, loop_verts, matids, uvs = arrays
+        if len(loop_start) < 1:
+            return arrays, arrays
+
+        pts = coords[loop_verts, 0:2]
+        bmin = np.minimum.reduceat(pts, loop_start)
+        bmax = np.maximum.reduceat(pts, loop_start)
+
+        if groups is not None:
+            first = np.ones(len(groups), dtype=np.bool_)
+            first[1:] = groups[1:] != groups[:-1]
+            starts = np.flatnonzero(first)
+            index = np.cumsum(first) - 1
+            bmin = np.minimum.reduceat(bmin, starts)
+            bmax = np.maximum.reduceat(bmax, starts)
+
+        cell_size = 0.5 * float(np.median((bmax - bmin).max(axis=1)))
+        state = CutAbleClassifier(segs, holes, cell_size, margin).classify(bmin, bmax)
+
+        if groups is not None:
+            state = state[index]
+
+        return (
+            bmed.select_faces(*arrays, state == CutAbleClassifier.BOUNDARY),
+            bmed.select_faces(*arrays, state == CutAbleClassifier.INSIDE)
+            )
+
     def bissect(self, bm,
             plane_co,
             plane_no,
@@ -537,10 +733,10 @@ class CutAbleGenerator():
                 segs = hole.segs
             if len(segs) > 0:
                 # when hole segs are found clear parts inside hole
-                f_geom = [f for f in bm.faces
-                    if cutable.inside(
-                        f.calc_center_median().to_2d(),
-                        segs=segs)]
+                faces = bm.faces[:]
+                res = cutable.locator(segs).inside(
+                    [f.calc_center_median().to_2d() for f in faces])
+                f_geom = [f for f, inside in zip(faces, res) if inside]
                 if len(f_geom) > 0:
                     bmesh.ops.delete(bm, geom=f_geom, context=5)
 
@@ -565,8 +761,10 @@ class CutAbleGenerator():
                     self.bissect(bm, s.p0.to_3d(), n.to_3d(), clear_outer=cutable.convex)
 
         if not cutable.convex:
-            f_geom = [f for f in bm.faces
-                if not cutable.inside(f.calc_center_median().to_2d())]
+            faces = bm.faces[:]
+            res = cutable.locator().inside(
+                [f.calc_center_median().to_2d() for f in faces])
+            f_geom = [f for f, inside in zip(faces, res) if not inside]
             if len(f_geom) > 0:
                 bmesh.ops.delete(bm, geom=f_geom, context=5)
 
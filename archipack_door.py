@@ -41,7 +41,10 @@ from .panel import Panel as DoorPanel
 from .archipack_handle import create_handle, door_handle_horizontal_01
 from .archipack_manipulator import Manipulable
 from .archipack_preset import ArchipackPreset, PresetMenuOperator
-from .archipack_object import ArchipackObject, ArchipackCreateTool, ArchipackDrawTool
+from .archipack_object import (
+    ArchipackObject, ArchipackCreateTool, ArchipackDrawTool,
+    update_versions
+    )
 from .archipack_gl import FeedbackPanel
 from .archipack_keymaps import Keymaps
 from .archipack_dimension import DimensionProvider
@@ -1201,51 +1204,34 @@ class archipack_door(ArchipackObject, Manipulable, DimensionProvider, PropertyGr
     def get_childs_panels(self, context, o):
         return [child for child in o.children if archipack_door_panel.filter(child)]
 
+    def _create_linked_panel(self, context, o, linked, child):
+        p = bpy.data.objects.new("DoorPanel", child.data)
+        context.scene.objects.link(p)
+        p.lock_location[0] = True
+        p.lock_location[1] = True
+        p.lock_location[2] = True
+        p.lock_rotation[0] = True
+        p.lock_rotation[1] = True
+        p.lock_scale[0] = True
+        p.lock_scale[1] = True
+        p.lock_scale[2] = True
+        p.parent = linked
+        p.matrix_world = linked.matrix_world.copy()
+        m = p.archipack_material.add()
+        m.category = 'door'
+        m.material = o.archipack_material[0].material
+        return p
+
     def _synch_childs(self, context, o, linked, childs):
         """
             sub synch childs nodes of linked object
         """
-        # remove childs not found on source
         l_childs = self.get_childs_panels(context, linked)
-        c_names = [c.data.name for c in childs]
-        for c in l_childs:
-            try:
-                id = c_names.index(c.data.name)
-            except:
-                self.delete_object(context, c)
-
-        # children ordering may not be the same, so get the right l_childs order
-        l_childs = self.get_childs_panels(context, linked)
-        l_names = [c.data.name for c in l_childs]
-        order = []
-        for c in childs:
-            try:
-                id = l_names.index(c.data.name)
-            except:
-                id = -1
-            order.append(id)
-
-        # add missing childs and update other ones
-        for i, child in enumerate(childs):
-            if order[i] < 0:
-                p = bpy.data.objects.new("DoorPanel", child.data)
-                context.scene.objects.link(p)
-                p.lock_location[0] = True
-                p.lock_location[1] = True
-                p.lock_location[2] = True
-                p.lock_rotation[0] = True
-                p.lock_rotation[1] = True
-                p.lock_scale[0] = True
-                p.lock_scale[1] = True
-                p.lock_scale[2] = True
-                p.parent = linked
-                p.matrix_world = linked.matrix_world.copy()
-                m = p.archipack_material.add()
-                m.category = 'door'
-                m.material = o.archipack_material[0].material
-            else:
-                p = l_childs[order[i]]
+        pairs = self.diff_childs(context, childs, l_childs,
+            lambda child: self._create_linked_panel(context, o, linked, child))
 
+        # update location and handles in a single pass
+        for child, p in pairs:
             p.location = child.location.copy()
 
             # update handle
@@ -1275,17 +1261,15 @@ class archipack_door(ArchipackObject, Manipulable, DimensionProvider, PropertyGr
         """
             synch childs nodes of linked objects
         """
-        bpy.ops.object.select_all(action='DESELECT')
-        o.select = True
-        context.scene.objects.active = o
+        linked_objects = self.linked_objects(context, o)
+        if len(linked_objects) < 1:
+            return
         childs = self.get_childs_panels(context, o)
         hole = self.find_hole(o)
-        bpy.ops.object.select_linked(type='OBDATA')
-        for linked in context.selected_objects:
-            if linked != o:
-                self._synch_childs(context, o, linked, childs)
-                if hole is not None:
-                    self._synch_hole(context, linked, hole)
+        for linked in linked_objects:
+            self._synch_childs(context, o, linked, childs)
+            if hole is not None:
+                self._synch_hole(context, linked, hole)
 
     def update_childs(self, context, o):
         """
@@ -1379,6 +1363,8 @@ class archipack_door(ArchipackObject, Manipulable, DimensionProvider, PropertyGr
         if o is None:
             return
 
+        update_versions.bump(o.name)
+
         self.setup_manipulators()
 
         if childs_only is False:
@@ -1411,7 +1397,7 @@ class archipack_door(ArchipackObject, Manipulable, DimensionProvider, PropertyGr
         self.add_dimension_point(6, Vector((-dx, y, 0)))
         self.add_dimension_point(7, Vector((dx, y, 0)))
         
-        self.synch_childs(context, o)
+        self.synch_linked(context, o)
         
         # synch wall dimensions when apply
         self.update_dimensions(context, o)
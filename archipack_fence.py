@@ -876,6 +876,8 @@ class archipack_fence_rail(ArchipackProfile, PropertyGroup):
 
 
 class archipack_fence(ArchipackObject, ArchipackUserDefinedPath, Manipulable, DimensionProvider, PropertyGroup):
+    # coarse preview while dragging manipulators
+    lod_support = True
 
     parts = CollectionProperty(type=archipack_fence_part)
     user_path_reverse = BoolProperty(
@@ -1441,10 +1443,13 @@ class archipack_fence(ArchipackObject, ArchipackUserDefinedPath, Manipulable, Di
 
         g = self.get_generator()
 
+        # coarse preview: no subs, no user defined parts, square profiles
+        preview = self.lod_preview(o)
+
         # depth at bottom
         # self.manipulators[1].set_pts([(0, 0, 0), (0, 0, self.height), (1, 0, 0)])
 
-        if self.user_defined_post_enable:
+        if self.user_defined_post_enable and not preview:
             # user defined posts
             user_def_post = context.scene.objects.get(self.user_defined_post)
             if user_def_post is not None and user_def_post.type == 'MESH':
@@ -1464,7 +1469,7 @@ class archipack_fence(ArchipackObject, ArchipackUserDefinedPath, Manipulable, Di
             if user_def_subs is not None and user_def_subs.type == 'MESH':
                 g.setup_user_defined_post(user_def_subs, self.subs_x, self.subs_y, self.subs_z, self.subs_rotation)
 
-        if self.subs:
+        if self.subs and not preview:
             g.make_subs(0.5 * self.subs_x, 0.5 * self.subs_y, self.subs_z,
                     self.post_y, self.subs_alt, self.subs_spacing,
                     self.x_offset, self.subs_offset_x, int(self.idmat_subs), verts, faces, matids, uvs)
@@ -1482,13 +1487,14 @@ class archipack_fence(ArchipackObject, ArchipackUserDefinedPath, Manipulable, Di
                 x = 0.5 * rd.x
                 y = rd.z
                 closed = True
+                profil = 'SQUARE' if preview else rd.profil
 
-                if rd.profil == 'SQUARE':
+                if profil == 'SQUARE':
                     rail = [Vector((-x, y)), Vector((-x, 0)), Vector((x, 0)), Vector((x, y))]
-                elif rd.profil == 'ROUND':
+                elif profil == 'ROUND':
                     rail = [Vector((x * sin(0.1 * -a * pi), x * (0.5 + cos(0.1 * -a * pi)))) for a in range(0, 20)]
 
-                elif rd.profil == 'SAFETY':
+                elif profil == 'SAFETY':
                     closed = False
                     rail = [Vector((i * x, j * y)) for i, j in [(0, -0.5),
                         (1, -0.35714),
@@ -1498,7 +1504,7 @@ class archipack_fence(ArchipackObject, ArchipackUserDefinedPath, Manipulable, Di
                         (1, 0.21429),
                         (1, 0.35714),
                         (0, 0.5)]]
-                elif rd.profil == 'USER':
+                elif profil == 'USER':
                     curve = rd.update_profile(context)
                     if curve and curve.type == 'CURVE':
                         sx, sy = 1, 1
@@ -1530,7 +1536,9 @@ class archipack_fence(ArchipackObject, ArchipackUserDefinedPath, Manipulable, Di
 
         if self.handrail:
 
-            if self.handrail_profil == 'COMPLEX':
+            handrail_profil = 'SQUARE' if preview else self.handrail_profil
+
+            if handrail_profil == 'COMPLEX':
                 sx = self.handrail_x
                 sy = self.handrail_y
                 handrail = [Vector((sx * x, sy * y)) for x, y in [
@@ -1541,19 +1549,19 @@ class archipack_fence(ArchipackObject, ArchipackUserDefinedPath, Manipulable, Di
                 (0.49, 1.51), (0.46, 1.605), (0.415, 1.695), (0.355, 1.77), (0.28, 1.83), (0.19, 1.875),
                 (0.1, 1.905), (0.0, 1.915), (-0.095, 1.905), (-0.19, 1.875)]]
 
-            elif self.handrail_profil == 'SQUARE':
+            elif handrail_profil == 'SQUARE':
                 x = 0.5 * self.handrail_x
                 y = self.handrail_y
                 handrail = [Vector((-x, y)), Vector((-x, 0)), Vector((x, 0)), Vector((x, y))]
 
-            elif self.handrail_profil == 'CIRCLE':
+            elif handrail_profil == 'CIRCLE':
                 r = self.handrail_radius
                 handrail = [Vector((r * sin(0.1 * -a * pi), r * (0.5 + cos(0.1 * -a * pi)))) for a in range(0, 20)]
 
             g.make_profile(handrail, int(self.idmat_handrail), self.x_offset - self.handrail_offset,
                 self.handrail_alt, self.handrail_extend, True, verts, faces, matids, uvs)
 
-        bmed.buildmesh(context, o, verts, faces, matids=matids, uvs=uvs, weld=True, clean=False)
+        bmed.buildmesh(context, o, verts, faces, matids=matids, uvs=uvs, weld=not preview, clean=False)
 
         self.update_dimensions(context, o)
 
@@ -0,0 +1,266 @@
+# -*- coding:utf-8 -*-
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110- 1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+# ----------------------------------------------------------
+# Author: Stephen Leger (s-leger)
+#
+# ----------------------------------------------------------
+"""
+    Tiles instancing
+
+    Inside tiles of floors and roofs sharing the same shape,
+    material and uvs are replaced by a prototype mesh
+    and a dupli verts carrier, one vertex per tile.
+    Carriers are childs of the tiled object, the prototype
+    is the child of its carrier.
+    Boundary tiles remain real geometry.
+"""
+# noinspection PyUnresolvedReferences
+import bpy
+# noinspection PyUnresolvedReferences
+from bpy.types import Operator
+import bmesh
+import numpy as np
+from mathutils import Vector
+from .bmesh_utils import BmeshEdit as bmed
+from .archipack_object import ArchipackObjectsManager
+
+
+# datablocks supporting instancing and their toggle property
+INSTANCING_PROPS = (
+    ('archipack_floor', 'instancing'),
+    ('archipack_roof', 'tile_instancing')
+    )
+
+
+def split_instances(arrays, groups=None, min_users=2, max_prototypes=16, precision=1e-4):
+    """
+        Split tiles into instances and real geometry
+        Tiles with the same shape relative to their first vertex,
+        material indexes and uvs share a prototype
+        arrays: faces arrays as returned by BmeshEdit.as_arrays
+        groups: optional sorted group index of faces,
+            faces of a group (eg: a roof tile) are instanced together
+        min_users: tiles of less used prototypes remain real geometry
+        max_prototypes: only keep most used prototypes
+        return list of (prototype arrays, origins), arrays of real faces
+    """
+    coords, loop_start, loop_total, loop_verts, matids, uvs = arrays
+    n_faces = len(loop_start)
+    if n_faces < 1:
+        return [], arrays
+
+    if groups is None:
+        groups = np.arange(n_faces)
+
+    first = np.ones(n_faces, dtype=np.bool_)
+    first[1:] = groups[1:] != groups[:-1]
+    starts = np.flatnonzero(first)
+    # tile index of faces
+    tile = np.cumsum(first) - 1
+    tile_faces = np.diff(np.append(starts, n_faces))
+    # faces of a tile use consecutive loops
+    tile_start = loop_start[starts]
+    tile_total = np.add.reduceat(loop_total, starts)
+    origins = coords[loop_verts[tile_start]]
+
+    candidates = []
+    # tiles with same faces and loops count
+    topology = tile_faces.astype(np.int64) << 32 | tile_total
+    for key in np.unique(topology):
+        ids = np.flatnonzero(topology == key)
+        n_tiles = len(ids)
+        loops = tile_start[ids][:, None] + np.arange(tile_total[ids[0]])
+        faces = starts[ids][:, None] + np.arange(tile_faces[ids[0]])
+        rel = coords[loop_verts[loops]] - origins[ids][:, None, :]
+        cols = [
+            np.round(rel.reshape(n_tiles, -1) / precision),
+            loop_total[faces]
+            ]
+        if matids is not None:
+            cols.append(matids[faces])
+        if uvs is not None:
+            cols.append(np.round(uvs[loops].reshape(n_tiles, -1) / precision))
+        rows = np.hstack(cols).astype(np.int64)
+        # hash rows, way faster than unique over axis
+        weights = np.random.RandomState(0).randint(1, 1 << 62, size=rows.shape[1], dtype=np.int64)
+        with np.errstate(over='ignore'):
+            keys = rows.dot(weights)
+        keys, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        order = np.argsort(inverse.ravel(), kind='stable')
+        for bucket in np.split(order, np.cumsum(counts)[:-1]):
+            # hash collisions, split bucket by exact rows
+            if (rows[bucket] == rows[bucket[0]]).all():
+                groups = [bucket]
+            else:
+                exact = np.unique(rows[bucket], axis=0, return_inverse=True)[1].ravel()
+                groups = [bucket[exact == i] for i in range(exact.max() + 1)]
+            candidates.extend(
+                (len(tiles), ids[tiles[0]], ids[tiles])
+                for tiles in groups
+                if len(tiles) >= min_users)
+
+    candidates.sort(key=lambda c: c[0], reverse=True)
+
+    instanced = np.zeros(len(starts), dtype=np.bool_)
+    instances = []
+    for count, ref, tiles in candidates[:max_prototypes]:
+        proto = bmed.select_faces(*arrays, tile == ref)
+        proto = (proto[0] - origins[ref], ) + proto[1:]
+        instances.append((proto, origins[tiles]))
+        instanced[tiles] = True
+
+    if not instanced.any():
+        return [], arrays
+
+    return instances, bmed.select_faces(*arrays, ~instanced[tile])
+
+
+def finish_instances(context, o, instances, finish):
+    """
+        Apply geometry operations to prototypes
+        finish: callable(bm, origin) modifying prototype bmesh in place
+        return instances with prototypes as arrays
+    """
+    res = []
+    for proto, origins in instances:
+        bm = bmed.buildmesh_bulk(
+            context, o, *proto,
+            weld=False, clean=False, auto_smooth=True, temporary=True)
+        finish(bm, origins[0])
+        res.append((bmed.bm_to_arrays(bm), origins))
+        bm.free()
+    return res
+
+
+def instances_carriers(o):
+    return [c for c in o.children if 'archipack_instances' in c]
+
+
+def _link_child(context, name, parent, me):
+    c = bpy.data.objects.new(name, me)
+    context.scene.objects.link(c)
+    c.parent = parent
+    c.hide_select = True
+    return c
+
+
+def _fill_carrier(me, origins):
+    bm = bmesh.new()
+    bm.to_mesh(me)
+    bm.free()
+    co = np.asarray(origins, dtype=np.float32)
+    me.vertices.add(len(co))
+    me.vertices.foreach_set("co", np.ravel(co - co[0]))
+    me.update()
+
+
+def _fill_prototype(context, p, proto, materials):
+    me = p.data
+    bm = bmed.buildmesh_bulk(
+        context, p, *proto,
+        weld=False, clean=False, auto_smooth=True, temporary=True)
+    bm.to_mesh(me)
+    bm.free()
+    me.use_auto_smooth = True
+    for i, mat in enumerate(materials):
+        if i < len(me.materials):
+            if me.materials[i] != mat:
+                me.materials[i] = mat
+        else:
+            me.materials.append(mat)
+
+
+def build_instances(context, o, instances):
+    """
+        Create, update or remove instances carriers of o
+        carriers dupli their prototype on each vertex,
+        the prototype lies on the first instance
+        instances: list of (prototype arrays, origins)
+            as returned by split_instances, in o local space
+    """
+    carriers = instances_carriers(o)
+    materials = o.data.materials[:]
+    for i, (proto, origins) in enumerate(instances):
+
+        if i < len(carriers):
+            c = carriers[i]
+        else:
+            c = _link_child(context, o.name + "-instances", o, bpy.data.meshes.new("Instances"))
+            c['archipack_instances'] = True
+            c.dupli_type = 'VERTS'
+
+        _fill_carrier(c.data, origins)
+
+        if len(c.children) > 0:
+            p = c.children[0]
+        else:
+            p = _link_child(context, o.name + "-tile", c, bpy.data.meshes.new("Tile"))
+
+        p.location = Vector(origins[0])
+        _fill_prototype(context, p, proto, materials)
+
+    manager = ArchipackObjectsManager()
+    for c in carriers[len(instances):]:
+        manager.delete_object(context, c)
+
+
+def remove_instances(context, o):
+    """
+        Remove instances carriers and prototypes of o
+    """
+    build_instances(context, o, [])
+
+
+class ARCHIPACK_OT_realize_instances(Operator):
+    bl_idname = "archipack.realize_instances"
+    bl_label = "Realize"
+    bl_description = "Turn instanced tiles of selected floors and roofs into real geometry, for final export"
+    bl_category = 'Archipack'
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None
+
+    def execute(self, context):
+        if context.mode != "OBJECT":
+            self.report({'WARNING'}, "Archipack: Option only valid in Object mode")
+            return {'CANCELLED'}
+        for o in context.selected_objects[:]:
+            if o.data is None:
+                continue
+            for name, prop in INSTANCING_PROPS:
+                if name in o.data:
+                    d = getattr(o.data, name)[0]
+                    if getattr(d, prop):
+                        # disabling instancing rebuild tiles as real geometry
+                        setattr(d, prop, False)
+        return {'FINISHED'}
+
+
+def register():
+    bpy.utils.register_class(ARCHIPACK_OT_realize_instances)
+
+
+def unregister():
+    bpy.utils.unregister_class(ARCHIPACK_OT_realize_instances)
@@ -318,11 +318,6 @@ class ARCHIPACK_OP_ExportSvg(Operator, ExportHelper):
 
         layout = context.active_object
         d = layout.data.archipack_layout[0]
-        curves = [o for o in scene.objects if o.type in {'CURVE', 'FONT'}]
-
-        if len(curves) < 1:
-            self.report({'ERROR'}, "Nothing to export, 0 curve(s) selected")
-            return {'CANCELLED'}
 
         # use manager to find curves in bounding box
         manager = ArchipackBoolManager()
@@ -333,19 +328,24 @@ class ARCHIPACK_OP_ExportSvg(Operator, ExportHelper):
         manager.maxz = 1e32
         manager.center.z = 0
 
+        curves = manager.objects_in_bounds(scene, {'CURVE', 'FONT'})
+
+        if len(curves) < 1:
+            self.report({'ERROR'}, "Nothing to export, 0 curve(s) selected")
+            return {'CANCELLED'}
+
         # retrieve archipack's entity
         # dimension are childs of wall
+        meshes = manager.objects_in_bounds(scene)
         walls = [
-            o for o in scene.objects
+            o for o in meshes
             if o.data and
-            "archipack_wall2" in o.data and
-            manager._contains(o)
+            "archipack_wall2" in o.data
             ]
         stairs = [
-            o for o in scene.objects
+            o for o in meshes
             if o.data and
-            "archipack_stair" in o.data and
-            manager._contains(o)
+            "archipack_stair" in o.data
             ]
 
         # document size according layout (mm)
@@ -367,7 +367,7 @@ class ARCHIPACK_OP_ExportSvg(Operator, ExportHelper):
             ])).inverted()
 
         # filter curves found in layout
-        curves = {o.name: o for o in curves if manager._contains(o) and o.name != layout.name}
+        curves = {o.name: o for o in curves if o.name != layout.name}
         
         # remove dimension
         parents = {}
@@ -1204,6 +1204,9 @@ class archipack_kitchen_module(ArchipackObject, PropertyGroup):
         cab_location = cab.location
         th = kitchen.thickness
 
+        # coarse preview: no handles nor drawer
+        preview = kitchen.lod_preview(o.parent)
+
         if 10 < module_type < 20:
             # module with glass
             style = 20 + style % 10
@@ -1275,7 +1278,7 @@ class archipack_kitchen_module(ArchipackObject, PropertyGroup):
             # -------------
             # Drawer
             # -------------
-            if module_type == 1:
+            if module_type == 1 and not preview:
                 # drawer
                 sy = kitchen.y + cab.dy - th
                 if cab_location == 2:
@@ -1302,7 +1305,7 @@ class archipack_kitchen_module(ArchipackObject, PropertyGroup):
             # -------------
             # Handles
             # -------------
-            if module_type != 6 and module_type < 50 and module.handle:
+            if module_type != 6 and module_type < 50 and module.handle and not preview:
 
                 # offset from borders
                 x, y, z = kitchen.handle_x, kitchen.handle_y, kitchen.handle_z
@@ -1936,6 +1939,8 @@ class archipack_kitchen_cabinet(ArchipackObject, PropertyGroup):
 
 
 class archipack_kitchen(ArchipackObject, Manipulable, DimensionProvider, PropertyGroup):
+    # coarse preview while dragging manipulators
+    lod_support = True
 
     door_style = EnumProperty(
             name='Doors',
@@ -3861,12 +3866,14 @@ class archipack_kitchen(ArchipackObject, Manipulable, DimensionProvider, Propert
             self.update_baseboard(verts, faces, matids, uvs)
 
         bmed.buildmesh(context, o, verts, faces, matids)
-        # unwrap mesh
-        bpy.ops.object.mode_set(mode='EDIT')
-        bpy.ops.mesh.select_all(action='SELECT')
-        bpy.ops.uv.cube_project()
-        bpy.ops.mesh.select_all(action='DESELECT')
-        bpy.ops.object.mode_set(mode='OBJECT')
+
+        # unwrap mesh, skip on coarse preview
+        if not self.lod_preview(o):
+            bpy.ops.object.mode_set(mode='EDIT')
+            bpy.ops.mesh.select_all(action='SELECT')
+            bpy.ops.uv.cube_project()
+            bpy.ops.mesh.select_all(action='DESELECT')
+            bpy.ops.object.mode_set(mode='OBJECT')
         #
         self.update_modules(context, o)
 
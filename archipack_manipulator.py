@@ -37,6 +37,7 @@ from bpy.props import FloatVectorProperty, StringProperty, CollectionProperty, B
 from bpy.app.handlers import persistent
 from .archipack_snap import snap_point
 from .archipack_keymaps import Keymaps
+from .archipack_object import lod_preview, lod_prefs, lod_weight
 from .archipack_gl import (
     GlLine, GlArc, GlText,
     GlPolyline, GlPolygon,
@@ -2477,6 +2478,9 @@ class Manipulable():
             )
     keymap = None
 
+    # build coarse geometry while dragging, see ArchipackObject.lod_preview
+    lod_support = False
+
     # selectable manipulators
     manipulable_area = GlCursorArea()
     manipulable_start_point = Vector((0, 0))
@@ -2596,6 +2600,7 @@ class Manipulable():
             self.manipulate_mode = True
             
         if context.area is None:
+            self.manipulable_lod_cancel(context)
             self.manipulable_disable(context)
             return {'FINISHED'}
 
@@ -2605,11 +2610,13 @@ class Manipulable():
             self.keymap = Keymaps(context)
         
         if context.mode != 'OBJECT':
+            self.manipulable_lod_cancel(context)
             self.manipulable_disable(context)
             return {'FINISHED'}
 
         if self.keymap.check(event, self.keymap.undo):
             # user feedback on undo by disabling manipulators
+            self.manipulable_lod_cancel(context)
             self.manipulable_disable(context)
             # pass through so system is able to undo
             return {'FINISHED', 'PASS_THROUGH'}
@@ -2626,6 +2633,7 @@ class Manipulable():
             # May also be implemented into nearly hidden "reference point"
             # to delete / duplicate / link duplicate / unlink of
             # a complete set of wall, doors and windows at once
+            self.manipulable_lod_cancel(context)
             self.manipulable_disable(context)
 
             if bpy.ops.object.delete.poll():
@@ -2652,6 +2660,13 @@ class Manipulable():
 
             if manipulator is not None:
                 if manipulator.modal(context, event):
+                    if event.value == 'PRESS':
+                        if event.type == 'LEFTMOUSE':
+                            # drag start
+                            self.manipulable_lod_start(context)
+                        elif event.type in {'ESC', 'RIGHTMOUSE'}:
+                            # drag cancel
+                            self.manipulable_lod_end(context)
                     self.manipulable_manipulate(context, event, manipulator)
                     return {'RUNNING_MODAL'}
 
@@ -2696,6 +2711,7 @@ class Manipulable():
                     for manipulator in self.manip_stack:
                         if manipulator is not None and manipulator.selectable:
                             manipulator.selected = False
+                    self.manipulable_lod_end(context)
                     self.manipulable_release(context)
 
         elif self.select_mode and event.type == 'MOUSEMOVE' and event.value == 'PRESS':
@@ -2720,6 +2736,7 @@ class Manipulable():
 
         # event.alt here to prevent 3 button mouse emulation exit while zooming
         if event.type in {'RIGHTMOUSE', 'ESC'} and event.value == 'PRESS' and not event.alt:
+            self.manipulable_lod_end(context)
             self.manipulable_disable(context)
             self.manipulable_exit(context)
 
@@ -2728,6 +2745,35 @@ class Manipulable():
 
         return {'PASS_THROUGH'}
 
+    # Level of detail
+    def manipulable_lod_start(self, context):
+        """
+            Build coarse geometry of heavy objects while dragging
+        """
+        o = context.active_object
+        if not self.lod_support or o is None:
+            return
+        prefs = lod_prefs(context)
+        if prefs.lod_enable and lod_weight(o) >= prefs.lod_threshold:
+            lod_preview.add(o.name)
+
+    def manipulable_lod_end(self, context):
+        """
+            Leave preview and rebuild full detail geometry
+        """
+        o = context.active_object
+        if o is not None and o.name in lod_preview:
+            lod_preview.discard(o.name)
+            self.update(context)
+
+    def manipulable_lod_cancel(self, context):
+        """
+            Leave preview without rebuild
+        """
+        o = context.active_object
+        if o is not None:
+            lod_preview.discard(o.name)
+
     # Callbacks
     def manipulable_release(self, context):
         """
@@ -2752,6 +2798,7 @@ class Manipulable():
 @persistent
 def cleanup(dummy=None):
     empty_stack()
+    lod_preview.clear()
 
 
 def register():
@@ -26,17 +26,132 @@
 # ----------------------------------------------------------
 # noinspection PyUnresolvedReferences
 import bpy
-# noinspection PyUnresolvedReferences
 from bpy.props import BoolProperty, StringProperty
+from bpy.app.handlers import persistent
 from mathutils import Vector, Matrix
 from mathutils.geometry import (
     intersect_line_plane
     )
 from bpy_extras import view3d_utils
+from .archipack_scheduler import update_scheduler, ORDER_OPENING
 import logging
 logger = logging.getLogger("archipack")
 
 
+class ArchipackLinkedIndex():
+    """
+      Map datablocks to objects using them, so linked copies
+      are found without selection operators
+      Rebuild on demand, when an entry is stale or
+      does not match datablock users count
+    """
+    def __init__(self):
+        self.instances = {}
+
+    def rebuild(self):
+        self.instances.clear()
+        for o in bpy.data.objects:
+            if o.data is not None:
+                key = (o.type, o.data.name)
+                if key in self.instances:
+                    self.instances[key].append(o.name)
+                else:
+                    self.instances[key] = [o.name]
+
+    def _resolve(self, key, d, check_users):
+        names = self.instances.get(key)
+        if names is None:
+            return None
+        objs = []
+        for name in names:
+            o = bpy.data.objects.get(name)
+            if o is None or o.data != d:
+                return None
+            objs.append(o)
+        if check_users and len(objs) != d.users - int(d.use_fake_user):
+            return None
+        return objs
+
+    def linked(self, context, o):
+        """
+          Return objects of current scene using o datablock, o excluded
+        """
+        d = o.data
+        if d is None:
+            return []
+        key = (o.type, d.name)
+        objs = self._resolve(key, d, True)
+        if objs is None:
+            self.rebuild()
+            # users may not only be objects, trust the rebuild
+            objs = self._resolve(key, d, False)
+            if objs is None:
+                return []
+        scene = context.scene
+        return [c for c in objs if c != o and scene.objects.get(c.name) is not None]
+
+    def clear(self):
+        self.instances.clear()
+
+
+linked_index = ArchipackLinkedIndex()
+
+
+class ArchipackUpdateVersions():
+    """
+      Count updates by object name, so caches depending on
+      archipack objects state compare a number
+      instead of all properties
+    """
+    def __init__(self):
+        self.versions = {}
+
+    def bump(self, name):
+        self.versions[name] = self.versions.get(name, 0) + 1
+
+    def get(self, name):
+        return self.versions.get(name, 0)
+
+
+update_versions = ArchipackUpdateVersions()
+
+
+# Level of detail
+# names of objects building coarse preview geometry
+lod_preview = set()
+
+
+class DefaultLodPrefs:
+    """
+        Level of detail and linked copies settings
+        default to this when not found in addon prefs
+    """
+    lod_enable = True
+    lod_threshold = 20000
+    # delay in seconds before propagation to linked copies, 0 synch immediately
+    synch_delay = 0
+
+
+def lod_prefs(context):
+    try:
+        addon_name = __name__.split('.')[0]
+        prefs = context.user_preferences.addons[addon_name].preferences
+    except:
+        prefs = DefaultLodPrefs
+    return prefs
+
+
+def lod_weight(o):
+    """
+        Vertex count of object and its direct childs
+    """
+    n_verts = 0
+    for c in [o] + list(o.children):
+        if c.type == 'MESH':
+            n_verts += len(c.data.vertices)
+    return n_verts
+
+
 class ArchipackObjectsManager():
     """
       Provide objects and datablock utility
@@ -129,6 +244,47 @@ class ArchipackObjectsManager():
         if src is not None:
             self._link_child(src, o)
 
+    def linked_objects(self, context, o):
+        """
+          Return objects of current scene sharing o datablock
+          @o: object source, excluded from result
+        """
+        return linked_index.linked(context, o)
+
+    def diff_childs(self, context, childs, l_childs, create):
+        """
+         Match childs of a linked copy with source ones by datablock
+         - remove linked childs not found on source
+         - create missing ones using create(child)
+         @childs: source childs
+         @l_childs: linked copy childs
+         return list of (child, linked child)
+        """
+        available = {}
+        for c in l_childs:
+            key = c.data.name
+            if key in available:
+                available[key].append(c)
+            else:
+                available[key] = [c]
+
+        found = []
+        for child in childs:
+            l_child = available.get(child.data.name)
+            if l_child:
+                found.append(l_child.pop())
+            else:
+                found.append(None)
+
+        for l_child in available.values():
+            for c in l_child:
+                self.delete_object(context, c)
+
+        return [
+            (child, create(child) if c is None else c)
+            for child, c in zip(childs, found)
+            ]
+
 
 class ArchipackObject(ArchipackObjectsManager):
     """
@@ -190,6 +346,13 @@ class ArchipackObject(ArchipackObjectsManager):
                 pass
         return d
 
+    def lod_preview(self, o):
+        """
+            True while a manipulator drag this heavy object,
+            generators should build coarse geometry
+        """
+        return o is not None and o.name in lod_preview
+
     def find_in_selection(self, context, auto_update=True):
         """
             find witch selected object this datablock instance belongs to
@@ -229,6 +392,29 @@ class ArchipackObject(ArchipackObjectsManager):
         self.previously_selected = None
         self.previously_active = None
 
+    def synch_linked(self, context, o):
+        """
+         Propagate changes to linked copies through synch_childs
+         When synch_delay pref > 0, defer using update scheduler,
+         coalescing further calls for the same datablock
+        """
+        synch_delay = getattr(lod_prefs(context), "synch_delay", 0)
+        if synch_delay > 0:
+            cls = self.__class__
+
+            def synch(context, o):
+                d = cls.datablock(o)
+                if d is not None:
+                    d.synch_childs(context, o)
+
+            update_scheduler.schedule(
+                context, o, 'synch_linked', synch,
+                order=ORDER_OPENING,
+                delay=synch_delay,
+                key=(o.type, o.data.name, 'synch_linked'))
+        else:
+            self.synch_childs(context, o)
+
 
 class ArchipackCreateTool(ArchipackObjectsManager):
     """
@@ -408,3 +594,17 @@ class ArchipackDrawTool(ArchipackObjectsManager):
                         [0, 0, 0, 1]
                         ]), o, width, y, 0
         return False, Matrix(), None, 0, Vector(), 0
+
+
+@persistent
+def archipack_linked_index_clear(dummy):
+    linked_index.clear()
+
+
+def register():
+    bpy.app.handlers.load_post.append(archipack_linked_index_clear)
+
+
+def unregister():
+    bpy.app.handlers.load_post.remove(archipack_linked_index_clear)
+    archipack_linked_index_clear(None)
@@ -43,7 +43,8 @@ from bpy.props import (
     )
 from bpy.app.handlers import persistent
 from .bitarray import BitArray
-from .pyqtree import _QuadTree
+from .spatialindex import new_index, SweepOverlaps, QUADTREE, GRID
+from .polygonize_batch import polygonize_batch
 from .materialutils import MaterialUtils
 from .archipack_gl import (
     FeedbackPanel,
@@ -75,6 +76,9 @@ EPSILON = 1.0e-4
 # Qtree params
 MAX_ITEMS = 10
 MAX_DEPTH = 20
+# Polygonizer.split engines
+QTREE = 'QTREE'
+SWEEP = 'SWEEP'
 
 # module globals vars dict
 vars_dict = {
@@ -1310,7 +1314,7 @@ class Io():
         return CoordSys(curves)
 
     @staticmethod
-    def curves_to_geomcollection(curves, resolution: int=12, coordsys=None, homogeneous=True):
+    def curves_to_geomcollection(curves, resolution: int=12, coordsys=None, homogeneous=True, point_index=GRID):
         """
          * Create lineStrings from curves
          * ensure points uniqueness using a Tree
@@ -1323,7 +1327,7 @@ class Io():
         if coordsys is None:
             coordsys = CoordSys(curves)
 
-        Q_points = Qtree(coordsys)
+        Q_points = Qtree(coordsys, backend=point_index)
         io = Io(Q_points=Q_points, coordsys=coordsys)
 
         geoms = []
@@ -1351,7 +1355,7 @@ class Io():
         return geom
 
     @staticmethod
-    def curves_to_geoms(curves, resolution: int=12, geoms: list=[], coordsys=None):
+    def curves_to_geoms(curves, resolution: int=12, geoms: list=[], coordsys=None, point_index=GRID):
         """
          * Create lineStrings from curves
          * ensure points uniqueness using a Tree
@@ -1363,13 +1367,38 @@ class Io():
         if coordsys is None:
             coordsys = CoordSys(curves)
 
-        Q_points = Qtree(coordsys)
+        Q_points = Qtree(coordsys, backend=point_index)
         io = Io(Q_points=Q_points, coordsys=coordsys)
         for curve in curves:
             io._curve_as_geom(gf, curve, resolution, geoms)
         logger.debug("Io.curves_to_geoms() :%.2f seconds", time.time() - t)
         return coordsys
 
+    @staticmethod
+    def curves_to_coords(curves, resolution: int=12, coordsys=None):
+        """
+         * Serialize curves as arrays of (x, y, z) in coordsys
+         * closed splines repeat their first point
+         * see polygonize_batch
+        """
+        t = time.time()
+        curves = Io.ensure_iterable(curves)
+        if coordsys is None:
+            coordsys = CoordSys(curves)
+
+        io = Io(coordsys=coordsys)
+        lines = []
+        for curve in curves:
+            wM = coordsys.invert * curve.matrix_world
+            for spline in curve.data.splines:
+                pts = [(co.x, co.y, co.z) for co in io._coords_from_spline(wM, spline, resolution)]
+                if spline.use_cyclic_u and len(pts) > 0:
+                    pts.append(pts[0])
+                if len(pts) > 1:
+                    lines.append(pts)
+        logger.debug("Io.curves_to_coords() :%.2f seconds", time.time() - t)
+        return coordsys, lines
+
     def coords_to_linestring(self, tM, lines_coords, force_2d=False):
         """
          * Create linestrings from arrays of coords
@@ -1938,13 +1967,16 @@ class ShapelyOps():
             return a.symmetric_difference(b)
 
 
-class Qtree(_QuadTree):
+class Qtree():
     """
         The top spatial index to be created by the user. Once created it can be
         populated with geographically placed members that can later be tested for
         intersection with a user inputted geographic bounding box.
+        backend: QUADTREE, STRTREE (packed R-tree) or GRID (grid hash)
+        see spatialindex module
     """
-    def __init__(self, coordsys, extend=EPSILON, max_items=MAX_ITEMS, max_depth=MAX_DEPTH):
+    def __init__(self, coordsys, extend=EPSILON, max_items=MAX_ITEMS, max_depth=MAX_DEPTH,
+            backend=QUADTREE, cell_size=None):
         """
             objs may be blender objects or shapely geoms
             extend: how much seek arround
@@ -1955,7 +1987,9 @@ class Qtree(_QuadTree):
         # store input coordsys
         self.coordsys = coordsys
 
-        _QuadTree.__init__(self, 0, 0, coordsys.width, coordsys.height, max_items, max_depth)
+        self._index = new_index(backend, coordsys.width, coordsys.height, max_items, max_depth, cell_size)
+        self._insert = self._index._insert
+        self._intersect = self._index._intersect
 
         self._factory = GeometryFactory()
 
@@ -1979,8 +2013,8 @@ class Qtree(_QuadTree):
 
     def newPoint(self, co):
         found = self._intersect((co.x - EPSILON, co.y - EPSILON, co.x + EPSILON, co.y + EPSILON))
-        for id in found:
-            return self._geoms[id]
+        if len(found) > 0:
+            return self._geoms[min(found)]
         point = Point(Coordinate(co.x, co.y, co.z), self._factory)
         self.insert(self.ngeoms, point)
         return point
@@ -2050,12 +2084,41 @@ class Polygonizer():
         else:
             return seg.c0
 
-    def test_split(self, Q_points, Q_segs, extend=0.01, extend_seg=0.01, collinear=True):
+    def _candidates(self, Q_segs, extends, engine=QTREE):
+        """
+            Yield segment index and candidate segments ids
+            extends: per segment seek box extend
+            QTREE: query Q_segs for each segment, ids are sorted
+            SWEEP: x sweep line over all segments boxes, only
+            ids above segment index are returned, sorted.
+            Both engines give the same pairs as Qtree query of lower index
+            segment box against Qtree stored higher index segment box
+        """
+        segs = Q_segs._geoms
+        if engine == SWEEP:
+            query = [Q_segs.getbounds(seg, extend=ext) for seg, ext in zip(segs, extends)]
+            stored = [Q_segs.getbounds(seg) for seg in segs]
+            boxes = [Q_segs.getbounds(seg, extend=max(ext, EPSILON)) for seg, ext in zip(segs, extends)]
+            candidates = [[] for seg in segs]
+            for s, id in SweepOverlaps(boxes).pairs():
+                q, b = query[s], stored[id]
+                if b[2] >= q[0] and b[0] <= q[2] and b[3] >= q[1] and b[1] <= q[3]:
+                    candidates[s].append(id)
+            for s, idx in enumerate(candidates):
+                if len(idx) > 0:
+                    yield s, sorted(idx)
+        else:
+            for s, seg in enumerate(segs):
+                count, idx = Q_segs.intersects_ext(seg, extends[s])
+                yield s, idx
+
+    def test_split(self, Q_points, Q_segs, extend=0.01, extend_seg=0.01, collinear=True, engine=QTREE):
         """ _split
             detect intersections between segments and create segments according
             is able to project segment ends on closest segment
             use point_tree and seg_tree
             assume merged segments on beforehand
+            engine: QTREE or SWEEP candidates search
         """
         t = time.time()
 
@@ -2071,15 +2134,13 @@ class Polygonizer():
             seg.c0.add_user()
             seg.c1.add_user()
 
-        for s, seg in enumerate(segs):
+        # enlarge seek box for "extendable" segments
+        extends = [extend if seg.c0.users < 2 or seg.c1.users < 2 else extend_seg for seg in segs]
 
-            # enlarge seek box for "extendable" segments
-            if seg.c0.users < 2 or seg.c1.users < 2:
-                _extend = extend
-            else:
-                _extend = extend_seg
+        for s, idx in self._candidates(Q_segs, extends, engine):
 
-            count, idx = Q_segs.intersects_ext(seg, _extend)
+            seg = segs[s]
+            _extend = extends[s]
 
             for id in idx:
 
@@ -2183,12 +2244,13 @@ class Polygonizer():
 
         logger.debug("Polygonizer.split() slice :%.4f seconds", (time.time() - t))
 
-    def split(self, Q_points, Q_segs, extend=0.01, all_segs=False):
+    def split(self, Q_points, Q_segs, extend=0.01, all_segs=False, engine=QTREE):
         """ _split
             detect intersections between segments and create segments according
             is able to project segment ends on closest segment
             use point_tree and seg_tree
             assume merged segments on beforehand
+            engine: QTREE or SWEEP candidates search
         """
         t = time.time()
 
@@ -2212,13 +2274,12 @@ class Polygonizer():
                 seg.c0.add_user()
                 seg.c1.add_user()
 
-        for s, seg in enumerate(segs):
+        # enlarge seek box for "extendable" segments
+        extends = [extend if seg.c0.users < 2 or seg.c1.users < 2 else EPSILON for seg in segs]
 
-            # enlarge seek box for "extendable" segments
-            if seg.c0.users < 2 or seg.c1.users < 2:
-                count, idx = Q_segs.intersects_ext(seg, extend)
-            else:
-                count, idx = Q_segs.intersects(seg)
+        for s, idx in self._candidates(Q_segs, extends, engine):
+
+            seg = segs[s]
 
             for id in idx:
 
@@ -2561,10 +2622,14 @@ class Polygonizer():
         logger.debug("Polygonizer.split() slice :%.4f seconds", (time.time() - t))
 
     @staticmethod
-    def polygonize(context, curves, extend=0.0, all_segs=False, resolution=12):
+    def polygonize(context, curves, extend=0.0, all_segs=False, resolution=12,
+            seg_index=QUADTREE, point_index=GRID, engine=QTREE):
         """
             @extend: extend line ends to find intersections
             @extend_seg: extend line segments to find intersections
+            @seg_index: segments Qtree backend
+            @point_index: points Qtree backend
+            @engine: split intersections search QTREE or SWEEP
         """
         t = time.time()
         curves = Io.ensure_iterable(curves)
@@ -2577,12 +2642,12 @@ class Polygonizer():
 
         op = Polygonizer(coordsys)
         # Ensure uniqueness of points and segments
-        Q_segs = Qtree(coordsys)
-        Q_points = Qtree(coordsys)
+        Q_segs = Qtree(coordsys, backend=seg_index)
+        Q_points = Qtree(coordsys, backend=point_index)
 
         Io.add_curves(Q_points, Q_segs, coordsys, curves, resolution)
 
-        op.split(Q_points, Q_segs, extend=extend, all_segs=all_segs)
+        op.split(Q_points, Q_segs, extend=extend, all_segs=all_segs, engine=engine)
 
         lines = gf.buildGeometry([gf.createLineString([seg.c0.coord, seg.c1.coord])
             for seg in Q_segs._geoms
@@ -2602,6 +2667,28 @@ class Polygonizer():
 
         return coordsys, polys, dangles, cuts, invalids
 
+    @staticmethod
+    def polygonize_batch(context, curves, extend=0.0, all_segs=False, resolution=12, max_workers=0):
+        """
+            Polygonize by independent components
+            see polygonize_batch module
+            @max_workers: 0 to run in blender process, processes count or None
+                for cpu count to use a fork process pool when available
+            return coordsys, polygons, invalid polygons
+        """
+        t = time.time()
+        coordsys, lines = Io.curves_to_coords(curves, resolution)
+        polys, invalids = polygonize_batch(lines, extend=extend, all_segs=all_segs, max_workers=max_workers)
+        vars_dict['select_polygons'] = SelectPolygons(polys, coordsys)
+        # lines and points are not merged across components
+        vars_dict['select_lines'] = None
+        vars_dict['select_points'] = None
+        logger.debug("Polygonizer.polygonize_batch() :%.2f seconds polygons:%s invalids:%s",
+            time.time() - t,
+            len(polys),
+            len(invalids))
+        return coordsys, polys, invalids
+
 
 class ARCHIPACK_OP_PolyLib_Pick2DPoints(Operator):
     bl_idname = "archipack.polylib_pick_2d_points"
@@ -2732,6 +2819,12 @@ class ARCHIPACK_OP_PolyLib_Polygonize(Operator):
             description="(slower but may be safer) Extend only line ends when not enabled",
             default=False
             )
+    batch = BoolProperty(
+            name="By components",
+            description="Split independent groups of lines one by one, "
+                        "lines and points selection are not available",
+            default=False
+            )
     bezier_resolution = IntProperty(
             name="Bezier resolution", min=0, default=12
             )
@@ -2763,12 +2856,20 @@ class ARCHIPACK_OP_PolyLib_Polygonize(Operator):
             obj.select = False
 
         try:
-            coordsys, polys, dangles, cuts, invalids = Polygonizer.polygonize(
-                context,
-                objs,
-                extend=self.extend,
-                all_segs=self.all_segs,
-                resolution=self.bezier_resolution)
+            if self.batch:
+                coordsys, polys, invalids = Polygonizer.polygonize_batch(
+                    context,
+                    objs,
+                    extend=self.extend,
+                    all_segs=self.all_segs,
+                    resolution=self.bezier_resolution)
+            else:
+                coordsys, polys, dangles, cuts, invalids = Polygonizer.polygonize(
+                    context,
+                    objs,
+                    extend=self.extend,
+                    all_segs=self.all_segs,
+                    resolution=self.bezier_resolution)
 
         except TopologyException as ex:
             self.report({'WARNING'}, "Topology error {}".format(ex))
@@ -3211,6 +3312,12 @@ class archipack_polylib(PropertyGroup):
             description="(slower but may be safer) Extend only line ends when not enabled",
             default=False
             )
+    polygonize_batch = BoolProperty(
+            name="By components",
+            description="Split independent groups of lines one by one, "
+                        "lines and points selection are not available",
+            default=False
+            )
     polygonize_bezier_resolution = IntProperty(
             name="Bezier resolution", min=0, default=12
             )
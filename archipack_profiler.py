@@ -0,0 +1,102 @@
+# -*- coding:utf-8 -*-
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110- 1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+# ----------------------------------------------------------
+# Author: Stephen Leger (s-leger)
+#
+# ----------------------------------------------------------
+# noinspection PyUnresolvedReferences
+import bpy
+# noinspection PyUnresolvedReferences
+from bpy.types import Operator
+from bpy.props import EnumProperty, StringProperty
+from bpy_extras.io_utils import ExportHelper
+from .profiler import profiler
+
+
+def draw_profiler(layout, limit=8):
+    """
+        Profiler box for tools panel
+    """
+    box = layout.box()
+    box.label("Profiler")
+    row = box.row(align=True)
+    if profiler.enabled:
+        row.operator("archipack.profiler", text="Stop", icon='PAUSE').mode = 'DISABLE'
+    else:
+        row.operator("archipack.profiler", text="Start", icon='PLAY').mode = 'ENABLE'
+    row.operator("archipack.profiler", text="Reset", icon='X').mode = 'RESET'
+    row.operator("archipack.profiler_dump", text="", icon='EXPORT')
+    for stat in profiler.report(limit=limit):
+        col = box.column(align=True)
+        col.label("%s %s" % (stat['type'][10:], stat['name']))
+        col.label("  %s calls self:%.3fs cumul:%.3fs" % (stat['calls'], stat['self'], stat['cumulative']))
+
+
+class ARCHIPACK_OT_profiler(Operator):
+    bl_idname = "archipack.profiler"
+    bl_label = "Profiler"
+    bl_description = "Profile archipack updates, generators and geometry ops (Start / Stop / Reset)"
+    bl_options = {'REGISTER'}
+    mode = EnumProperty(
+        items=(
+            ('ENABLE', 'Start', 'Start profiling'),
+            ('DISABLE', 'Stop', 'Stop profiling and keep stats'),
+            ('RESET', 'Reset', 'Clear stats')
+            )
+        )
+
+    def execute(self, context):
+        if self.mode == 'ENABLE':
+            profiler.enable(__name__.split('.')[0])
+        elif self.mode == 'DISABLE':
+            profiler.disable()
+        else:
+            profiler.reset()
+        return {'FINISHED'}
+
+
+class ARCHIPACK_OT_profiler_dump(Operator, ExportHelper):
+    bl_idname = "archipack.profiler_dump"
+    bl_label = "Dump profiler stats"
+    bl_description = "Save profiler stats as json"
+    filename_ext = ".json"
+    filter_glob = StringProperty(
+            default="*.json",
+            options={'HIDDEN'},
+            )
+
+    def execute(self, context):
+        profiler.dump(self.filepath)
+        return {'FINISHED'}
+
+
+def register():
+    bpy.utils.register_class(ARCHIPACK_OT_profiler)
+    bpy.utils.register_class(ARCHIPACK_OT_profiler_dump)
+
+
+def unregister():
+    profiler.disable()
+    profiler.reset()
+    bpy.utils.unregister_class(ARCHIPACK_OT_profiler)
+    bpy.utils.unregister_class(ARCHIPACK_OT_profiler_dump)
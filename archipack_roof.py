@@ -26,7 +26,8 @@
 # ----------------------------------------------------------
 # noinspection PyUnresolvedReferences
 import bpy
-import time
+from collections import OrderedDict
+from operator import itemgetter
 # noinspection PyUnresolvedReferences
 from bpy.types import Operator, PropertyGroup, Mesh, Panel
 from bpy.props import (
@@ -35,8 +36,8 @@ from bpy.props import (
     CollectionProperty
     )
 from .bmesh_utils import BmeshEdit as bmed
-from random import randint
 import bmesh
+import numpy as np
 from mathutils import Vector, Matrix
 from math import sin, cos, pi, atan2, sqrt, tan
 from .archipack_manipulator import Manipulable, archipack_manipulator
@@ -49,7 +50,13 @@ from .archipack_cutter import (
     ArchipackCutterPart
     )
 from .archipack_polylines import Io, ShapelyOps
+from .pygeos.shared import sort_by_key
 from .archipack_dimension import DimensionProvider
+from .archipack_scheduler import update_scheduler, ORDER_ROOF
+from .archipack_instances import (
+    split_instances, finish_instances,
+    build_instances, remove_instances
+    )
 
 
 class Roof():
@@ -225,26 +232,13 @@ class RoofAxisNode():
                 self.center = i
                 return
 
-    # sort tree segments by angle
-    def partition(self, array, begin, end):
-        pivot = begin
-        for i in range(begin + 1, end + 1):
-            if array[i].a0 < array[begin].a0:
-                pivot += 1
-                array[i], array[pivot] = array[pivot], array[i]
-        array[pivot], array[begin] = array[begin], array[pivot]
-        return pivot
+    @staticmethod
+    def angle_key(s):
+        return s.a0
 
     def sort(self):
-        def _quicksort(array, begin, end):
-            if begin >= end:
-                return
-            pivot = self.partition(array, begin, end)
-            _quicksort(array, begin, pivot - 1)
-            _quicksort(array, pivot + 1, end)
-
-        end = len(self.segs) - 1
-        _quicksort(self.segs, 0, end)
+        # sort tree segments by angle
+        sort_by_key(self.segs, RoofAxisNode.angle_key)
 
         # index of root in segs array
         self.update_center()
@@ -796,6 +790,25 @@ class RoofPolygon(CutAblePolygon):
         self.vy = vy
         self.vz = vx.cross(vy)
 
+    def fingerprint(self, z):
+        """
+            Hashable state of pan geometry
+            used as components cache key
+        """
+        def segs_state(segs):
+            return tuple((s.type, tuple(s.p0), tuple(s.p1)) for s in segs)
+        other_slope = None
+        if self.other_side is not None:
+            other_slope = self.other_side.slope
+        return (
+            z, self.side, self.slope, other_slope,
+            self.tmin, self.tmax, self.xsize, self.ysize,
+            self.node_tri, self.next_tri,
+            tuple(self.fake_axis.p0), tuple(self.fake_axis.p1),
+            segs_state(self.segs),
+            tuple(segs_state(hole.segs) for hole in self.holes)
+            )
+
 
 """
 import bpy
@@ -847,6 +860,161 @@ for c in m.splines:
 """
 
 
+class RoofCache():
+    """
+        Bounded LRU cache of roof components geometry
+        Store arrays as returned by BmeshEdit.as_arrays, per pan and
+        per component, keyed by pan geometry fingerprint and the
+        archipack_roof properties the component depends on
+        max_verts: cache memory bound in vertices
+    """
+    def __init__(self, max_verts=2000000):
+        self.max_verts = max_verts
+        self.n_verts = 0
+        # key: (arrays, n_verts)
+        self._items = OrderedDict()
+
+    def get(self, key):
+        item = self._items.get(key)
+        if item is None:
+            return None
+        self._items.move_to_end(key)
+        return item[0]
+
+    def set(self, key, arrays, n_verts=None):
+        """
+            n_verts: size of cached value when not arrays
+        """
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.n_verts -= old[1]
+        if n_verts is None:
+            n_verts = len(arrays[0])
+        if n_verts > self.max_verts:
+            return
+        self._items[key] = (arrays, n_verts)
+        self.n_verts += n_verts
+        # evict least recently used
+        while self.n_verts > self.max_verts:
+            key, old = self._items.popitem(last=False)
+            self.n_verts -= old[1]
+
+    def clear(self):
+        self._items.clear()
+        self.n_verts = 0
+
+
+roof_cache = RoofCache()
+
+
+# archipack_roof properties each component depends on
+ROOF_COMPONENTS = {
+    'bargeboard': (
+        'bargeboard_altitude', 'bargeboard_height',
+        'bargeboard_offset', 'bargeboard_width'),
+    'fascia': (
+        'fascia_altitude', 'fascia_height',
+        'fascia_offset', 'fascia_width'),
+    'beam_primary': (
+        'beam_alt', 'beam_height',
+        'beam_offset', 'beam_width'),
+    'hips': (
+        'beam_sec_alt', 'beam_sec_enable', 'beam_sec_height', 'beam_sec_width',
+        'hip_alt', 'hip_enable', 'hip_model',
+        'hip_size_x', 'hip_size_y', 'hip_size_z', 'hip_space_x',
+        'tile_border', 'tile_couloir', 'tile_side', 'tile_size_y', 'tile_size_z',
+        'valley_altitude', 'valley_enable'),
+    'gutter': (
+        'fascia_altitude', 'fascia_width',
+        'gutter_alt', 'gutter_boudin', 'gutter_dist',
+        'gutter_segs', 'gutter_width'),
+    'rafter': (
+        'rafter_alt', 'rafter_height', 'rafter_spacing',
+        'rafter_start', 'rafter_width'),
+    'couverture': (
+        'tile_alternate', 'tile_altitude', 'tile_bevel', 'tile_bevel_amt',
+        'tile_bevel_segs', 'tile_border', 'tile_couloir', 'tile_fit_x',
+        'tile_fit_y', 'tile_height', 'tile_instancing', 'tile_model',
+        'tile_offset', 'tile_side', 'tile_size_x', 'tile_size_y', 'tile_size_z',
+        'tile_solidify', 'tile_space_x', 'tile_space_y')
+    }
+
+
+class RoofTiles():
+    """
+        Batched roof tile instancing
+        Store tile template once as arrays, compute tile grid
+        as array of translations and all tiles vertices of a pan
+        using a single broadcasted matrix product
+    """
+    def __init__(self, t_pts, t_faces):
+        self.pts = np.array([tuple(p) for p in t_pts], dtype=np.float32)
+        self.n_pts = len(t_pts)
+        self.n_faces = len(t_faces)
+        self.loop_total = np.array([len(f) for f in t_faces], dtype=np.int32)
+        self.loop_verts = np.array([i for f in t_faces for i in f], dtype=np.int32)
+        self.uvs = self.pts[self.loop_verts, 0:2]
+
+    def grid(self, n_x, n_y, dx, dy, x0, alternate, offset):
+        """
+            Compute tiles translations in pan space, ordered by row
+            x0: start of rows
+            alternate: shift odd rows by half a tile
+            offset: add a tile at row end
+            return array of n_tiles x 3 translations
+        """
+        k = np.arange(n_y)
+        nx = np.full(n_y, n_x, dtype=np.int32)
+        x_start = np.full(n_y, x0, dtype=np.float64)
+        if alternate:
+            odd = (k % 2) == 1
+            x_start[odd] -= 0.5 * dx
+            nx[odd] += 1
+        if offset:
+            nx += 1
+        j = np.arange(nx.max() if n_y > 0 else 0)
+        mask = j[None, :] < nx[:, None]
+        x = x_start[:, None] + j[None, :] * dx
+        y = np.broadcast_to(-k[:, None] * dy, x.shape)
+        t = np.zeros((int(mask.sum()), 3), dtype=np.float64)
+        t[:, 0] = x[mask]
+        t[:, 1] = y[mask]
+        return t
+
+    def instances(self, tM, sx, sy, sz, translations, idmat, rand, seed=0):
+        """
+            Compute tiles geometry for given translations
+            tM: pan matrix
+            idmat, rand: material index range
+            seed: random seed for material index
+            return arrays suitable for BmeshEdit.buildmesh_bulk
+        """
+        n_tiles = len(translations)
+        rM = np.array([tM.row[i].to_3d() for i in range(3)], dtype=np.float64)
+        t0 = np.array(tM.translation, dtype=np.float64)
+        scaled = self.pts * np.array([sx, sy, sz], dtype=np.float64)
+        base = scaled @ rM.T + t0
+        offsets = translations @ rM.T
+        coords = (offsets[:, None, :] + base[None, :, :]).reshape(-1, 3).astype(np.float32)
+
+        n_loops = len(self.loop_verts)
+        loop_verts = (
+            self.loop_verts[None, :] +
+            (np.arange(n_tiles, dtype=np.int32) * self.n_pts)[:, None]
+            ).ravel()
+        loop_total = np.tile(self.loop_total, n_tiles)
+        loop_start = np.zeros(len(loop_total), dtype=np.int32)
+        if len(loop_total) > 1:
+            np.cumsum(loop_total[:-1], out=loop_start[1:])
+
+        rng = np.random.RandomState(seed)
+        matids = np.repeat(
+            rng.randint(idmat, idmat + rand + 1, size=n_tiles).astype(np.int32),
+            self.n_faces)
+        uvs = np.tile(self.uvs, (n_tiles, 1)).reshape(n_tiles * n_loops, 2)
+        return coords, loop_start, loop_total, loop_verts, matids, uvs
+
+
 class RoofGenerator(CutAbleGenerator):
 
     def __init__(self, d, origin=Vector((0, 0, 0))):
@@ -963,30 +1131,11 @@ class RoofGenerator(CutAbleGenerator):
             p1.z = self.z - self.parts[i].slope_right
             manipulators[6].set_pts([p0, p1, (1, 0, 0)], normal=n0.v.to_3d())
 
-    def seg_partition(self, array, begin, end):
+    def sort_seg(self, array, begin=0, end=None):
         """
             sort tree segments by angle
         """
-        pivot = begin
-        for i in range(begin + 1, end + 1):
-            if array[i].a0 < array[begin].a0:
-                pivot += 1
-                array[i], array[pivot] = array[pivot], array[i]
-        array[pivot], array[begin] = array[begin], array[pivot]
-        return pivot
-
-    def sort_seg(self, array, begin=0, end=None):
-        # print("sort_child")
-        if end is None:
-            end = len(array) - 1
-
-        def _quicksort(array, begin, end):
-            if begin >= end:
-                return
-            pivot = self.seg_partition(array, begin, end)
-            _quicksort(array, begin, pivot - 1)
-            _quicksort(array, pivot + 1, end)
-        return _quicksort(array, begin, end)
+        sort_by_key(array, RoofAxisNode.angle_key, begin=begin, end=end)
 
     def make_roof(self, context):
         """
@@ -1564,6 +1713,46 @@ class RoofGenerator(CutAbleGenerator):
         """
         return
 
+    def cache_key(self, o, d, component, i, pan, matrix=False):
+        """
+            Components cache key for a pan
+            matrix: depends on object's matrix_world
+        """
+        key = (
+            o.name, component, i,
+            pan.fingerprint(self.z),
+            tuple(getattr(d, prop) for prop in ROOF_COMPONENTS[component])
+            )
+        if matrix:
+            key += (tuple(tuple(row) for row in o.matrix_world), )
+        return key
+
+    def cached_components(self, o, d, components):
+        """
+            Build list based components per pan using cache
+            components: names of generator methods
+            return list of arrays as returned by BmeshEdit.as_arrays
+        """
+        parts = []
+        pans = self.pans
+        try:
+            for i, pan in enumerate(pans):
+                for component in components:
+                    key = self.cache_key(o, d, component, i, pan)
+                    arrays = roof_cache.get(key)
+                    if arrays is None:
+                        verts, faces, edges, matids, uvs = [], [], [], [], []
+                        # component methods iterate over self.pans
+                        self.pans = [pan]
+                        getattr(self, component)(d, verts, faces, edges, matids, uvs)
+                        self.pans = pans
+                        arrays = bmed.as_arrays(verts, faces, matids, uvs)
+                        roof_cache.set(key, arrays)
+                    parts.append(arrays)
+        finally:
+            self.pans = pans
+        return parts
+
     def lambris(self, context, o, d):
 
         idmat = 0
@@ -1718,18 +1907,32 @@ class RoofGenerator(CutAbleGenerator):
         else:
             return
 
-        n_faces = len(t_faces)
-        t_uvs = [[(t_pts[i].x, t_pts[i].y) for i in f] for f in t_faces]
-
-        dx, dy = d.tile_space_x, d.tile_space_y
+        tiles = RoofTiles(t_pts, t_faces)
 
         step = 100 / ttl
 
         if d.quick_edit:
             context.scene.archipack_progress_text = "Build tiles:"
 
+        parts = []
+        instances = []
+
         for i, pan in enumerate(self.pans):
 
+            if d.quick_edit:
+                context.scene.archipack_progress = step * i
+
+            # cache real tiles and instances of pan
+            key = self.cache_key(o, d, 'couverture', i, pan, matrix=True)
+            cached = roof_cache.get(key)
+            if cached is not None:
+                arrays, pan_instances = cached
+                parts.append(arrays)
+                instances.extend(pan_instances)
+                continue
+
+            dx, dy = d.tile_space_x, d.tile_space_y
+
             seg = pan.fake_axis
             # compute base matrix top left of face
             vx = pan.vx
@@ -1760,55 +1963,46 @@ class RoofGenerator(CutAbleGenerator):
                 [0, 0, 0, 1]
             ])
 
-            verts = []
-            faces = []
-            matids = []
-            uvs = []
-
-            # steps for this pan
-            substep = step / n_y
-            # print("step:%s sub:%s" % (step, substep))
-
-            for k in range(n_y):
-
-                progress = step * i + substep * k
-                # print("progress %s" % (progress))
-                if d.quick_edit:
-                    context.scene.archipack_progress = progress
-
-                y = k * dy
-
-                x0 = offset * dx - d.tile_side
-                nx = n_x
-
-                if d.tile_alternate and k % 2 == 1:
-                    x0 -= 0.5 * dx
-                    nx += 1
+            translations = tiles.grid(
+                n_x, n_y, dx, dy,
+                offset * dx - d.tile_side,
+                d.tile_alternate,
+                d.tile_offset > 0)
 
-                if d.tile_offset > 0:
-                    nx += 1
-
-                for j in range(nx):
-                    x = x0 + j * dx
-                    lM = tM * Matrix([
-                        [sx, 0, 0, x],
-                        [0, sy, 0, -y],
-                        [0, 0, sz, 0],
-                        [0, 0, 0, 1]
-                    ])
-
-                    v = len(verts)
-
-                    verts.extend([lM * p for p in t_pts])
-                    faces.extend([tuple(i + v for i in f) for f in t_faces])
-                    mid = randint(idmat, idmat + rand)
-                    t_mats = [mid for i in range(n_faces)]
-                    matids.extend(t_mats)
-                    uvs.extend(t_uvs)
+            # Build boundary including borders and bottom offsets
+            new_s = None
+            segs = []
+            for s in pan.segs:
+                if s.length > 0:
+                    if s.type == 'LINK_VALLEY':
+                        of = -d.tile_couloir
+                    elif s.type == 'BOTTOM':
+                        of = d.tile_border
+                    elif s.type == 'SIDE':
+                        of = d.tile_side
+                    else:
+                        of = 0
+                    new_s = s.make_offset(of, new_s)
+                    segs.append(new_s)
+
+            if len(segs) > 0:
+                # last / first intersection
+                res, p, t = segs[0].intersect(segs[-1])
+                if res:
+                    segs[0].p0 = p
+                    segs[-1].p1 = p
+
+            # only send boundary straddling tiles to bissect
+            boundary, inside = self.cull(
+                tiles.instances(tM, sx, sy, sz, translations, idmat, rand, seed=i),
+                segs,
+                [hole.segs for hole in pan.holes],
+                groups=np.repeat(np.arange(len(translations)), tiles.n_faces),
+                margin=sz + abs(d.tile_altitude))
 
             # build temp bmesh and bissect
-            bm = bmed.buildmesh(
-                context, o, verts, faces, matids=matids, uvs=uvs,
+            bm = bmed.buildmesh_bulk(
+                context, o, *boundary,
                 weld=False, clean=False, auto_smooth=True, temporary=True)
 
             # clean outer on convex parts
@@ -1854,67 +2048,81 @@ class RoofGenerator(CutAbleGenerator):
                     DEL_ONLYTAGGED
                 };
                 """
-                # Build boundary including borders and bottom offsets
-                new_s = None
-                segs = []
-                for s in pan.segs:
-                    if s.length > 0:
-                        if s.type == 'LINK_VALLEY':
-                            offset = -d.tile_couloir
-                        elif s.type == 'BOTTOM':
-                            offset = d.tile_border
-                        elif s.type == 'SIDE':
-                            offset = d.tile_side
-                        else:
-                            offset = 0
-                        new_s = s.make_offset(offset, new_s)
-                        segs.append(new_s)
-
                 if len(segs) > 0:
-                    # last / first intersection
-                    res, p, t = segs[0].intersect(segs[-1])
-                    if res:
-                        segs[0].p0 = p
-                        segs[-1].p1 = p
-                    f_geom = [f for f in bm.faces if not pan.inside(f.calc_center_median().to_2d(), segs)]
+                    faces = bm.faces[:]
+                    res = pan.locator(segs).inside(
+                        [f.calc_center_median().to_2d() for f in faces])
+                    f_geom = [f for f, inside in zip(faces, res) if not inside]
                     if len(f_geom) > 0:
                         bmesh.ops.delete(bm, geom=f_geom, context=5)
 
             self.cut_holes(bm, pan)
 
-            bmesh.ops.dissolve_limit(bm,
-                        angle_limit=0.01,
-                        use_dissolve_boundaries=False,
-                        verts=bm.verts[:],
-                        edges=bm.edges[:],
-                        delimit=1)
+            # inside tiles of a pan share a shape, instance them by material
+            pan_instances = []
+            if d.tile_instancing:
+                pan_instances, inside = split_instances(
+                    inside,
+                    groups=np.arange(len(inside[1])) // tiles.n_faces)
 
-            if d.tile_bevel:
-                geom = bm.verts[:]
-                geom.extend(bm.edges[:])
-                bmesh.ops.bevel(bm,
-                    geom=geom,
-                    offset=d.tile_bevel_amt,
-                    offset_type=offset_type,
-                    segments=d.tile_bevel_segs,
-                    profile=0.5,
-                    vertex_only=False,
-                    clamp_overlap=True,
-                    material=-1)
-
-            if d.tile_solidify:
-                geom = bm.faces[:]
-                verts = bm.verts[:]
-                bmesh.ops.solidify(bm, geom=geom, thickness=0.0001)
-                bmesh.ops.translate(bm, vec=vz * d.tile_height, space=o.matrix_world, verts=verts)
+            bmed.buildmesh_bulk(
+                context, o, *inside,
+                auto_smooth=True, temporary=True, bm=bm)
 
-            # merge with object
-            bmed.bmesh_join(context, o, [bm], normal_update=True)
-            bpy.ops.object.mode_set(mode='OBJECT')
+            self.finish_tiles(bm, d, vz, o.matrix_world, offset_type)
+
+            arrays = bmed.bm_to_arrays(bm)
+            bm.free()
+
+            pan_instances = finish_instances(
+                context, o, pan_instances,
+                lambda bm, origin: self.finish_tiles(bm, d, vz, o.matrix_world, offset_type))
+
+            roof_cache.set(
+                key, (arrays, pan_instances),
+                len(arrays[0]) + sum(len(p[0]) + len(t) for p, t in pan_instances))
+            parts.append(arrays)
+            instances.extend(pan_instances)
+
+        # merge with object
+        bmed.buildmesh_bulk(context, o, *bmed.concat(parts), auto_smooth=False, append=True)
+
+        build_instances(context, o, instances)
 
         if d.quick_edit:
             context.scene.archipack_progress = -1
 
+    def finish_tiles(self, bm, d, vz, space, offset_type):
+        """
+            Dissolve, bevel and solidify tiles in place
+            vz: pan normal
+        """
+        bmesh.ops.dissolve_limit(bm,
+                    angle_limit=0.01,
+                    use_dissolve_boundaries=False,
+                    verts=bm.verts[:],
+                    edges=bm.edges[:],
+                    delimit=1)
+
+        if d.tile_bevel:
+            geom = bm.verts[:]
+            geom.extend(bm.edges[:])
+            bmesh.ops.bevel(bm,
+                geom=geom,
+                offset=d.tile_bevel_amt,
+                offset_type=offset_type,
+                segments=d.tile_bevel_segs,
+                profile=0.5,
+                vertex_only=False,
+                clamp_overlap=True,
+                material=-1)
+
+        if d.tile_solidify:
+            geom = bm.faces[:]
+            verts = bm.verts[:]
+            bmesh.ops.solidify(bm, geom=geom, thickness=0.0001)
+            bmesh.ops.translate(bm, vec=vz * d.tile_height, space=space, verts=verts)
+
     def _bargeboard(self, s, i, boundary, pan,
             width, height, altitude, offset, idmat,
             verts, faces, edges, matids, uvs):
@@ -2743,8 +2951,17 @@ class RoofGenerator(CutAbleGenerator):
 
         holes_offset = -d.rafter_width
 
+        parts = []
+
         # build temp bmesh and bissect
-        for pan in self.pans:
+        for i, pan in enumerate(self.pans):
+
+            key = self.cache_key(o, d, 'rafter', i, pan, matrix=True)
+            arrays = roof_cache.get(key)
+            if arrays is not None:
+                parts.append(arrays)
+                continue
+
             tmin, tmax, ysize = pan.tmin, pan.tmax, pan.ysize
 
             # print("tmin:%s tmax:%s ysize:%s" % (tmin, tmax, ysize))
@@ -2819,10 +3036,13 @@ class RoofGenerator(CutAbleGenerator):
                     for j, loop in enumerate(face.loops):
                         loop[layer].uv = uvs[j]
 
-            # merge with object
-            bmed.bmesh_join(context, o, [bm], normal_update=True)
+            arrays = bmed.bm_to_arrays(bm)
+            bm.free()
+            roof_cache.set(key, arrays)
+            parts.append(arrays)
 
-        bpy.ops.object.mode_set(mode='OBJECT')
+        # merge with object
+        bmed.buildmesh_bulk(context, o, *bmed.concat(parts), auto_smooth=False, append=True)
 
     def hips(self, d, verts, faces, edges, matids, uvs):
 
@@ -3317,28 +3537,9 @@ class RoofGenerator(CutAbleGenerator):
             s.rotate(da)
             s.translate(tp)
 
-    def t_partition(self, array, begin, end):
-        pivot = begin
-        for i in range(begin + 1, end + 1):
-            # wall idx
-            if array[i][0] < array[begin][0]:
-                pivot += 1
-                array[i], array[pivot] = array[pivot], array[i]
-        array[pivot], array[begin] = array[begin], array[pivot]
-        return pivot
-
     def sort_t(self, array, begin=0, end=None):
-        # print("sort_child")
-        if end is None:
-            end = len(array) - 1
-
-        def _quicksort(array, begin, end):
-            if begin >= end:
-                return
-            pivot = self.t_partition(array, begin, end)
-            _quicksort(array, begin, pivot - 1)
-            _quicksort(array, pivot + 1, end)
-        return _quicksort(array, begin, end)
+        # sort by wall idx
+        sort_by_key(array, itemgetter(0), begin=begin, end=end)
 
     def make_wall_fit(self, context, o, wall, inside, auto_update, skip_z):
         """
@@ -3777,6 +3978,9 @@ class archipack_roof_segment(ArchipackSegment, PropertyGroup):
 
 
 class archipack_roof(ArchipackLines, ArchipackObject, Manipulable, DimensionProvider, PropertyGroup):
+    # coarse preview while dragging manipulators
+    lod_support = True
+
     parts = CollectionProperty(type=archipack_roof_segment)
     z = FloatProperty(
             name="Altitude",
@@ -3833,6 +4037,13 @@ class archipack_roof(ArchipackLines, ArchipackObject, Manipulable, DimensionProv
             default=True,
             update=update_components
             )
+    tile_instancing = BoolProperty(
+            name="Instancing",
+            description="Instance inside tiles, boundary tiles remain real geometry, "
+                        "realize before export",
+            default=False,
+            update=update_components
+            )
     tile_height = FloatProperty(
             name="Height",
             description="Amount for solidify",
@@ -4710,26 +4921,31 @@ class archipack_roof(ArchipackLines, ArchipackObject, Manipulable, DimensionProv
             self.make_surface(o, verts, edges)
 
         else:
+            parts = []
             if not self.schrinkwrap_target:
 
+                components = []
+
                 if self.bargeboard_enable:
-                    g.bargeboard(self, verts, faces, edges, matids, uvs)
+                    components.append('bargeboard')
 
                 if self.fascia_enable:
-                    g.fascia(self, verts, faces, edges, matids, uvs)
+                    components.append('fascia')
 
                 if self.beam_enable:
-                    g.beam_primary(self, verts, faces, edges, matids, uvs)
+                    components.append('beam_primary')
 
-                g.hips(self, verts, faces, edges, matids, uvs)
+                components.append('hips')
 
                 if self.gutter_enable:
-                    g.gutter(self, verts, faces, edges, matids, uvs)
+                    components.append('gutter')
 
-            bmed.buildmesh(
+                # unchanged components are merged from cache
+                parts = g.cached_components(o, self, components)
 
-                context, o, verts, faces, matids=matids, uvs=uvs,
-                weld=False, clean=False, auto_smooth=True, temporary=False)
+            bmed.buildmesh_bulk(
+                context, o, *bmed.concat(parts),
+                weld=False, clean=False, auto_smooth=True)
 
             if self.schrinkwrap_target:
                 g.lambris(context, o, self)
@@ -4740,14 +4956,24 @@ class archipack_roof(ArchipackLines, ArchipackObject, Manipulable, DimensionProv
                     g.rafter(context, o, self)
                     # print("rafter")
 
-                if self.quick_edit and not force_update:
+                if self.lod_preview(o):
+                    # coarse preview, no tile field
+                    pass
+                elif self.quick_edit and not force_update:
                     if self.tile_enable:
-                        bpy.ops.archipack.roof_throttle_update(name=o.name)
+                        update_scheduler.schedule(
+                            context, o, 'roof_tiles', throttle_update,
+                            order=ORDER_ROOF,
+                            delay=throttle_delay)
                 else:
                     # throttle here
                     if self.tile_enable:
                         g.couverture(context, o, self)
 
+        if (self.draft or self.schrinkwrap_target or
+                not self.tile_enable or self.lod_preview(o)):
+            remove_instances(context, o)
+
         if not self.schrinkwrap_target:
             target = self.find_shrinkwrap(o)
             self.create_shrinkwrap(context, o, target)
@@ -4986,6 +5212,11 @@ class ARCHIPACK_PT_roof(Panel):
         if prop.tile_expand:
             box.prop(prop, 'tile_model', text="")
 
+            row = box.row(align=True)
+            row.prop(prop, 'tile_instancing', icon='MOD_ARRAY')
+            if prop.tile_instancing:
+                row.operator("archipack.realize_instances", text="Realize")
+
             box.prop(prop, 'tile_solidify', icon='MOD_SOLIDIFY')
             if prop.tile_solidify:
                 box.prop(prop, 'tile_height')
@@ -5421,116 +5652,18 @@ class ARCHIPACK_OT_roof_from_wall(Operator):
 
 
 # Update throttle
-class ArchipackThrottleHandler():
-    """
-        One modal runs for each object at time
-        when call for 2nd one
-        update timer so first one wait more
-        and kill 2nd one
-    """
-    def __init__(self, context, delay):
-        self._timer = None
-        self.start = 0
-        self.update_state = False
-        self.delay = delay
-
-    def start_timer(self, context):
-        self.start = time.time()
-        self._timer = context.window_manager.event_timer_add(self.delay, context.window)
-
-    def stop_timer(self, context):
-        if self._timer is not None:
-            context.window_manager.event_timer_remove(self._timer)
-            self._timer = None
-
-    def execute(self, context):
-        """
-            refresh timer on execute
-            return
-                True if modal should run
-                False on complete
-        """
-        if self._timer is None:
-            self.update_state = False
-            self.start_timer(context)
-            return True
-
-        # allready a timer running
-        self.stop_timer(context)
-
-        # prevent race conditions when allready in update mode
-        if self.is_updating:
-            return False
-
-        self.start_timer(context)
-        return False
-
-    def modal(self, context, event):
-        if event.type == 'TIMER' and not self.is_updating:
-            if time.time() - self.start > self.delay:
-                self.update_state = True
-                self.stop_timer(context)
-                return True
-        return False
-
-    @property
-    def is_updating(self):
-        return self.update_state
-
-
-throttle_handlers = {}
 throttle_delay = 1
 
 
-class ARCHIPACK_OT_roof_throttle_update(Operator):
-    bl_idname = "archipack.roof_throttle_update"
-    bl_label = "Update childs with a delay"
-
-    name = StringProperty()
-
-    def kill_handler(self, context, name):
-        if name in throttle_handlers.keys():
-            throttle_handlers[name].stop_timer(context)
-            del throttle_handlers[self.name]
-
-    def get_handler(self, context, delay):
-        global throttle_handlers
-        if self.name not in throttle_handlers.keys():
-            throttle_handlers[self.name] = ArchipackThrottleHandler(context, delay)
-        return throttle_handlers[self.name]
-
-    def modal(self, context, event):
-        global throttle_handlers
-        if self.name in throttle_handlers.keys():
-            if throttle_handlers[self.name].modal(context, event):
-                act = context.active_object
-                o = context.scene.objects.get(self.name)
-                # print("delay update of %s" % (self.name))
-                if o is not None:
-                    selected = o.select
-                    o.select = True
-                    context.scene.objects.active = o
-                    d = o.data.archipack_roof[0]
-                    d.update(context,
-                        force_update=True,
-                        update_parent=False)
-                    # skip_parent_update=self.skip_parent_update)
-                    o.select = selected
-                context.scene.objects.active = act
-                del throttle_handlers[self.name]
-                return {'FINISHED'}
-            else:
-                return {'PASS_THROUGH'}
-        else:
-            return {'FINISHED'}
-
-    def execute(self, context):
-        global throttle_delay
-        handler = self.get_handler(context, throttle_delay)
-        if handler.execute(context):
-            context.window_manager.modal_handler_add(self)
-            return {'RUNNING_MODAL'}
-        return {'FINISHED'}
+def throttle_update(context, o):
+    """
+        Delayed tiles update, see update_scheduler
+    """
+    d = archipack_roof.datablock(o)
+    if d is not None:
+        d.update(context,
+            force_update=True,
+            update_parent=False)
 
 
 # ------------------------------------------------------------------
@@ -5572,10 +5705,10 @@ def register():
     bpy.utils.register_class(ARCHIPACK_OT_roof_preset)
     bpy.utils.register_class(ARCHIPACK_OT_roof_from_curve)
     bpy.utils.register_class(ARCHIPACK_OT_roof_from_wall)
-    bpy.utils.register_class(ARCHIPACK_OT_roof_throttle_update)
 
 
 def unregister():
+    roof_cache.clear()
     # bpy.utils.unregister_class(archipack_roof_material)
     bpy.utils.unregister_class(archipack_roof_cutter_segment)
     bpy.utils.unregister_class(archipack_roof_cutter)
@@ -5591,4 +5724,3 @@ def unregister():
     bpy.utils.unregister_class(ARCHIPACK_OT_roof_preset)
     bpy.utils.unregister_class(ARCHIPACK_OT_roof_from_curve)
     bpy.utils.unregister_class(ARCHIPACK_OT_roof_from_wall)
-    bpy.utils.unregister_class(ARCHIPACK_OT_roof_throttle_update)
@@ -0,0 +1,199 @@
+# -*- coding:utf-8 -*-
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110- 1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+# ----------------------------------------------------------
+# Author: Stephen Leger (s-leger)
+#
+# ----------------------------------------------------------
+"""
+    Debounced update scheduler
+
+    Coalesce update requests per object and task,
+    each new request of a task delays it (debounce).
+    Run due tasks from a timer modal in dependency order
+    wall -> openings -> roof fit -> dimensions, with a time
+    budget per tick so the UI remains responsive.
+    Without window (background mode) tasks run immediately.
+    Used by roof tiles and linked copies propagation.
+"""
+# noinspection PyUnresolvedReferences
+import bpy
+# noinspection PyUnresolvedReferences
+from bpy.types import Operator
+from bpy.app.handlers import persistent
+import time
+import logging
+logger = logging.getLogger("archipack")
+
+
+# Dependency order of tasks, lower run first
+ORDER_WALL = 0
+ORDER_OPENING = 1
+ORDER_ROOF = 2
+ORDER_DIMENSION = 3
+
+# Timer interval in seconds
+tick_interval = 0.05
+# Time budget of a tick in seconds
+tick_budget = 0.1
+
+
+class ArchipackUpdateScheduler():
+    """
+        Pending tasks are stored by key, (object name, task) by default
+        callbacks take (context, o) and must retrieve datablocks
+        from o as they may run after an undo
+    """
+    def __init__(self):
+        # key: [due, order, seq, object name, root name, callback]
+        self.pending = {}
+        self.running = False
+        self.seq = 0
+
+    def schedule(self, context, o, task, callback, order=ORDER_OPENING, delay=0, key=None):
+        """
+            Request a task for object o
+            task: task name
+            callback: callable(context, o)
+            order: dependency order, see ORDER_*
+            delay: seconds to wait for more requests before run
+            key: optional coalescing key, default to (o.name, task)
+        """
+        if context.window is None:
+            self._run(context, o, callback)
+            return
+        if key is None:
+            key = (o.name, task)
+        root = o
+        while root.parent is not None:
+            root = root.parent
+        self.seq += 1
+        self.pending[key] = [time.time() + delay, order, self.seq, o.name, root.name, callback]
+        if not self.running:
+            bpy.ops.archipack.update_scheduler()
+
+    def _run(self, context, o, callback):
+        # archipack updates look for object in selection
+        state = o.select
+        o.select = True
+        context.scene.objects.active = o
+        try:
+            callback(context, o)
+        except Exception:
+            logger.exception("ArchipackUpdateScheduler task failed on %s", o.name)
+        o.select = state
+
+    def ready(self, now):
+        """
+            Keys of due tasks and tasks they depend on, in run order
+            a due task depends on lower order tasks of the same hierarchy
+        """
+        # highest due order by root object
+        due = {}
+        for v in self.pending.values():
+            if v[0] <= now:
+                due[v[4]] = max(v[1], due.get(v[4], v[1]))
+        if len(due) < 1:
+            return []
+        # run lower order tasks of same hierarchy first, even when not due
+        keys = [
+            k for k, v in self.pending.items()
+            if v[0] <= now or v[1] < due.get(v[4], v[1])
+            ]
+        keys.sort(key=lambda k: self.pending[k][1:3])
+        return keys
+
+    def tick(self, context):
+        """
+            Run ready tasks within time budget
+            return True while tasks are pending
+        """
+        start = time.time()
+        keys = self.ready(start)
+        if len(keys) > 0:
+            act = context.scene.objects.active
+            for key in keys:
+                if time.time() - start > tick_budget:
+                    break
+                due, order, seq, name, root, callback = self.pending.pop(key)
+                o = context.scene.objects.get(name)
+                if o is not None:
+                    self._run(context, o, callback)
+            context.scene.objects.active = act
+        return len(self.pending) > 0
+
+    def clear(self):
+        self.pending.clear()
+        self.running = False
+
+
+update_scheduler = ArchipackUpdateScheduler()
+
+
+class ARCHIPACK_OT_update_scheduler(Operator):
+    bl_idname = "archipack.update_scheduler"
+    bl_label = "Update scheduler"
+    bl_description = "Run pending archipack updates"
+    bl_options = {'INTERNAL'}
+
+    _timer = None
+
+    def stop(self, context):
+        if self._timer is not None:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+        update_scheduler.running = False
+
+    def modal(self, context, event):
+        if not update_scheduler.running:
+            # cleared on file load
+            self.stop(context)
+            return {'FINISHED'}
+        if event.type == 'TIMER':
+            if not update_scheduler.tick(context):
+                self.stop(context)
+                return {'FINISHED'}
+        return {'PASS_THROUGH'}
+
+    def execute(self, context):
+        if update_scheduler.running:
+            return {'FINISHED'}
+        update_scheduler.running = True
+        self._timer = context.window_manager.event_timer_add(tick_interval, context.window)
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+
+@persistent
+def archipack_update_scheduler_clear(dummy):
+    update_scheduler.clear()
+
+
+def register():
+    bpy.utils.register_class(ARCHIPACK_OT_update_scheduler)
+    bpy.app.handlers.load_post.append(archipack_update_scheduler_clear)
+
+
+def unregister():
+    bpy.app.handlers.load_post.remove(archipack_update_scheduler_clear)
+    bpy.utils.unregister_class(ARCHIPACK_OT_update_scheduler)
+    update_scheduler.clear()
@@ -251,13 +251,11 @@ class ArchipackSectionManager():
             manager.center.z = 0
 
         sel.extend([
-            c for c in context.scene.objects
-            if c.type == 'MESH' and
-            not c.hide and
+            c for c in manager.objects_in_bounds(context.scene)
+            if not c.hide and
             not c.hide_render and
             c.name != o.name and
-            not archipack_section_target.filter(c) and
-            manager._contains(c)
+            not archipack_section_target.filter(c)
             ])
         return tM
 
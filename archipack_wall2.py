@@ -26,7 +26,9 @@
 # ----------------------------------------------------------
 import bpy
 import bmesh
+from collections import OrderedDict
 from bpy.types import Operator, PropertyGroup, Mesh, Panel
+from bpy.app.handlers import persistent
 from bpy.props import (
     FloatProperty, BoolProperty, IntProperty, StringProperty,
     FloatVectorProperty, CollectionProperty, EnumProperty
@@ -44,7 +46,8 @@ from .archipack_manipulator import (
     )
 from .archipack_object import (
     ArchipackObject, ArchipackCreateTool,
-    ArchipackDrawTool, ArchipackObjectsManager
+    ArchipackDrawTool, ArchipackObjectsManager,
+    update_versions
     )
 from .archipack_2d import Line, Arc
 from .archipack_snap import snap_point
@@ -435,6 +438,49 @@ class WallGenerator():
         return p0, p1
 
 
+def matrix_fingerprint(tM):
+    return tuple(tuple(row) for row in tM)
+
+
+class WallGeomCache():
+    """
+        Bounded LRU cache of archipack_wall2.as_geom results
+        per scene, wall object and mode
+        Entries hold a fingerprint of wall, openings and t childs walls
+        update versions and matrices, and are reused only when fingerprint match.
+        Cleared on file load and undo, as versions do not follow undo.
+        max_items: cache bound in entries
+    """
+    def __init__(self, max_items=64):
+        self.max_items = max_items
+        self._items = OrderedDict()
+
+    def get(self, key, fingerprint):
+        entry = self._items.get(key)
+        if entry is None or entry[0] != fingerprint:
+            return None
+        self._items.move_to_end(key)
+        return entry[1]
+
+    def set(self, key, fingerprint, value):
+        self._items.pop(key, None)
+        self._items[key] = (fingerprint, value)
+        # evict least recently used
+        while len(self._items) > self.max_items:
+            self._items.popitem(last=False)
+
+    def clear(self):
+        self._items.clear()
+
+
+wall_geom_cache = WallGeomCache()
+
+
+@persistent
+def archipack_wall_geom_cache_clear(dummy):
+    wall_geom_cache.clear()
+
+
 def update(self, context):
     self.update(context)
 
@@ -1243,6 +1289,8 @@ class archipack_wall2(ArchipackObject, ArchipackCurveManager, Manipulable, Dimen
         if o is None:
             return
 
+        update_versions.bump(o.name)
+
         if manipulable_refresh:
             # prevent crash by removing all manipulators refs to datablock before changes
             self.manipulable_disable(context)
@@ -1905,12 +1953,91 @@ class archipack_wall2(ArchipackObject, ArchipackCurveManager, Manipulable, Dimen
                     objs.append(c)
                     self.get_childs_geoms(context, td, objs, t_childs, True)
 
+    def geom_fingerprint(self, context, o, visited=None):
+        """
+            Hashable state of wall, openings and t childs walls
+            as_geom depends on, through update versions and matrices
+            childs are the ones get_childs_geoms collect
+        """
+        if visited is None:
+            visited = set()
+        visited.add(o.name)
+        res = [o.name, update_versions.get(o.name), matrix_fingerprint(o.matrix_world)]
+        if o.parent is not None:
+            # openings added or removed setup_childs did not see yet
+            res.append(len(o.parent.children))
+        for child in self.childs:
+            c, d = child.get_child(context)
+            if c is None:
+                res.append(child.child_name)
+                continue
+            if c.name in visited:
+                continue
+            if d is not None:
+                res.append((c.name, update_versions.get(c.name), matrix_fingerprint(c.matrix_world)))
+                continue
+            td = archipack_wall2.datablock(c)
+            if td is not None:
+                res.append(td.geom_fingerprint(context, c, visited))
+        return tuple(res)
+
     def as_geom(self, context, o, mode, inter, doors, windows, io=None):
         """
          Build 2d symbol of walls as pygeos entity for further processing
          cut windows and doors
          w, it = C.object.data.archipack_wall2[0].as_2d(C, C.object)
+         Results of main wall (io is None) are cached in wall_geom_cache
         """
+        if io is not None:
+            return self._as_geom(context, o, mode, inter, doors, windows, io)
+
+        key = (context.scene.name, o.name, mode)
+        cached = wall_geom_cache.get(key, self.geom_fingerprint(context, o))
+
+        if cached is None:
+            n_inter, n_doors, n_windows = len(inter), len(doors), len(windows)
+            io, wall, t_childs = self._as_geom(context, o, mode, inter, doors, windows, io)
+            # setup_childs may change childs, so fingerprint state after build
+            fingerprint = self.geom_fingerprint(context, o)
+            # geoms might be altered by consumers so store copies
+            cached = (
+                io.coordsys,
+                wall.clone(),
+                [(c.name, td.extend) for c, td in t_childs],
+                self._clone_geoms(inter[n_inter:]),
+                self._clone_geoms(doors[n_doors:]),
+                self._clone_geoms(windows[n_windows:])
+                )
+            wall_geom_cache.set(key, fingerprint, cached)
+            return io, wall, t_childs
+
+        coordsys, wall, t_states, _inter, _doors, _windows = cached
+
+        # childs are up to date as state did not change since build
+        # geoms might be altered by consumers so provide copies
+        inter.extend(self._clone_geoms(_inter))
+        doors.extend(self._clone_geoms(_doors))
+        windows.extend(self._clone_geoms(_windows))
+
+        t_childs = []
+        for name, extend in t_states:
+            c = context.scene.objects.get(name)
+            td = archipack_wall2.datablock(c)
+            td.extend = extend
+            t_childs.append((c, td))
+
+        io = Io(scene=context.scene, coordsys=coordsys)
+        return io, wall.clone(), t_childs
+
+    @staticmethod
+    def _clone_geoms(geoms):
+        # doors of FLOORS mode are (point, hole) tuples
+        return [
+            tuple(geom.clone() for geom in item) if isinstance(item, tuple) else item.clone()
+            for item in geoms
+            ]
+
+    def _as_geom(self, context, o, mode, inter, doors, windows, io=None):
         objs = [o]
 
         g = self.update_parts(o)
@@ -3014,9 +3141,16 @@ def register():
     bpy.utils.register_class(ARCHIPACK_OT_wall2_from_slab)
     bpy.utils.register_class(ARCHIPACK_OT_wall2_fit_roof)
     bpy.utils.register_class(ARCHIPACK_OT_wall2_to_curve)
+    bpy.app.handlers.load_post.append(archipack_wall_geom_cache_clear)
+    bpy.app.handlers.undo_post.append(archipack_wall_geom_cache_clear)
+    bpy.app.handlers.redo_post.append(archipack_wall_geom_cache_clear)
 
 
 def unregister():
+    bpy.app.handlers.load_post.remove(archipack_wall_geom_cache_clear)
+    bpy.app.handlers.undo_post.remove(archipack_wall_geom_cache_clear)
+    bpy.app.handlers.redo_post.remove(archipack_wall_geom_cache_clear)
+    wall_geom_cache.clear()
     bpy.utils.unregister_class(archipack_wall2_part)
     bpy.utils.unregister_class(archipack_wall2_child)
     bpy.utils.unregister_class(archipack_wall2)
@@ -41,7 +41,10 @@ from .archipack_handle import create_handle, window_handle_vertical_01, window_h
 from .archipack_manipulator import Manipulable
 from .archipack_preset import ArchipackPreset, PresetMenuOperator
 from .archipack_gl import FeedbackPanel
-from .archipack_object import ArchipackObject, ArchipackCreateTool, ArchipackDrawTool
+from .archipack_object import (
+    ArchipackObject, ArchipackCreateTool, ArchipackDrawTool,
+    update_versions
+    )
 from .archipack_keymaps import Keymaps
 from .archipack_dimension import DimensionProvider
 
@@ -1702,51 +1705,33 @@ class archipack_window(ArchipackObject, Manipulable, DimensionProvider, Property
                 return handle
         return None
 
+    def _create_linked_panel(self, context, o, linked, child):
+        p = bpy.data.objects.new("Window Panel", child.data)
+        context.scene.objects.link(p)
+        p.show_transparent = True
+        p.lock_location[1] = True
+        p.lock_location[2] = True
+        p.lock_rotation[1] = True
+        p.lock_scale[0] = True
+        p.lock_scale[1] = True
+        p.lock_scale[2] = True
+        p.parent = linked
+        p.matrix_world = linked.matrix_world.copy()
+        m = p.archipack_material.add()
+        m.category = 'window'
+        m.material = o.archipack_material[0].material
+        return p
+
     def _synch_childs(self, context, o, linked, childs):
         """
             sub synch childs nodes of linked object
         """
-
-        # remove childs not found on source
         l_childs = self.get_childs_panels(context, linked)
-        c_names = [c.data.name for c in childs]
-        for c in l_childs:
-            try:
-                id = c_names.index(c.data.name)
-            except:
-                self.delete_object(context, c)
-
-        # children ordering may not be the same, so get the right l_childs order
-        l_childs = self.get_childs_panels(context, linked)
-        l_names = [c.data.name for c in l_childs]
-        order = []
-        for c in childs:
-            try:
-                id = l_names.index(c.data.name)
-            except:
-                id = -1
-            order.append(id)
-
-        # add missing childs and update other ones
-        for i, child in enumerate(childs):
-            if order[i] < 0:
-                p = bpy.data.objects.new("Window Panel", child.data)
-                context.scene.objects.link(p)
-                p.show_transparent = True
-                p.lock_location[1] = True
-                p.lock_location[2] = True
-                p.lock_rotation[1] = True
-                p.lock_scale[0] = True
-                p.lock_scale[1] = True
-                p.lock_scale[2] = True
-                p.parent = linked
-                p.matrix_world = linked.matrix_world.copy()
-                m = p.archipack_material.add()
-                m.category = 'window'
-                m.material = o.archipack_material[0].material
-            else:
-                p = l_childs[order[i]]
+        pairs = self.diff_childs(context, childs, l_childs,
+            lambda child: self._create_linked_panel(context, o, linked, child))
 
+        # update locks, handles and location in a single pass
+        for child, p in pairs:
             self.synch_locks(p)
 
             # update handle
@@ -1764,50 +1749,32 @@ class archipack_window(ArchipackObject, Manipulable, DimensionProvider, Property
         # restore context
         context.scene.objects.active = o
 
+    def _create_linked_shutter(self, context, o, linked, child):
+        p = bpy.data.objects.new("Shutter", child.data)
+        context.scene.objects.link(p)
+        p.lock_location[1] = True
+        p.lock_location[2] = True
+        p.lock_rotation[1] = True
+        p.lock_scale[0] = True
+        p.lock_scale[1] = True
+        p.lock_scale[2] = True
+        p.parent = linked
+        p.matrix_world = linked.matrix_world.copy()
+        m = p.archipack_material.add()
+        m.category = 'window'
+        m.material = o.archipack_material[0].material
+        return p
+
     def _synch_shutters(self, context, o, linked, left_side):
         """
             sub synch childs nodes of linked object
         """
         childs = self.get_childs_shutters(context, o, left_side)
-        # remove childs not found on source
         l_childs = self.get_childs_shutters(context, linked, left_side)
-        c_names = [c.data.name for c in childs]
-        for c in l_childs:
-            try:
-                id = c_names.index(c.data.name)
-            except:
-                self.delete_object(context, c)
-
-        # children ordering may not be the same, so get the right l_childs order
-        l_childs = self.get_childs_shutters(context, linked, left_side)
-        l_names = [c.data.name for c in l_childs]
-        order = []
-        for c in childs:
-            try:
-                id = l_names.index(c.data.name)
-            except:
-                id = -1
-            order.append(id)
-
-        # add missing childs and update other ones
-        for i, child in enumerate(childs):
-            if order[i] < 0:
-                p = bpy.data.objects.new("Shutter", child.data)
-                context.scene.objects.link(p)
-                p.lock_location[1] = True
-                p.lock_location[2] = True
-                p.lock_rotation[1] = True
-                p.lock_scale[0] = True
-                p.lock_scale[1] = True
-                p.lock_scale[2] = True
-                p.parent = linked
-                p.matrix_world = linked.matrix_world.copy()
-                m = p.archipack_material.add()
-                m.category = 'window'
-                m.material = o.archipack_material[0].material
-            else:
-                p = l_childs[order[i]]
+        pairs = self.diff_childs(context, childs, l_childs,
+            lambda child: self._create_linked_shutter(context, o, linked, child))
 
+        for child, p in pairs:
             # self.synch_locks(p)
 
             p.location = child.location.copy()
@@ -1837,23 +1804,21 @@ class archipack_window(ArchipackObject, Manipulable, DimensionProvider, Property
         """
             synch childs nodes of linked objects
         """
-        bpy.ops.object.select_all(action='DESELECT')
-        o.select = True
-        context.scene.objects.active = o
+        linked_objects = self.linked_objects(context, o)
+        if len(linked_objects) < 1:
+            return
         childs = self.get_childs_panels(context, o)
         hole = self.find_hole(o)
-        bpy.ops.object.select_linked(type='OBDATA')
-        for linked in context.selected_objects:
-            if linked != o:
-                ld = archipack_window.datablock(linked)
-                ld.update_portal(context, linked)
-                ld.update_blind(context, linked, True)
-                ld.update_blind(context, linked, False)
-                self._synch_childs(context, o, linked, childs)
-                self._synch_shutters(context, o, linked, True)
-                self._synch_shutters(context, o, linked, False)
-                if hole is not None:
-                    self._synch_hole(context, linked, hole)
+        for linked in linked_objects:
+            ld = archipack_window.datablock(linked)
+            ld.update_portal(context, linked)
+            ld.update_blind(context, linked, True)
+            ld.update_blind(context, linked, False)
+            self._synch_childs(context, o, linked, childs)
+            self._synch_shutters(context, o, linked, True)
+            self._synch_shutters(context, o, linked, False)
+            if hole is not None:
+                self._synch_hole(context, linked, hole)
 
     def get_shutter_row(self, x, y, left_side):
         n_shutters = self.shutter_left + self.shutter_right
@@ -2188,6 +2153,8 @@ class archipack_window(ArchipackObject, Manipulable, DimensionProvider, Property
         if o is None:
             return
 
+        update_versions.bump(o.name)
+
         self.setup_manipulators()
 
         if childs_only is False:
@@ -2221,7 +2188,7 @@ class archipack_window(ArchipackObject, Manipulable, DimensionProvider, Property
         self.add_dimension_point(3, Vector((0.5 * self._x + self.frame_x, y, 0)))
         
         # support for instances childs, update at object level
-        self.synch_childs(context, o)
+        self.synch_linked(context, o)
 
         # synch dimensions when apply
         if o.parent:
@@ -0,0 +1,120 @@
+# -*- coding:utf-8 -*-
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110- 1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+# ----------------------------------------------------------
+# Author: Stephen Leger (s-leger)
+#
+# ----------------------------------------------------------
+"""
+    Benchmark PolygonsUnionOp.filter_nested on large room layouts,
+    pairwise scan against ring hash map
+    Run from a plain python interpreter, pygeos does not depend on blender:
+    python benchmarks/bench_filter_nested.py
+"""
+import os
+import sys
+import time
+import random
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pygeos.geom import GeometryFactory
+from pygeos.shared import Coordinate, CoordinateSequence, sort_by_key
+from pygeos.op_polygonize import PolygonizeOp
+from pygeos.op_polygonsunion import PolygonsUnionOp
+
+
+def legacy_filter_nested(polys):
+    """
+        Pairwise scan as used before the hash map
+    """
+    sort_by_key(polys, PolygonsUnionOp.poly_area_key, reverse=True)
+    to_remove = []
+    n_polys = len(polys)
+    for i, poly in enumerate(polys):
+        if i in to_remove:
+            continue
+        for hole in poly.interiors:
+            for j in range(i + 1, n_polys):
+                other = polys[j]
+                if (hole.envelope.equals(other.envelope) and
+                        CoordinateSequence.equals_unoriented(hole.coords, other.exterior.coords)):
+                    to_remove.append(j)
+    to_remove.sort()
+    for i in reversed(to_remove):
+        polys.pop(i)
+
+
+def room_layout(n_rooms, seed=0):
+    """
+        Rows of rooms sharing walls, with columns, ducts and
+        nested furniture outlines inside rooms
+    """
+    factory = GeometryFactory()
+    rnd = random.Random(seed)
+    cols = int(n_rooms ** 0.5) + 1
+
+    def line(*pts):
+        return factory.createLineString([Coordinate(x, y) for x, y in pts])
+
+    lines = []
+    for k in range(n_rooms):
+        x, y = 6 * (k % cols), 5 * (k // cols)
+        # walls shared with next rooms, drawn once
+        lines.append(line((x, y), (x + 6, y)))
+        lines.append(line((x, y), (x, y + 5)))
+        if k % cols == cols - 1 or k == n_rooms - 1:
+            lines.append(line((x + 6, y), (x + 6, y + 5)))
+        if k + cols >= n_rooms:
+            lines.append(line((x, y + 5), (x + 6, y + 5)))
+        # column, start point rotated
+        s = rnd.uniform(0.2, 0.4)
+        pts = [(x + 1, y + 1), (x + 1 + s, y + 1), (x + 1 + s, y + 1 + s), (x + 1, y + 1 + s)]
+        r = rnd.randint(0, 3)
+        pts = pts[r:] + pts[:r]
+        lines.append(line(*(pts + pts[:1])))
+        # nested furniture
+        for d in range(rnd.randint(0, 2)):
+            w = 1.5 - 0.5 * d
+            pts = [(x + 3 - w / 2, y + 2.5 - w / 2), (x + 3 + w / 2, y + 2.5 - w / 2),
+                (x + 3 + w / 2, y + 2.5 + w / 2), (x + 3 - w / 2, y + 2.5 + w / 2)]
+            lines.append(line(*(pts + pts[:1])))
+    return lines
+
+
+def timeit(func, polys):
+    t = time.perf_counter()
+    func(polys)
+    return time.perf_counter() - t
+
+
+def bench(n_rooms):
+    polys = PolygonizeOp.polygonize(room_layout(n_rooms))
+    legacy, current = list(polys), list(polys)
+    t_legacy = timeit(legacy_filter_nested, legacy)
+    t_current = timeit(PolygonsUnionOp.filter_nested, current)
+    print("{} rooms  {} polygons  scan {:.3f}s ({} kept)  hash {:.3f}s ({} kept)  x{:.1f}  same:{}".format(
+        n_rooms, len(polys), t_legacy, len(legacy), t_current, len(current),
+        t_legacy / t_current, [id(p) for p in current] == [id(p) for p in legacy]))
+
+
+if __name__ == "__main__":
+    for n in (500, 2000, 5000):
+        bench(n)
@@ -0,0 +1,427 @@
+# -*- coding:utf-8 -*-
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110- 1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+# ----------------------------------------------------------
+# Author: Stephen Leger (s-leger)
+#
+# ----------------------------------------------------------
+"""
+    Benchmark archipack generators on every shipped preset
+    Run from a plain python interpreter, spawn one background
+    blender per class like ARCHIPACK_OT_render_thumbs.background_render:
+    python benchmarks/bench_generators.py --blender /path/to/blender --out bench.json
+    Compare with a previous run:
+    python benchmarks/bench_generators.py --out new.json --compare bench.json
+
+    Inside blender (what the launcher runs):
+    blender --background --factory-startup -noaudio --python benchmarks/bench_generators.py
+        -- addon:archipack cls:window scales:1,2,4 out:window.json
+
+    Each preset is created, then scaled and updated, update() time is split
+    by phase: pattern, bmesh, cut, modifiers, childs, other.
+    Phase time is exclusive, nested calls are accounted in the inner phase.
+    peak_rss_kb is the process high water mark at end of run.
+"""
+import os
+import sys
+import json
+import time
+import importlib
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CLASSES = ('roof', 'floor', 'stair', 'fence', 'window', 'door', 'kitchen', 'blind', 'molding')
+SCALES = (1, 2, 4)
+
+# phase: (module, class.method) wrapped with timers
+PHASES = (
+    ('pattern', (
+        ('archipack_floor', 'FloorGenerator.generate_pattern'),
+        ('archipack_roof', 'RoofGenerator.make_roof'),
+        ('archipack_roof', 'RoofGenerator.couverture'),
+        ('archipack_roof', 'RoofGenerator.lambris'),
+        ('archipack_roof', 'RoofGenerator.rafter'),
+        ('archipack_stair', 'StairGenerator.make_stair'),
+        ('archipack_stair', 'StairGenerator.make_part'),
+        ('archipack_stair', 'StairGenerator.make_post'),
+        ('archipack_stair', 'StairGenerator.make_subs'),
+        ('archipack_stair', 'StairGenerator.make_panels'),
+        ('archipack_fence', 'FenceGenerator.make_post'),
+        ('archipack_fence', 'FenceGenerator.make_subs'),
+        ('archipack_fence', 'FenceGenerator.make_panels'),
+        ('archipack_fence', 'FenceGenerator.make_profile'),
+        ('archipack_molding', 'MoldingGenerator.make_profile'),
+        )),
+    ('bmesh', (
+        ('bmesh_utils', 'BmeshEdit.buildmesh'),
+        ('bmesh_utils', 'BmeshEdit.buildmesh_bulk'),
+        ('bmesh_utils', 'BmeshEdit.addmesh'),
+        ('bmesh_utils', 'BmeshEdit.bmesh_join'),
+        )),
+    ('cut', (
+        ('bmesh_utils', 'BmeshEdit.bissect'),
+        ('archipack_cutter', 'CutAbleGenerator.cull'),
+        ('archipack_cutter', 'CutAbleGenerator.bissect'),
+        ('archipack_cutter', 'CutAbleGenerator.cut_holes'),
+        ('archipack_cutter', 'CutAbleGenerator.cut_boundary'),
+        )),
+    ('modifiers', (
+        ('bmesh_utils', 'BmeshEdit.solidify'),
+        ('bmesh_utils', 'BmeshEdit.bevel'),
+        ('archipack_autoboolean', 'ArchipackBoolManager.autoboolean'),
+        )),
+    ('childs', (
+        ('archipack_window', 'archipack_window.update_childs'),
+        ('archipack_window', 'archipack_window.update_shutter'),
+        ('archipack_window', 'archipack_window.synch_childs'),
+        ('archipack_door', 'archipack_door.update_childs'),
+        ('archipack_door', 'archipack_door.synch_childs'),
+        ('archipack_kitchen', 'archipack_kitchen.update_childs'),
+        )),
+    )
+
+# properties scaled to grow generators output: (collection or '', property)
+EXTENTS = {
+    'roof': (('parts', 'length'), ),
+    'floor': (('parts', 'length'), ),
+    'stair': (('', 'height'), ('parts', 'length')),
+    'fence': (('parts', 'length'), ),
+    'window': (('', 'x'), ('', 'z')),
+    'door': (('', 'x'), ('', 'z')),
+    'kitchen': (('cabinets', 'x'), ),
+    'blind': (('', 'x'), ('', 'z')),
+    'molding': (('parts', 'length'), ),
+    }
+
+
+class PhaseTimer():
+    """
+        Exclusive timer, time spent in nested phases
+        is not accounted in the outer one
+    """
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.stack = []
+        self.times = {}
+        self.calls = {}
+        self.last = time.perf_counter()
+
+    def enter(self, phase):
+        t = time.perf_counter()
+        if self.stack:
+            top = self.stack[-1]
+            self.times[top] = self.times.get(top, 0) + t - self.last
+        self.stack.append(phase)
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+        self.last = t
+
+    def exit(self):
+        t = time.perf_counter()
+        phase = self.stack.pop()
+        self.times[phase] = self.times.get(phase, 0) + t - self.last
+        self.last = t
+
+    def result(self, total):
+        res = {phase: self.times.get(phase, 0) for phase, targets in PHASES}
+        res['other'] = max(0, total - sum(res.values()))
+        return res
+
+
+def timed(timer, phase, func):
+    def wrapper(*args, **kwargs):
+        timer.enter(phase)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            timer.exit()
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    return wrapper
+
+
+def instrument(timer, addon):
+    """
+        Wrap phases targets, skip the ones missing in this version
+    """
+    wrapped = []
+    for phase, targets in PHASES:
+        for mod_name, attr in targets:
+            try:
+                mod = importlib.import_module(addon + "." + mod_name)
+            except ImportError:
+                continue
+            cls_name, name = attr.split(".")
+            cls = getattr(mod, cls_name, None)
+            if cls is None or name not in cls.__dict__:
+                continue
+            func = cls.__dict__[name]
+            if isinstance(func, staticmethod):
+                setattr(cls, name, staticmethod(timed(timer, phase, func.__func__)))
+            else:
+                setattr(cls, name, timed(timer, phase, func))
+            wrapped.append(attr)
+    return wrapped
+
+
+def peak_rss():
+    try:
+        import resource
+    except ImportError:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+# ----------------------------------------------------------
+# Blender side
+# ----------------------------------------------------------
+
+
+def mesh_stats(context, o):
+    import bpy
+    verts, faces, objs = 0, 0, 0
+    stack = [o]
+    while stack:
+        c = stack.pop()
+        stack.extend(c.children)
+        objs += 1
+        if c.type not in {'MESH', 'CURVE'}:
+            continue
+        try:
+            me = c.to_mesh(context.scene, True, 'PREVIEW')
+        except RuntimeError:
+            continue
+        if me is not None:
+            verts += len(me.vertices)
+            faces += len(me.polygons)
+            bpy.data.meshes.remove(me)
+    return objs, verts, faces
+
+
+def extents(d, cls):
+    res = []
+    for coll, prop in EXTENTS.get(cls, ()):
+        items = [d] if coll == '' else getattr(d, coll)
+        res.append([getattr(item, prop) for item in items])
+    return res
+
+
+def set_extents(d, cls, base, scale):
+    d.auto_update = False
+    for (coll, prop), values in zip(EXTENTS.get(cls, ()), base):
+        items = [d] if coll == '' else getattr(d, coll)
+        for item, value in zip(items, values):
+            setattr(item, prop, value * scale)
+    d.auto_update = True
+
+
+def run_preset(context, timer, cls, preset, scales):
+    import bpy
+    bpy.ops.object.select_all(action="SELECT")
+    bpy.ops.object.delete()
+
+    t = time.perf_counter()
+    getattr(bpy.ops.archipack, cls)('INVOKE_DEFAULT', filepath=preset, auto_manipulate=False)
+    create = time.perf_counter() - t
+
+    o = context.active_object
+    d = getattr(o.data, "archipack_" + cls)[0]
+    base = extents(d, cls)
+    runs = []
+    for scale in scales:
+        set_extents(d, cls, base, scale)
+        o.select = True
+        context.scene.objects.active = o
+        timer.reset()
+        t = time.perf_counter()
+        d.update(context)
+        timer.enter('modifiers')
+        context.scene.update()
+        timer.exit()
+        total = time.perf_counter() - t
+        objs, verts, faces = mesh_stats(context, o)
+        runs.append({
+            'scale': scale,
+            'total': total,
+            'phases': timer.result(total),
+            'calls': dict(timer.calls),
+            'objects': objs,
+            'verts': verts,
+            'faces': faces,
+            'peak_rss_kb': peak_rss()
+            })
+    return {
+        'cls': cls,
+        'preset': os.path.splitext(os.path.basename(preset))[0],
+        'create': create,
+        'runs': runs
+        }
+
+
+def blender_main(argv):
+    import bpy
+    addon, classes, scales, out, matlib = os.path.basename(ROOT), CLASSES, SCALES, None, None
+    for arg in argv:
+        if arg.startswith("addon:"):
+            addon = arg[6:]
+        elif arg.startswith("cls:"):
+            classes = arg[4:].split(",")
+        elif arg.startswith("scales:"):
+            scales = [float(s) for s in arg[7:].split(",")]
+        elif arg.startswith("out:"):
+            out = arg[4:]
+        elif arg.startswith("matlib:"):
+            matlib = arg[7:]
+
+    # allow to run from a source tree, not installed
+    sys.path.insert(0, os.path.dirname(ROOT))
+    bpy.ops.wm.addon_enable(module=addon)
+    if matlib is not None:
+        bpy.context.user_preferences.addons[addon].preferences.matlib_path = matlib
+
+    timer = PhaseTimer()
+    wrapped = instrument(timer, addon)
+    mod = importlib.import_module(addon)
+    results = []
+    for cls in classes:
+        folder = os.path.join(ROOT, "presets", "archipack_" + cls)
+        if not os.path.isdir(folder):
+            continue
+        for f in sorted(os.listdir(folder)):
+            if not f.endswith(".py"):
+                continue
+            preset = os.path.join(folder, f)
+            try:
+                res = run_preset(bpy.context, timer, cls, preset, scales)
+            except Exception as ex:
+                res = {'cls': cls, 'preset': f[:-3], 'error': str(ex)}
+            print("[bench] %s %s" % (cls, res['preset']))
+            results.append(res)
+
+    report = {
+        'blender': bpy.app.version_string,
+        'version': ".".join(str(v) for v in mod.bl_info['version']),
+        'wrapped': wrapped,
+        'results': results
+        }
+    if out is None:
+        print(json.dumps(report, indent=1))
+    else:
+        with open(out, 'w') as f:
+            json.dump(report, f, indent=1)
+
+
+# ----------------------------------------------------------
+# Launcher side
+# ----------------------------------------------------------
+
+
+def key(res, run):
+    return "%s/%s/%s" % (res['cls'], res['preset'], run['scale'])
+
+
+def compare(old, new):
+    """
+        Print total and phases ratio new / old
+    """
+    runs = {}
+    for res in old['results']:
+        for run in res.get('runs', ()):
+            runs[key(res, run)] = run
+    print("%-40s %9s %9s %7s  %s" % ("preset/scale", "old", "new", "ratio", "phases ratio"))
+    for res in new['results']:
+        for run in res.get('runs', ()):
+            ref = runs.get(key(res, run))
+            if ref is None:
+                continue
+            phases = " ".join(
+                "%s:%.2f" % (phase, t / ref['phases'][phase])
+                for phase, t in run['phases'].items()
+                if ref['phases'].get(phase, 0) > 1e-4)
+            print("%-40s %8.3fs %8.3fs %7.2f  %s" % (
+                key(res, run), ref['total'], run['total'], run['total'] / max(1e-9, ref['total']), phases))
+
+
+def main():
+    import argparse
+    import subprocess
+    import tempfile
+    parser = argparse.ArgumentParser(description="Benchmark archipack generators")
+    parser.add_argument("--blender", default=os.environ.get("BLENDER", "blender"))
+    parser.add_argument("--addon", default=os.path.basename(ROOT))
+    parser.add_argument("--classes", default=",".join(CLASSES))
+    parser.add_argument("--scales", default=",".join(str(s) for s in SCALES))
+    parser.add_argument("--matlib", default=None)
+    parser.add_argument("--out", default="bench_generators.json")
+    parser.add_argument("--compare", default=None)
+    args = parser.parse_args()
+
+    report = None
+    tmp = tempfile.mkdtemp()
+    for cls in args.classes.split(","):
+        out = os.path.join(tmp, cls + ".json")
+        # one process for each class, so peak memory does not leak between classes
+        cmd = [
+            args.blender,
+            "--background",
+            "--factory-startup",
+            "-noaudio",
+            "--python", os.path.abspath(__file__),
+            "--",
+            "addon:" + args.addon,
+            "cls:" + cls,
+            "scales:" + args.scales,
+            "out:" + out
+            ]
+        if args.matlib is not None:
+            cmd.append("matlib:" + args.matlib)
+        subprocess.call(cmd)
+        if not os.path.exists(out):
+            print("[bench] %s failed" % cls)
+            continue
+        with open(out) as f:
+            res = json.load(f)
+        if report is None:
+            report = res
+        else:
+            report['results'].extend(res['results'])
+
+    if report is None:
+        return
+    with open(args.out, 'w') as f:
+        json.dump(report, f, indent=1)
+
+    if args.compare is not None:
+        with open(args.compare) as f:
+            compare(json.load(f), report)
+
+
+if __name__ == "__main__":
+    try:
+        import bpy
+    except ImportError:
+        bpy = None
+    if bpy is None:
+        main()
+    else:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+        blender_main(argv)
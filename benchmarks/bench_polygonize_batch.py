@@ -0,0 +1,133 @@
+# -*- coding:utf-8 -*-
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110- 1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+# ----------------------------------------------------------
+# Author: Stephen Leger (s-leger)
+#
+# ----------------------------------------------------------
+"""
+    Benchmark polygonize_batch on site plan like inputs
+    in this process and in a fork process pool,
+    check it against Polygonizer.polygonize
+    Split relies on mathutils, run inside blender:
+    blender --background --factory-startup -noaudio --python benchmarks/bench_polygonize_batch.py
+        -- addon:archipack
+"""
+import os
+import sys
+import time
+import random
+import importlib
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def site_plan(n_rooms, seed=0):
+    """
+        Buildings made of rectangular rooms sharing walls, drawn as closed
+        polylines with small gaps, spread over a site
+    """
+    rnd = random.Random(seed)
+    size = 10.0 * n_rooms ** 0.5
+    lines = []
+    while len(lines) < n_rooms:
+        x, y = rnd.uniform(-size, size), rnd.uniform(-size, size)
+        for i in range(rnd.randint(1, 6)):
+            for j in range(rnd.randint(1, 4)):
+                x0, y0 = x + 4 * i, y + 5 * j
+                gap = rnd.choice((0, 0, 0.005))
+                lines.append([(x0, y0 + gap, 0), (x0 + 4, y0, 0), (x0 + 4, y0 + 5, 0),
+                    (x0, y0 + 5, 0), (x0, y0 + gap, 0)])
+    return lines[:n_rooms]
+
+
+def bench(polygonize_batch, n_rooms, max_workers):
+    lines = site_plan(n_rooms)
+    t = time.perf_counter()
+    ref, invalids = polygonize_batch(lines, extend=0.01, max_workers=0)
+    t_serial = time.perf_counter() - t
+    t = time.perf_counter()
+    res, invalids = polygonize_batch(lines, extend=0.01, max_workers=max_workers)
+    t_pool = time.perf_counter() - t
+    print("{} rooms  {} polygons  serial {:.3f}s  pool({}) {:.3f}s  x{:.2f}  same:{}".format(
+        n_rooms, len(ref), t_serial, max_workers, t_pool, t_serial / t_pool, polygons_key(ref) == polygons_key(res)))
+
+
+def polygons_key(polys):
+    """
+        Order independent key of polygons, rings may start anywhere
+    """
+    key = []
+    for poly in polys:
+        env = poly.envelope
+        key.append((
+            round(env.minx, 4), round(env.miny, 4),
+            round(env.maxx, 4), round(env.maxy, 4),
+            round(poly.area, 6), len(poly.interiors)))
+    return sorted(key)
+
+
+def check_split(context, Polygonizer, n_rooms):
+    """
+        Compare polygonize_batch with Polygonizer.polygonize on curves
+    """
+    import bpy
+    curves = []
+    for i, line in enumerate(site_plan(n_rooms)):
+        cu = bpy.data.curves.new("Room", type='CURVE')
+        spline = cu.splines.new('POLY')
+        spline.points.add(len(line) - 1)
+        for p, (x, y, z) in zip(spline.points, line):
+            p.co = (x, y, z, 1)
+        o = bpy.data.objects.new("Room", cu)
+        context.scene.objects.link(o)
+        curves.append(o)
+    context.scene.update()
+    t = time.perf_counter()
+    coordsys, ref, dangles, cuts, invalids = Polygonizer.polygonize(context, curves, extend=0.01)
+    t_split = time.perf_counter() - t
+    t = time.perf_counter()
+    coordsys, res, invalids = Polygonizer.polygonize_batch(context, curves, extend=0.01)
+    t_batch = time.perf_counter() - t
+    print("{} rooms  split {} polygons {:.3f}s  batch {} polygons {:.3f}s  same:{}".format(
+        n_rooms, len(ref), t_split, len(res), t_batch, polygons_key(ref) == polygons_key(res)))
+
+
+def blender_main(argv):
+    import bpy
+    addon = os.path.basename(ROOT)
+    for arg in argv:
+        if arg.startswith("addon:"):
+            addon = arg[6:]
+    # allow to run from a source tree, not installed
+    sys.path.insert(0, os.path.dirname(ROOT))
+    bpy.ops.wm.addon_enable(module=addon)
+    polylines = importlib.import_module(addon + ".archipack_polylines")
+    batch = importlib.import_module(addon + ".polygonize_batch")
+    for n in (100, 1000):
+        check_split(bpy.context, polylines.Polygonizer, n)
+    for n in (1000, 5000, 20000):
+        bench(batch.polygonize_batch, n, None)
+
+
+if __name__ == "__main__":
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    blender_main(argv)
@@ -0,0 +1,103 @@
+# -*- coding:utf-8 -*-
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110- 1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+# ----------------------------------------------------------
+# Author: Stephen Leger (s-leger)
+#
+# ----------------------------------------------------------
+"""
+    Benchmark Polygonizer holes to shells assignment,
+    linear scan against spatial index
+    Run from a plain python interpreter, pygeos does not depend on blender:
+    python benchmarks/bench_polygonize_holes.py
+"""
+import os
+import sys
+import time
+import random
+from math import cos, sin, pi
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pygeos.geom import GeometryFactory
+from pygeos.shared import Coordinate
+from pygeos.op_polygonize import Polygonizer, EdgeRing, EdgeRingIndex
+
+
+def ring(factory, cx, cy, radius, n_pts):
+    coords = [
+        Coordinate(cx + radius * cos(2 * pi * i / n_pts), cy + radius * sin(2 * pi * i / n_pts))
+        for i in range(n_pts)
+        ]
+    coords.append(coords[0])
+    return factory.createLineString(coords)
+
+
+def site_plan(n_rings, seed=0):
+    """
+        Disjoint rooms holding cells, holding furniture outlines,
+        rooms outlines are detailed
+    """
+    factory = GeometryFactory()
+    rnd = random.Random(seed)
+    size = 12 * int(n_rings ** 0.5)
+    lines = []
+    x, y = 0, 0
+    while len(lines) < n_rings:
+        lines.append(ring(factory, x, y, 5, rnd.choice((4, 8, 64))))
+        for depth in range(rnd.randint(0, 3)):
+            lines.append(ring(factory, x, y, 4 - depth, rnd.choice((4, 6, 12))))
+        x += 12
+        if x > size:
+            x = 0
+            y += 12
+    return lines[:n_rings]
+
+
+def timeit(func, *args):
+    t = time.perf_counter()
+    res = func(*args)
+    return time.perf_counter() - t, res
+
+
+def assign_legacy(holes, shells):
+    return [EdgeRing.findEdgeRingContaining(hole, shells) for hole in holes]
+
+
+def assign_index(holes, shells):
+    index = EdgeRingIndex(shells)
+    return [index.findEdgeRingContaining(hole) for hole in holes]
+
+
+def bench(n_rings):
+    op = Polygonizer(False)
+    op.addGeometryList(site_plan(n_rings))
+    t_full, polys = timeit(op.getPolygons)
+    holes, shells = op.holeList, op.exteriorList
+    t_legacy, legacy = timeit(assign_legacy, holes, shells)
+    t_index, index = timeit(assign_index, holes, shells)
+    same = all(a is b for a, b in zip(legacy, index))
+    print("{} rings  {} holes  {} shells  polygonize {:.3f}s  assign: scan {:.3f}s  index {:.3f}s  x{:.1f}  same:{}".format(
+        n_rings, len(holes), len(shells), t_full, t_legacy, t_index, t_legacy / t_index, same))
+
+
+if __name__ == "__main__":
+    for n in (1000, 10000):
+        bench(n)
@@ -0,0 +1,106 @@
+# -*- coding:utf-8 -*-
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110- 1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+# ----------------------------------------------------------
+# Author: Stephen Leger (s-leger)
+#
+# ----------------------------------------------------------
+"""
+    Benchmark opening vs wall intersects predicate
+    as in ArchipackBoolManager.autoboolean, a wall with 200 openings
+    RAW: Geometry.intersects, full relate for each hole
+    PREPARED: wall prepared once, RectangleIntersects for axis aligned holes
+    Run from a plain python interpreter:
+    python benchmarks/bench_prepared_wall.py
+"""
+import time
+from math import cos, sin, pi
+from bench_spatialindex import package
+import importlib
+geom = importlib.import_module(package.__name__ + ".pygeos.geom")
+prepared = importlib.import_module(package.__name__ + ".pygeos.prepared")
+
+gf = geom.GeometryFactory()
+N_OPENINGS = 200
+
+
+def polygon(pts, angle=0):
+    ca, sa = cos(angle), sin(angle)
+    coords = [gf.createCoordinate((ca * x - sa * y, sa * x + ca * y, 0)) for x, y in pts]
+    coords.append(coords[0].clone())
+    return gf.createPolygon(gf.createLinearRing(coords), [])
+
+
+def opening(x, y, width=0.9, depth=0.4, angle=0):
+    return polygon([(x, y), (x + width, y), (x + width, y + depth), (x, y + depth)], angle)
+
+
+def straight_wall(angle=0, thickness=0.2):
+    """
+        Straight wall with openings, one out of 4 belong to a parallel
+        neighboor wall, inside wall bounding box
+    """
+    length = N_OPENINGS * 1.5
+    wall = polygon([(0, 0), (length, 0), (length, thickness), (0, thickness)], angle)
+    holes = [opening(0.3 + 1.5 * i, -0.1 if i % 4 else thickness + 0.05, angle=angle)
+        for i in range(N_OPENINGS)]
+    return wall, holes
+
+
+def zigzag_wall(n_parts=100, thickness=0.2):
+    """
+        Polyline wall made of n_parts segments
+    """
+    part = N_OPENINGS * 1.5 / n_parts
+    top = [(i * part, 0.3 * (i % 2)) for i in range(n_parts + 1)]
+    bottom = [(x, y + thickness) for x, y in reversed(top)]
+    wall = polygon(top + bottom)
+    holes = [opening(0.3 + 1.5 * i, -0.5 if i % 4 else 1, depth=1.0) for i in range(N_OPENINGS)]
+    return wall, holes
+
+
+def raw(wall, holes):
+    return [wall.intersects(hole) for hole in holes]
+
+
+def prepared_wall(wall, holes):
+    prep = prepared.PreparedGeometryFactory.prepare(wall)
+    return [prepared.RectangleIntersects.intersects(hole, wall)
+        if hole.is_rectangle else prep.intersects(hole)
+        for hole in holes]
+
+
+def bench(name, wall, holes):
+    t = time.perf_counter()
+    ref = raw(wall, holes)
+    t_raw = time.perf_counter() - t
+    t = time.perf_counter()
+    res = prepared_wall(wall, holes)
+    t_prep = time.perf_counter() - t
+    print("{}  {} openings ({} intersecting)  RAW {:.0f} tests/s  PREPARED {:.0f} tests/s  x{:.2f}  same:{}".format(
+        name, len(holes), sum(ref), len(holes) / t_raw, len(holes) / t_prep, t_raw / t_prep, ref == res))
+
+
+if __name__ == "__main__":
+    bench("straight", *straight_wall())
+    bench("rotated", *straight_wall(angle=pi / 6))
+    bench("zigzag", *zigzag_wall())
@@ -0,0 +1,116 @@
+# -*- coding:utf-8 -*-
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110- 1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+# ----------------------------------------------------------
+# Author: Stephen Leger (s-leger)
+#
+# ----------------------------------------------------------
+"""
+    Benchmark binary buffer transport of geometries
+    against pickle of geometry objects
+    Run from a plain python interpreter, pygeos does not depend on blender:
+    python benchmarks/bench_pygeos_buffer.py
+"""
+import os
+import sys
+import time
+import pickle
+import random
+from multiprocessing import shared_memory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pygeos.geom import GeometryFactory
+from pygeos.shared import Coordinate
+from pygeos import io_binary
+
+
+def rooms(n_rooms, seed=0):
+    """
+        Rooms as polygons with a few holes, 8 to 32 points by ring
+    """
+    factory = GeometryFactory()
+    rnd = random.Random(seed)
+
+    def ring(x, y, r, n):
+        coords = [Coordinate(x + r * rnd.uniform(0.8, 1), y + r * rnd.uniform(0.8, 1), rnd.random())
+            for i in range(n)]
+        coords.append(coords[0].clone())
+        return factory.createLinearRing(coords)
+
+    return [
+        factory.createPolygon(
+            ring(10 * k, 0, 4, rnd.randint(8, 32)),
+            [ring(10 * k, 0, 1, 8) for i in range(rnd.randint(0, 3))])
+        for k in range(n_rooms)
+        ]
+
+
+def timeit(func, *args):
+    t = time.perf_counter()
+    res = func(*args)
+    return time.perf_counter() - t, res
+
+
+def object_pickle(geoms, factory):
+    data = pickle.dumps(geoms, pickle.HIGHEST_PROTOCOL)
+    return data, pickle.loads(data)
+
+
+def buffer_pickle(geoms, factory):
+    data = pickle.dumps(io_binary.geometries_to_buffer(geoms), pickle.HIGHEST_PROTOCOL)
+    return data, io_binary.geometries_from_buffer(pickle.loads(data), factory)
+
+
+def shared_transport(geoms, factory):
+    shm = shared_memory.SharedMemory(create=True, size=io_binary.buffer_size(geoms))
+    try:
+        io_binary.write_buffer(geoms, shm.buf)
+        # a worker attaches to shm.name and reads in place
+        reader = shared_memory.SharedMemory(name=shm.name)
+        try:
+            res = io_binary.geometries_from_buffer(reader.buf, factory)
+        finally:
+            reader.close()
+    finally:
+        shm.close()
+        shm.unlink()
+    return shm.size, res
+
+
+def bench(n_rooms):
+    geoms = rooms(n_rooms)
+    factory = GeometryFactory()
+    t_obj, (obj, res0) = timeit(object_pickle, geoms, factory)
+    t_pkl, (pkl, res1) = timeit(buffer_pickle, geoms, factory)
+    t_buf, buf = timeit(io_binary.geometries_to_buffer, geoms)
+    t_read, res2 = timeit(io_binary.geometries_from_buffer, buf, factory)
+    t_shm, (size, res3) = timeit(shared_transport, geoms, factory)
+    # same coords and structure
+    same = all(io_binary.geometries_to_buffer(res) == buf for res in (res0, res1, res2, res3))
+    print("{} rooms  object pickle {:.3f}s {}kB  buffer pickle {:.3f}s {}kB  "
+        "buffer write {:.3f}s read {:.3f}s  shared memory {:.3f}s {}kB  same:{}".format(
+        n_rooms, t_obj, len(obj) >> 10, t_pkl, len(pkl) >> 10,
+        t_buf, t_read, t_shm, size >> 10, same))
+
+
+if __name__ == "__main__":
+    for n in (1000, 10000):
+        bench(n)
@@ -0,0 +1,124 @@
+# -*- coding:utf-8 -*-
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110- 1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+# ----------------------------------------------------------
+# Author: Stephen Leger (s-leger)
+#
+# ----------------------------------------------------------
+"""
+    Benchmark memory and allocation time of pygeos coordinates
+    Compare slotted Coordinate and array backed PackedCoordinateSequence
+    with the former __dict__ based Coordinate:
+    python benchmarks/bench_pygeos_coords.py
+"""
+import os
+import sys
+import time
+import random
+import tracemalloc
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pygeos.geom import GeometryFactory
+from pygeos.shared import Coordinate, CoordinateSequence, PackedCoordinateSequence
+
+
+class DictCoordinate():
+    """
+        Coordinate as defined before __slots__
+    """
+    def __init__(self, x=0, y=0, z=0):
+        self.x = x
+        self.y = y
+        self.z = z
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    t = time.perf_counter()
+    res = func(*args)
+    t = time.perf_counter() - t
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return res, size, t
+
+
+def dict_coords(pts):
+    return [DictCoordinate(x, y, z) for x, y, z in pts]
+
+
+def slot_coords(pts):
+    return CoordinateSequence([Coordinate(x, y, z) for x, y, z in pts])
+
+
+def packed_coords(pts):
+    return PackedCoordinateSequence(pts)
+
+
+def bench_coords(n):
+    rnd = random.Random(0)
+    pts = [(rnd.random(), rnd.random(), 0.0) for i in range(n)]
+    print("{} coordinates".format(n))
+    for name, func in (
+            ("dict Coordinate", dict_coords),
+            ("slotted Coordinate", slot_coords),
+            ("PackedCoordinateSequence", packed_coords)):
+        res, size, t = measure(func, pts)
+        print("  {:26} {:>7.1f} bytes/vertex  {:.4f}s".format(name, size / n, t))
+
+
+def wall_plan(n_walls):
+    """
+        Random axis aligned wall segments noded and polygonized
+        as archipack_polylines does for wall plans
+    """
+    factory = GeometryFactory()
+    rnd = random.Random(1)
+    lines = []
+    for i in range(n_walls):
+        x, y = 20 * rnd.random(), 20 * rnd.random()
+        if i % 2 == 0:
+            coords = [Coordinate(x, y), Coordinate(x + 1 + 4 * rnd.random(), y)]
+        else:
+            coords = [Coordinate(x, y), Coordinate(x, y + 1 + 4 * rnd.random())]
+        lines.append(factory.createLineString(coords))
+    geom = factory.buildGeometry(lines)
+    return lines[0].union(geom)
+
+
+def bench_plan(n_walls):
+    tracemalloc.start()
+    t = time.perf_counter()
+    wall_plan(n_walls)
+    t = time.perf_counter() - t
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print("wall plan {} walls  peak {:.2f} MB  {:.4f}s".format(n_walls, peak / 1048576, t))
+
+
+if __name__ == "__main__":
+    print("sizeof Coordinate {} bytes, dict Coordinate {} bytes".format(
+        sys.getsizeof(Coordinate()),
+        sys.getsizeof(DictCoordinate()) + sys.getsizeof(DictCoordinate().__dict__)
+        ))
+    for n in (10000, 100000, 1000000):
+        bench_coords(n)
+    for n in (100, 300):
+        bench_plan(n)
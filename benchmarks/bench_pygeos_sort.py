@@ -0,0 +1,179 @@
+# -*- coding:utf-8 -*-
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110- 1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+# ----------------------------------------------------------
+# Author: Stephen Leger (s-leger)
+#
+# ----------------------------------------------------------
+"""
+    Benchmark pygeos sorting layer against legacy recursive quicksort
+    Run from a plain python interpreter, pygeos does not depend on blender:
+    python benchmarks/bench_pygeos_sort.py
+"""
+import os
+import sys
+import time
+import random
+from math import cos, sin, pi
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pygeos import (
+    shared, algorithms, geomgraph, noding,
+    op_buffer, op_polygonsunion, index_intervaltree
+    )
+from pygeos.geom import GeometryFactory
+from pygeos.shared import Coordinate, sort_by_key, sort_by_cmp
+
+
+# modules using the sorting layer
+PATCHED = [algorithms, geomgraph, noding, op_buffer, op_polygonsunion, index_intervaltree]
+
+
+def legacy_quicksort(array, sortFunc, begin=0, end=None):
+    """
+        Recursive Lomuto quicksort as used before the sorting layer
+    """
+    if end is None:
+        end = len(array) - 1
+
+    def _partition(array, begin, end):
+        pivot = begin
+        for i in range(begin + 1, end + 1):
+            if sortFunc(array[i], array[begin]):
+                pivot += 1
+                array[i], array[pivot] = array[pivot], array[i]
+        array[pivot], array[begin] = array[begin], array[pivot]
+        return pivot
+
+    def _quicksort(array, begin, end):
+        if begin >= end:
+            return
+        pivot = _partition(array, begin, end)
+        _quicksort(array, begin, pivot - 1)
+        _quicksort(array, pivot + 1, end)
+
+    return _quicksort(array, begin, end)
+
+
+def legacy_sort_by_key(array, key, reverse=False, begin=0, end=None):
+    if reverse:
+        legacy_quicksort(array, lambda a, b: key(a) > key(b), begin, end)
+    else:
+        legacy_quicksort(array, lambda a, b: key(a) < key(b), begin, end)
+
+
+def legacy_sort_by_cmp(array, cmp=shared.compareTo, reverse=False, begin=0, end=None):
+    if reverse:
+        legacy_quicksort(array, lambda a, b: cmp(a, b) > 0, begin, end)
+    else:
+        legacy_quicksort(array, lambda a, b: cmp(a, b) < 0, begin, end)
+
+
+def use_sort(by_key, by_cmp):
+    for module in PATCHED:
+        if hasattr(module, "sort_by_key"):
+            module.sort_by_key = by_key
+        if hasattr(module, "sort_by_cmp"):
+            module.sort_by_cmp = by_cmp
+
+
+def timeit(func, *args):
+    t = time.perf_counter()
+    try:
+        func(*args)
+    except RecursionError:
+        return None
+    return time.perf_counter() - t
+
+
+def fmt(t):
+    if t is None:
+        return "RecursionError"
+    return "{:.4f}s".format(t)
+
+
+class Item():
+    def __init__(self, segmentIndex, dist):
+        self.segmentIndex = segmentIndex
+        self.dist = dist
+
+    def compareTo(self, other):
+        if self.segmentIndex != other.segmentIndex:
+            return -1 if self.segmentIndex < other.segmentIndex else 1
+        if self.dist != other.dist:
+            return -1 if self.dist < other.dist else 1
+        return 0
+
+
+def bench_sort(n):
+    rnd = random.Random(0)
+    key = geomgraph.EdgeIntersection.sort_key
+    cases = {
+        "random": [Item(rnd.randint(0, n), rnd.random()) for i in range(n)],
+        "sorted": [Item(i, 0) for i in range(n)]
+        }
+    print("sort {} items".format(n))
+    for name, items in cases.items():
+        print("  {:8} legacy quicksort {:>16}  sort_by_cmp {:>10}  sort_by_key {:>10}".format(
+            name,
+            fmt(timeit(legacy_sort_by_cmp, list(items))),
+            fmt(timeit(sort_by_cmp, list(items))),
+            fmt(timeit(sort_by_key, list(items), key))
+            ))
+
+
+def random_polygon(factory, rnd, cx, cy, radius, n_pts):
+    coords = []
+    for i in range(n_pts):
+        a = 2 * pi * i / n_pts
+        r = radius * (0.7 + 0.3 * rnd.random())
+        coords.append(Coordinate(cx + r * cos(a), cy + r * sin(a)))
+    coords.append(Coordinate(coords[0].x, coords[0].y))
+    return factory.createPolygon(factory.createLinearRing(coords))
+
+
+def overlay_buffer(n_polys, n_pts):
+    factory = GeometryFactory()
+    rnd = random.Random(1)
+    polys = [
+        random_polygon(factory, rnd, 20 * rnd.random(), 20 * rnd.random(), 2, n_pts)
+        for i in range(n_polys)
+        ]
+    res = polys[0]
+    for poly in polys[1:]:
+        res = res.union(poly)
+    res.buffer(0.25)
+
+
+def bench_ops(n_polys, n_pts):
+    print("overlay + buffer {} polygons of {} points".format(n_polys, n_pts))
+    use_sort(legacy_sort_by_key, legacy_sort_by_cmp)
+    legacy = timeit(overlay_buffer, n_polys, n_pts)
+    use_sort(sort_by_key, sort_by_cmp)
+    current = timeit(overlay_buffer, n_polys, n_pts)
+    print("  legacy quicksort {:>16}  sorting layer {:>10}".format(fmt(legacy), fmt(current)))
+
+
+if __name__ == "__main__":
+    for n in (1000, 10000, 100000):
+        bench_sort(n)
+    for n_polys, n_pts in ((20, 50), (40, 200)):
+        bench_ops(n_polys, n_pts)
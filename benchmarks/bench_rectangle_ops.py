@@ -0,0 +1,116 @@
+# -*- coding:utf-8 -*-
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110- 1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+# ----------------------------------------------------------
+# Author: Stephen Leger (s-leger)
+#
+# ----------------------------------------------------------
+"""
+    Benchmark rectangle fast paths of Geometry intersects, contains
+    and intersection against relate / overlay
+    Run from a plain python interpreter, pygeos does not depend on blender:
+    python benchmarks/bench_rectangle_ops.py
+"""
+import os
+import sys
+import time
+import random
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pygeos.geom import GeometryFactory
+from pygeos.shared import Coordinate
+from pygeos.op_binary import BinaryOp
+from pygeos.op_overlay import OverlayOp, overlayOp
+
+
+def polygon(factory, pts):
+    coords = [Coordinate(x, y) for x, y in pts]
+    coords.append(coords[0].clone())
+    return factory.createPolygon(factory.createLinearRing(coords))
+
+
+def openings_on_walls(n, seed=0):
+    """
+        Openings bounding boxes against wall segments,
+        straight walls are rectangles, corner walls are L shaped
+    """
+    factory = GeometryFactory()
+    rnd = random.Random(seed)
+    pairs = []
+    for i in range(n):
+        x, y = rnd.uniform(0, 100), rnd.uniform(0, 100)
+        w = rnd.uniform(0.6, 2.4)
+        ox = x + rnd.uniform(-1, 5)
+        box = polygon(factory, [(ox, y - 0.3), (ox + w, y - 0.3), (ox + w, y + 0.5), (ox, y + 0.5)])
+        if i % 3:
+            wall = polygon(factory, [(x, y), (x + 5, y), (x + 5, y + 0.2), (x, y + 0.2)])
+        else:
+            wall = polygon(factory, [(x, y), (x + 5, y), (x + 5, y + 5), (x + 4.8, y + 5),
+                (x + 4.8, y + 0.2), (x, y + 0.2)])
+        pairs.append((box, wall))
+    return pairs
+
+
+def legacy_intersects(a, b):
+    if not a.envelope.intersects(b.envelope):
+        return False
+    return a.relate(b).isIntersects
+
+
+def legacy_contains(a, b):
+    if not a.envelope.intersects(b.envelope):
+        return False
+    return a.relate(b).isContains
+
+
+def legacy_intersection(a, b):
+    return BinaryOp(a, b, overlayOp(OverlayOp.opINTERSECTION))
+
+
+def timeit(func, pairs):
+    t = time.perf_counter()
+    res = [func(a, b) for a, b in pairs]
+    return time.perf_counter() - t, res
+
+
+def area(geom):
+    if hasattr(geom, 'geoms'):
+        return sum(area(g) for g in geom.geoms)
+    return geom.area
+
+
+def bench(n):
+    pairs = openings_on_walls(n)
+    print("{} openings".format(n))
+    for name, legacy, current, same in (
+            ("intersects", legacy_intersects, lambda a, b: a.intersects(b), lambda a, b: a == b),
+            ("contains", legacy_contains, lambda a, b: a.contains(b), lambda a, b: a == b),
+            ("intersection", legacy_intersection, lambda a, b: a.intersection(b),
+                lambda a, b: abs(area(a) - area(b)) < 1e-9)):
+        t_legacy, ref = timeit(legacy, pairs)
+        t_current, res = timeit(current, pairs)
+        print("  {:12} relate/overlay {:.3f}s  rectangle {:.3f}s  x{:.1f}  same:{}".format(
+            name, t_legacy, t_current, t_legacy / t_current, all(same(a, b) for a, b in zip(ref, res))))
+
+
+if __name__ == "__main__":
+    for n in (1000, 5000):
+        bench(n)
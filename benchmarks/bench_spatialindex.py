@@ -0,0 +1,151 @@
+# -*- coding:utf-8 -*-
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110- 1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+# ----------------------------------------------------------
+# Author: Stephen Leger (s-leger)
+#
+# ----------------------------------------------------------
+"""
+    Benchmark Qtree index backends on DXF like imports
+    Run from a plain python interpreter:
+    python benchmarks/bench_spatialindex.py
+
+    spatialindex module only depends on pyqtree and pygeos, load it
+    as part of a bare package so the blender add-on __init__ is not run.
+"""
+import os
+import sys
+import time
+import types
+import random
+import importlib
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+package = types.ModuleType("archipack_bench")
+package.__path__ = [ROOT]
+sys.modules["archipack_bench"] = package
+spatialindex = importlib.import_module("archipack_bench.spatialindex")
+
+BACKENDS = (spatialindex.QUADTREE, spatialindex.STRTREE, spatialindex.GRID)
+EPSILON = 1.0e-4
+
+
+def dxf_segments(n_segs, seed=0):
+    """
+        Polylines made of short axis aligned and oblique segments
+        sharing end points, spread over a plan sized to keep density constant
+    """
+    rnd = random.Random(seed)
+    size = 2.0 * n_segs ** 0.5
+    segs = []
+    while len(segs) < n_segs:
+        x, y = rnd.uniform(-size, size), rnd.uniform(-size, size)
+        for i in range(rnd.randint(2, 20)):
+            if rnd.random() < 0.7:
+                dx, dy = (rnd.uniform(0.2, 3), 0) if rnd.random() < 0.5 else (0, rnd.uniform(0.2, 3))
+            else:
+                dx, dy = rnd.uniform(-2, 2), rnd.uniform(-2, 2)
+            segs.append((x, y, x + dx, y + dy))
+            x, y = x + dx, y + dy
+    return 2 * size, segs[:n_segs]
+
+
+def dxf_walls_hatches(n_segs, seed=0):
+    """
+        10% long axis aligned walls over clustered short hatch segments
+    """
+    rnd = random.Random(seed)
+    size = 2.0 * n_segs ** 0.5
+    segs = []
+    while len(segs) < n_segs:
+        if rnd.random() < 0.1:
+            x, y = rnd.uniform(-size, size), rnd.uniform(-size, size)
+            length = rnd.uniform(5, size / 2)
+            if rnd.random() < 0.5:
+                segs.append((x, y, x + length, y))
+            else:
+                segs.append((x, y, x, y + length))
+        else:
+            cx, cy = rnd.gauss(0, size / 4), rnd.gauss(0, size / 4)
+            for i in range(20):
+                x, y = cx + rnd.uniform(-1, 1), cy + rnd.uniform(-1, 1)
+                segs.append((x, y, x + rnd.uniform(-0.3, 0.3), y + rnd.uniform(-0.3, 0.3)))
+    return 2 * size, segs[:n_segs]
+
+
+def bbox(seg, extend):
+    x0, y0, x1, y1 = seg
+    if x1 < x0:
+        x0, x1 = x1, x0
+    if y1 < y0:
+        y0, y1 = y1, y0
+    return (x0 - extend, y0 - extend, x1 + extend, y1 + extend)
+
+
+def snap_points(backend, size, segs):
+    """
+        Qtree.newPoint pattern: query then insert when not found
+    """
+    index = spatialindex.new_index(backend, size, size)
+    n_points = 0
+    for seg in segs:
+        for x, y in ((seg[0], seg[1]), (seg[2], seg[3])):
+            found = index._intersect((x - EPSILON, y - EPSILON, x + EPSILON, y + EPSILON))
+            if len(found) == 0:
+                index._insert(n_points, (x, y, x, y))
+                n_points += 1
+    return n_points
+
+
+def query_segments(backend, size, segs, extend=0.01):
+    """
+        Polygonizer.split pattern: bulk insert then one query per segment
+    """
+    index = spatialindex.new_index(backend, size, size)
+    for i, seg in enumerate(segs):
+        index._insert(i, bbox(seg, EPSILON))
+    if hasattr(index, "build"):
+        index.build()
+    found = 0
+    t = time.perf_counter()
+    for seg in segs:
+        found += len(sorted(index._intersect(bbox(seg, extend))))
+    return found, time.perf_counter() - t
+
+
+def bench(n_segs, generator):
+    size, segs = generator(n_segs)
+    print("{} {} segments".format(generator.__name__, n_segs))
+    for backend in BACKENDS:
+        t = time.perf_counter()
+        n_points = snap_points(backend, size, segs)
+        t_points = time.perf_counter() - t
+        t = time.perf_counter()
+        found, t_query = query_segments(backend, size, segs)
+        t_segs = time.perf_counter() - t
+        print("  {:8}  snap {} points {:.3f}s  segments build+query {:.3f}s  {:>8.0f} queries/s  ({} hits)".format(
+            backend, n_points, t_points, t_segs, n_segs / t_query, found))
+
+
+if __name__ == "__main__":
+    for generator in (dxf_segments, dxf_walls_hatches):
+        for n in (10000, 30000, 100000):
+            bench(n, generator)
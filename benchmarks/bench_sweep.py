@@ -0,0 +1,107 @@
+# -*- coding:utf-8 -*-
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110- 1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+# ----------------------------------------------------------
+# Author: Stephen Leger (s-leger)
+#
+# ----------------------------------------------------------
+"""
+    Benchmark Polygonizer.split candidates search engines
+    QTREE: one quadtree query per segment, keep ids above segment index
+    SWEEP: x sweep line over all segments boxes, report overlapping pairs once
+    Run from a plain python interpreter:
+    python benchmarks/bench_sweep.py
+"""
+import time
+import random
+from bench_spatialindex import (
+    spatialindex,
+    dxf_segments,
+    dxf_walls_hatches,
+    bbox,
+    EPSILON
+    )
+
+
+def dense_hatches(n_segs, seed=0):
+    """
+        Crossing hatch patterns: parallel lines at 45 and -45 degrees
+        in small overlapping tiles, many true intersections
+    """
+    rnd = random.Random(seed)
+    size = n_segs ** 0.5
+    segs = []
+    while len(segs) < n_segs:
+        cx, cy = rnd.uniform(-size, size), rnd.uniform(-size, size)
+        for i in range(10):
+            d = 0.1 * i
+            segs.append((cx + d, cy, cx + d + 1, cy + 1))
+            segs.append((cx + d, cy + 1, cx + d + 1, cy))
+    return 2 * size, segs[:n_segs]
+
+
+def extends_for(segs, extend):
+    # about one third of segments are "extendable"
+    return [extend if i % 3 == 0 else EPSILON for i in range(len(segs))]
+
+
+def candidates_qtree(size, segs, extends):
+    index = spatialindex.new_index(spatialindex.QUADTREE, size, size)
+    for i, seg in enumerate(segs):
+        index._insert(i, bbox(seg, EPSILON))
+    pairs = []
+    for s, seg in enumerate(segs):
+        for id in sorted(index._intersect(bbox(seg, extends[s]))):
+            if id > s:
+                pairs.append((s, id))
+    return pairs
+
+
+def candidates_sweep(size, segs, extends):
+    query = [bbox(seg, ext) for seg, ext in zip(segs, extends)]
+    stored = [bbox(seg, EPSILON) for seg in segs]
+    boxes = [bbox(seg, max(ext, EPSILON)) for seg, ext in zip(segs, extends)]
+    candidates = [[] for seg in segs]
+    for s, id in spatialindex.SweepOverlaps(boxes).pairs():
+        q, b = query[s], stored[id]
+        if b[2] >= q[0] and b[0] <= q[2] and b[3] >= q[1] and b[1] <= q[3]:
+            candidates[s].append(id)
+    return [(s, id) for s, idx in enumerate(candidates) for id in sorted(idx)]
+
+
+def bench(n_segs, generator, extend=0.01):
+    size, segs = generator(n_segs)
+    extends = extends_for(segs, extend)
+    t = time.perf_counter()
+    ref = candidates_qtree(size, segs, extends)
+    t_qtree = time.perf_counter() - t
+    t = time.perf_counter()
+    res = candidates_sweep(size, segs, extends)
+    t_sweep = time.perf_counter() - t
+    print("{} {} segments  {} pairs  QTREE {:.3f}s  SWEEP {:.3f}s  x{:.2f}  same:{}".format(
+        generator.__name__, n_segs, len(ref), t_qtree, t_sweep, t_qtree / t_sweep, ref == res))
+
+
+if __name__ == "__main__":
+    for generator in (dxf_segments, dxf_walls_hatches, dense_hatches):
+        for n in (10000, 30000, 100000):
+            bench(n, generator)
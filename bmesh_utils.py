@@ -26,6 +26,8 @@
 # ----------------------------------------------------------
 import bpy
 import bmesh
+import numpy as np
+from itertools import chain
 
 
 class BmeshEdit():
@@ -124,11 +126,286 @@ class BmeshEdit():
         for i, v in enumerate(verts):
             bm.verts[i].co = v
 
+    @staticmethod
+    def as_arrays(verts, faces, matids=None, uvs=None):
+        """
+            Flatten python lists of verts, faces, matids and uvs
+            into arrays suitable for buildmesh_bulk
+            verts: list of 3d coords
+            faces: list of vertex index lists
+            matids: list of material index, one per face
+            uvs: list of list of 2d coords, one per face loop,
+                extra uvs of a face are ignored like in buildmesh
+                raise RuntimeError when uvs are missing, like buildmesh
+            return coords (float32, n x 3), loop_start, loop_total,
+                loop_verts (int32), matids (int32), uvs (float32, n_loops x 2)
+        """
+        n_faces = len(faces)
+        coords = np.fromiter(chain.from_iterable(verts), dtype=np.float32, count=3 * len(verts))
+        loop_total = np.fromiter((len(f) for f in faces), dtype=np.int32, count=n_faces)
+        n_loops = int(loop_total.sum())
+        loop_start = np.zeros(n_faces, dtype=np.int32)
+        if n_faces > 1:
+            np.cumsum(loop_total[:-1], out=loop_start[1:])
+        loop_verts = np.fromiter(chain.from_iterable(faces), dtype=np.int32, count=n_loops)
+        if matids is not None:
+            matids = np.fromiter(matids, dtype=np.int32, count=n_faces)
+        if uvs is not None:
+            if len(uvs) < n_faces:
+                raise RuntimeError("Missing uvs for face {}".format(len(uvs)))
+            uv_total = np.fromiter((len(uv) for uv in uvs[:n_faces]), dtype=np.int32, count=n_faces)
+            missing = np.flatnonzero(uv_total < loop_total)
+            if len(missing) > 0:
+                i = missing[0]
+                raise RuntimeError("Missing uv {} for face {}".format(uv_total[i], i))
+            if len(uvs) == n_faces and (uv_total == loop_total).all():
+                uvs = np.fromiter(
+                    chain.from_iterable(chain.from_iterable(uvs)),
+                    dtype=np.float32, count=2 * n_loops)
+            else:
+                # more uvs than loops, keep first ones of each face
+                uvs = np.fromiter(
+                    chain.from_iterable(
+                        chain.from_iterable(uv[:len(f)])
+                        for f, uv in zip(faces, uvs)),
+                    dtype=np.float32, count=2 * n_loops)
+            uvs = uvs.reshape(-1, 2)
+        return coords.reshape(-1, 3), loop_start, loop_total, loop_verts, matids, uvs
+
+    @staticmethod
+    def concat(parts):
+        """
+            Concatenate a list of arrays as returned by as_arrays
+            into a single set of arrays
+            matids and uvs are kept only when available for all parts
+        """
+        parts = [part for part in parts if len(part[1]) > 0]
+        if len(parts) < 1:
+            return (
+                np.zeros((0, 3), dtype=np.float32),
+                np.zeros(0, dtype=np.int32),
+                np.zeros(0, dtype=np.int32),
+                np.zeros(0, dtype=np.int32),
+                None,
+                None
+                )
+        coords, loop_start, loop_total, loop_verts, matids, uvs = zip(*parts)
+        v_offset = np.cumsum([0] + [len(co) for co in coords[:-1]])
+        l_offset = np.cumsum([0] + [len(lv) for lv in loop_verts[:-1]])
+        if any(m is None for m in matids):
+            matids = None
+        else:
+            matids = np.concatenate(matids)
+        if any(uv is None for uv in uvs):
+            uvs = None
+        else:
+            uvs = np.concatenate([np.reshape(uv, (-1, 2)) for uv in uvs])
+        return (
+            np.concatenate(coords),
+            np.concatenate([ls + lo for ls, lo in zip(loop_start, l_offset)]).astype(np.int32),
+            np.concatenate(loop_total),
+            np.concatenate([lv + vo for lv, vo in zip(loop_verts, v_offset)]).astype(np.int32),
+            matids,
+            uvs
+            )
+
+    @staticmethod
+    def bm_to_arrays(bm):
+        """
+            Extract bmesh geometry as arrays, see as_arrays
+        """
+        me = bpy.data.meshes.new("_archipack_bulk_")
+        bm.to_mesh(me)
+        n_verts = len(me.vertices)
+        n_loops = len(me.loops)
+        n_faces = len(me.polygons)
+        coords = np.empty(3 * n_verts, dtype=np.float32)
+        me.vertices.foreach_get("co", coords)
+        loop_verts = np.empty(n_loops, dtype=np.int32)
+        me.loops.foreach_get("vertex_index", loop_verts)
+        loop_start = np.empty(n_faces, dtype=np.int32)
+        me.polygons.foreach_get("loop_start", loop_start)
+        loop_total = np.empty(n_faces, dtype=np.int32)
+        me.polygons.foreach_get("loop_total", loop_total)
+        matids = np.empty(n_faces, dtype=np.int32)
+        me.polygons.foreach_get("material_index", matids)
+        uvs = None
+        if len(me.uv_layers) > 0:
+            uvs = np.empty(2 * n_loops, dtype=np.float32)
+            me.uv_layers.active.data.foreach_get("uv", uvs)
+            uvs = uvs.reshape(-1, 2)
+        bpy.data.meshes.remove(me)
+        return coords.reshape(-1, 3), loop_start, loop_total, loop_verts, matids, uvs
+
+    @staticmethod
+    def select_faces(coords, loop_start, loop_total, loop_verts, matids, uvs, mask):
+        """
+            Extract faces from arrays as returned by as_arrays
+            mask: boolean array, one per face
+            return arrays of selected faces with compacted vertices
+        """
+        mask = np.asarray(mask, dtype=np.bool_)
+        loop_mask = np.repeat(mask, loop_total)
+        sel_total = loop_total[mask]
+        sel_verts = loop_verts[loop_mask]
+        used, sel_verts = np.unique(sel_verts, return_inverse=True)
+        sel_start = np.zeros(len(sel_total), dtype=np.int32)
+        if len(sel_total) > 1:
+            np.cumsum(sel_total[:-1], out=sel_start[1:])
+        if matids is not None:
+            matids = matids[mask]
+        if uvs is not None:
+            uvs = uvs[loop_mask]
+        return coords[used], sel_start, sel_total, sel_verts.astype(np.int32), matids, uvs
+
+    @staticmethod
+    def _bulk_fill(me, coords, loop_start, loop_total, loop_verts, matids=None, uvs=None, smooth=True):
+        """
+            private, append geometry to mesh datablock using foreach_set
+            mesh must not be in edit mode
+        """
+        nv = len(me.vertices)
+        nl = len(me.loops)
+        nf = len(me.polygons)
+        n_verts = len(coords)
+        n_loops = len(loop_verts)
+        n_faces = len(loop_start)
+
+        me.vertices.add(n_verts)
+        me.loops.add(n_loops)
+        me.polygons.add(n_faces)
+
+        if nv > 0:
+            co = np.empty(3 * (nv + n_verts), dtype=np.float32)
+            me.vertices.foreach_get("co", co)
+            co[3 * nv:] = np.ravel(coords)
+        else:
+            co = np.ravel(coords)
+        me.vertices.foreach_set("co", co)
+
+        if nl > 0:
+            vi = np.empty(nl + n_loops, dtype=np.int32)
+            me.loops.foreach_get("vertex_index", vi)
+            vi[nl:] = loop_verts + nv
+        else:
+            vi = loop_verts
+        me.loops.foreach_set("vertex_index", vi)
+
+        def _set_poly_attr(attr, values, offset, dtype):
+            if nf > 0:
+                a = np.empty(nf + n_faces, dtype=dtype)
+                me.polygons.foreach_get(attr, a)
+                a[nf:] = values + offset
+            else:
+                a = values
+            me.polygons.foreach_set(attr, a)
+
+        _set_poly_attr("loop_start", loop_start, nl, np.int32)
+        _set_poly_attr("loop_total", loop_total, 0, np.int32)
+
+        if matids is not None:
+            _set_poly_attr("material_index", np.asarray(matids, dtype=np.int32), 0, np.int32)
+
+        _set_poly_attr("use_smooth", np.full(n_faces, smooth, dtype=np.bool_), 0, np.bool_)
+
+        if uvs is not None:
+            if len(me.uv_layers) < 1:
+                me.uv_textures.new()
+            data = me.uv_layers.active.data
+            if nl > 0:
+                uv = np.empty(2 * (nl + n_loops), dtype=np.float32)
+                data.foreach_get("uv", uv)
+                uv[2 * nl:] = np.ravel(uvs)
+            else:
+                uv = np.ravel(uvs)
+            data.foreach_set("uv", uv)
+
+        me.update(calc_edges=True)
+
+    @staticmethod
+    def _bulk_cleanup(me, weld, clean):
+        """
+            private, remove doubles and loose geometry of mesh datablock
+        """
+        bm = bmesh.new()
+        bm.from_mesh(me)
+        if weld:
+            bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.001)
+        if clean:
+            # same as bpy.ops.mesh.delete_loose()
+            loose = [ed for ed in bm.edges if not ed.link_faces]
+            if loose:
+                bmesh.ops.delete(bm, geom=loose, context=2)
+            loose = [v for v in bm.verts if not v.link_edges]
+            if loose:
+                bmesh.ops.delete(bm, geom=loose, context=1)
+        bm.to_mesh(me)
+        bm.free()
+        me.update()
+
+    @staticmethod
+    def buildmesh_bulk(context, o, coords, loop_start, loop_total, loop_verts,
+            matids=None, uvs=None, weld=False,
+            clean=False, auto_smooth=True, temporary=False, append=False, bm=None):
+        """
+            Array based alternative to buildmesh
+            Fill mesh datablock in bulk from flat arrays, see as_arrays
+            coords: float32 array of n_verts x 3
+            loop_start, loop_total: int32 arrays of face offsets and counts
+            loop_verts: int32 array of vertex index for each face loop
+            matids: int32 array of material index, one per face
+            uvs: float32 array of n_loops x 2
+            temporary: return a bmesh instead of writing to object data
+            append: keep existing geometry of object
+            bm: when temporary, append geometry to this bmesh
+        """
+        if temporary:
+            me = bpy.data.meshes.new("_archipack_bulk_")
+            BmeshEdit._bulk_fill(me, coords, loop_start, loop_total, loop_verts, matids, uvs, auto_smooth)
+            if bm is None:
+                bm = bmesh.new()
+            bm.from_mesh(me)
+            bpy.data.meshes.remove(me)
+            bm.verts.ensure_lookup_table()
+            bm.faces.ensure_lookup_table()
+            return bm
+
+        vis_state = o.hide
+        o.hide = False
+        o.select = True
+        context.scene.objects.active = o
+        if o.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        me = o.data
+        if not append:
+            # clear geometry
+            bm = bmesh.new()
+            bm.to_mesh(me)
+            bm.free()
+
+        BmeshEdit._bulk_fill(me, coords, loop_start, loop_total, loop_verts, matids, uvs, auto_smooth)
+
+        if weld or clean:
+            BmeshEdit._bulk_cleanup(me, weld, clean)
+
+        if auto_smooth:
+            me.use_auto_smooth = True
+
+        o.hide = vis_state
+
     @staticmethod
     def buildmesh(context, o, verts, faces,
             matids=None, uvs=None, weld=False,
-            clean=False, auto_smooth=True, temporary=False):
-        
+            clean=False, auto_smooth=True, temporary=False, bulk=False):
+        """
+            bulk: use array based mesh construction, see buildmesh_bulk
+        """
+        if bulk:
+            return BmeshEdit.buildmesh_bulk(
+                context, o, *BmeshEdit.as_arrays(verts, faces, matids, uvs),
+                weld=weld, clean=clean, auto_smooth=auto_smooth, temporary=temporary)
+
         if o is not None:
             # ensure object is visible 
             # otherwhise it is not editable
@@ -179,7 +456,16 @@ class BmeshEdit():
             o.hide = vis_state
                
     @staticmethod
-    def addmesh(context, o, verts, faces, matids=None, uvs=None, weld=False, clean=False, auto_smooth=True):
+    def addmesh(context, o, verts, faces, matids=None, uvs=None, weld=False, clean=False, auto_smooth=True, bulk=False):
+        """
+            bulk: use array based mesh construction, see buildmesh_bulk
+        """
+        if bulk:
+            BmeshEdit.buildmesh_bulk(
+                context, o, *BmeshEdit.as_arrays(verts, faces, matids, uvs),
+                weld=weld, clean=clean, auto_smooth=auto_smooth, append=True)
+            return
+
         bm = BmeshEdit._start(context, o)
         nv = len(bm.verts)
         nf = len(bm.faces)
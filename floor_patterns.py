@@ -0,0 +1,514 @@
+# -*- coding:utf-8 -*-
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110- 1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+# ----------------------------------------------------------
+# Author: Stephen Leger (s-leger)
+#
+# ----------------------------------------------------------
+"""
+    Array based floor patterns
+
+    Each pattern lay tiles over a bounding rectangle as numpy arrays,
+    rows and columns are computed at once instead of one tile at time.
+    Output arrays are the ones of BmeshEdit.as_arrays, ready for
+    CutAbleGenerator.cull and BmeshEdit.buildmesh_bulk.
+
+    Random variations (offset, size, thickness and material)
+    are drawn from a seeded generator so updates are repeatable.
+
+    Does not depend on bpy.
+"""
+import numpy as np
+from math import radians, cos, sin, pi, sqrt, ceil
+
+
+# uvs of quads, in loop order
+UV_QUAD = np.array([(0, 0), (1, 0), (1, 1), (0, 1)], dtype=np.float32)
+UV_QUAD_ROTATED = np.array([(0, 0), (0, 1), (1, 1), (1, 0)], dtype=np.float32)
+
+
+def steps(start, stop, step):
+    """
+        Values start + i * step lower than stop
+    """
+    if step <= 0 or stop <= start:
+        return np.zeros(0)
+    n = int(ceil((stop - start) / step)) + 1
+    res = start + step * np.arange(n)
+    return res[res < stop]
+
+
+class TileArrays():
+    """
+        Collect tiles by chunks
+        corners: array of n x k x 2 corners in vertex order
+        reverse: loops go through corners in reverse order
+    """
+    def __init__(self):
+        self.chunks = []
+
+    def add(self, corners, uv, reverse=True):
+        corners = np.asarray(corners, dtype=np.float64)
+        if len(corners) > 0:
+            if reverse:
+                corners = corners[:, ::-1]
+            self.chunks.append((corners, uv))
+
+    def rects(self, x, y, w, l, rotate_uv=False):
+        """
+            Axis aligned tiles, skip empty ones
+        """
+        x, y, w, l = np.broadcast_arrays(
+            np.asarray(x, dtype=np.float64),
+            np.asarray(y, dtype=np.float64),
+            np.asarray(w, dtype=np.float64),
+            np.asarray(l, dtype=np.float64))
+        valid = (w > 0) & (l > 0)
+        x, y, w, l = x[valid], y[valid], w[valid], l[valid]
+        x1, y1 = x + w, y + l
+        corners = np.stack((
+            np.stack((x, y), axis=-1),
+            np.stack((x1, y), axis=-1),
+            np.stack((x1, y1), axis=-1),
+            np.stack((x, y1), axis=-1)
+            ), axis=1)
+        self.add(corners, UV_QUAD_ROTATED if rotate_uv else UV_QUAD)
+
+    def quads(self, p0, p1, p2, p3):
+        """
+            Free quads, p0 .. p3 arrays of n x 2 corners
+        """
+        self.add(np.stack((p0, p1, p2, p3), axis=1), UV_QUAD)
+
+    def arrays(self, tM, top, z_variance, matid, vary_materials, rng):
+        """
+            return coords, loop_start, loop_total, loop_verts, matids, uvs
+            tM: 4x4 transform matrix
+            top: tiles altitude
+            z_variance: random thickness added to top
+            matid: material index, upper bound when vary_materials
+        """
+        if len(self.chunks) < 1:
+            return (
+                np.zeros((0, 3), dtype=np.float32),
+                np.zeros(0, dtype=np.int32),
+                np.zeros(0, dtype=np.int32),
+                np.zeros(0, dtype=np.int32),
+                np.zeros(0, dtype=np.int32),
+                np.zeros((0, 2), dtype=np.float32)
+                )
+        k = max(corners.shape[1] for corners, uv in self.chunks)
+        # all chunks of a pattern share the same size
+        assert all(corners.shape[1] == k for corners, uv in self.chunks)
+        corners = np.concatenate([corners for corners, uv in self.chunks])
+        uvs = np.concatenate([np.tile(uv, (len(corners), 1)) for corners, uv in self.chunks])
+        n_faces = len(corners)
+
+        if z_variance > 0:
+            z = rng.uniform(top, top + z_variance, n_faces)
+        else:
+            z = np.full(n_faces, top, dtype=np.float64)
+
+        co = np.empty((n_faces, k, 3))
+        co[:, :, 0:2] = corners
+        co[:, :, 2] = z[:, None]
+        co = co.reshape(-1, 3)
+        tM = np.asarray(tM, dtype=np.float64)
+        coords = (co.dot(tM[0:3, 0:3].T) + tM[0:3, 3]).astype(np.float32)
+
+        if vary_materials:
+            # float index truncated as the list based version did
+            matids = rng.uniform(1, matid, n_faces).astype(np.int32)
+        else:
+            matids = np.full(n_faces, matid, dtype=np.int32)
+
+        loop_total = np.full(n_faces, k, dtype=np.int32)
+        loop_start = np.arange(0, n_faces * k, k, dtype=np.int32)
+        loop_verts = np.arange(n_faces * k, dtype=np.int32)
+        return coords, loop_start, loop_total, loop_verts, matids, uvs
+
+
+# ---------------------------------------------------
+# Patterns
+# xmin, ymin, xmax, ymax: bounds to fill
+# ---------------------------------------------------
+
+
+def regular_tile(d, tiles, xmin, ymin, xmax, ymax, rng):
+    """
+     ____  ____  ____
+    |    ||    ||    | Regular tile, rows can be offset, either manually or randomly
+    |____||____||____|
+       ____  ____  ____
+      |    ||    ||    |
+      |____||____||____|
+    """
+    tw, tl, sp = d.tile_width, d.tile_length, d.spacing
+    o = d.offset / 100
+    y = steps(ymin, ymax, tl + sp)
+    n_rows = len(y)
+    if n_rows < 1:
+        return
+    l = np.minimum(tl, ymax - y)
+
+    # first tile of each row
+    if xmin + tw > xmax:
+        w0 = np.full(n_rows, xmax - xmin, dtype=np.float64)
+    elif d.random_offset:
+        v = tw * d.offset_variance * 0.0049
+        w0 = 0.5 * tw + rng.uniform(-v, v, n_rows)
+    else:
+        # odd rows are offset
+        w0 = np.where(np.arange(n_rows) % 2 == 1, tw * o, tw)
+    tiles.rects(xmin, y, w0, l)
+
+    # next ones
+    n_cols = int(ceil((xmax - xmin) / (tw + sp))) + 1
+    x = xmin + (w0 + sp)[:, None] + (tw + sp) * np.arange(n_cols)[None, :]
+    yy = np.broadcast_to(y[:, None], x.shape)
+    ll = np.broadcast_to(l[:, None], x.shape)
+    mask = x < xmax
+    x = x[mask]
+    tiles.rects(x, yy[mask], np.minimum(tw, xmax - x), ll[mask])
+
+
+def hopscotch(d, tiles, xmin, ymin, xmax, ymax, rng):
+    """
+     ____  _  Large tile, plus small one on top right corner
+    |    ||_|
+    |____| ____  _  But shifted up so next large one is right below previous small one
+          |    ||_|
+          |____|
+    """
+    sp = d.spacing
+    tw = d.tile_width
+    tl = d.tile_length
+    s_tw = (tw - sp) / 2  # small tile width
+    s_tl = (tl - sp) / 2  # small tile length
+    row = 0
+    y = ymin - s_tl
+
+    while y < ymax + s_tl or (row == 2 and y - sp < ymax):
+
+        if row < 2:
+            # pairs of large + small tiles, every second pair steps back
+            x0 = xmin if row == 0 else xmin + s_tw + sp
+            period = 2 * tw + s_tw + 3 * sp
+            n = 2 * int(ceil((xmax - x0) / period)) + 2
+            j = np.arange(n)
+            odd = j % 2 == 1
+            x = x0 + (j // 2) * period + odd * (tw + sp)
+            ty = y - odd * (s_tl + sp)
+            mask = x < xmax
+            x, ty = x[mask], ty[mask]
+            # cut off the bottom of the tile
+            l = np.where(ty < ymin - s_tl, tl + ty - ymin, tl)
+            tiles.rects(x, ty, tw, l)
+            tiles.rects(x + tw + sp, ty + s_tl + sp, s_tw, s_tl)
+        elif xmin < xmax:
+            # half width for starting position, small ones on right and bottom
+            tiles.rects(xmin, y, s_tw, tl)
+            tiles.rects(xmin + s_tw + sp, y + s_tl + sp, s_tw, s_tl)
+            tiles.rects(xmin, y - sp - s_tl, s_tw, s_tl)
+            x = steps(xmin + 2 * s_tw + tw + 3 * sp, xmax, 2 * tw + 3 * sp + s_tw)
+            tiles.rects(x, y, tw, tl)
+            tiles.rects(x + tw + sp, y + s_tl + sp, s_tw, s_tl)
+
+        if row == 1:
+            y += s_tl + sp
+        else:
+            y += tl + sp
+        row = (row + 1) % 3
+
+
+def stepping_stone(d, tiles, xmin, ymin, xmax, ymax, rng):
+    """
+     ____  __  ____
+    |    ||__||    | Row of large one, then two small ones stacked beside it
+    |    | __ |    |
+    |____||__||____|
+     __  __  __  __
+    |__||__||__||__| Row of smalls
+    """
+    sp = d.spacing
+    tw = d.tile_width
+    tl = d.tile_length
+    s_tw = (tw - sp) / 2
+    s_tl = (tl - sp) / 2
+
+    # rows go by pairs of large and small ones
+    y = steps(ymin, ymax, tl + s_tl + 2 * sp)
+    y_small = y + tl + sp
+    y_small = y_small[y_small < ymax]
+
+    x = steps(xmin, xmax, tw + s_tw + 2 * sp)
+    xx, yy = np.meshgrid(x, y)
+    tiles.rects(xx, yy, tw, tl)
+    tiles.rects(xx + tw + sp, yy, s_tw, s_tl)
+    tiles.rects(xx + tw + sp, yy + s_tl + sp, s_tw, s_tl)
+
+    x = steps(xmin, xmax, tw + sp)
+    xx, yy = np.meshgrid(x, y_small)
+    tiles.rects(xx, yy, s_tw, s_tl)
+    tiles.rects(xx + s_tw + sp, yy, s_tw, s_tl)
+
+
+def hexagon(d, tiles, xmin, ymin, xmax, ymax, rng):
+    """
+      __  Hexagon tiles
+    /   \\
+    \\___/
+    """
+    sp = d.spacing
+    width = d.tile_width
+    dia = (width / 2) / cos(radians(30))
+    # center of one row to next row
+    vertical_spacing = dia * (1 + sin(radians(30))) + (sp * sin(radians(60)))
+    da = pi / 3
+    base_points = np.array([(sin(i * da), cos(i * da)) for i in range(6)])
+
+    # place tile as long as bottom is still within bounds
+    y = steps(ymin, ymax + width / 2, vertical_spacing)
+    for offset in (0, 1):
+        rows = y[offset::2]
+        x0 = xmin + width / 2 if offset else xmin - sp / 2
+        x = steps(x0, xmax + width / 2, width + sp)
+        xx, yy = np.meshgrid(x, rows)
+        centers = np.stack((xx.ravel(), yy.ravel()), axis=-1)
+        tiles.add(
+            centers[:, None, :] + dia * base_points[None, :, :],
+            base_points.astype(np.float32),
+            reverse=False)
+
+
+def windmill(d, tiles, xmin, ymin, xmax, ymax, rng):
+    """
+     __  ____
+    |  ||____| This also has a square one in the middle, totaling 5 tiles per pattern
+    |__|   __
+     ____ |  |
+    |____||__|
+    """
+    sp = d.spacing
+    tw = d.tile_width
+    tl = d.tile_length
+    s_tw = (tw - sp) / 2
+    s_tl = (tl - sp) / 2
+
+    xx, yy = np.meshgrid(
+        steps(xmin, xmax, tw + s_tw + 2 * sp),
+        steps(ymin, ymax, tl + s_tl + 2 * sp))
+    tiles.rects(xx, yy, tw, s_tl)  # bottom
+    tiles.rects(xx + tw + sp, yy, s_tw, tl, rotate_uv=True)  # right
+    tiles.rects(xx + s_tw + sp, yy + tl + sp, tw, s_tl)  # top
+    tiles.rects(xx, yy + s_tl + sp, s_tw, tl, rotate_uv=True)  # left
+    tiles.rects(xx + s_tw + sp, yy + s_tl + sp, s_tw, s_tl)  # center
+
+
+def boards(d, tiles, xmin, ymin, xmax, ymax, rng):
+    """
+    ||| Typical wood boards
+    |||
+    """
+    bw, bl = d.board_width, d.board_length
+    ws, ls = d.width_spacing, d.length_spacing
+    o = d.offset / 100
+
+    # columns
+    if d.vary_width:
+        v = bw * (d.width_variance / 100) * 0.99
+        n_cols = int(ceil((xmax - xmin) / (bw - v + ws))) + 1
+        w = bw + rng.uniform(-v, v, n_cols)
+    else:
+        n_cols = int(ceil((xmax - xmin) / (bw + ws))) + 1
+        w = np.full(n_cols, bw, dtype=np.float64)
+    x = xmin + np.concatenate(([0], np.cumsum(w + ws)[:-1]))
+    mask = x < xmax
+    x, w = x[mask], w[mask]
+    n_cols = len(x)
+    if n_cols < 1:
+        return
+    w = np.minimum(w, xmax - x)
+
+    # boards of each column
+    if d.vary_length:
+        v = bl * (d.length_variance / 100) * 0.99
+        n_rows = min(d.max_boards, int(ceil((ymax - ymin) / (bl - v + ls))) + 1)
+        l = bl + rng.uniform(-v, v, (n_cols, n_rows))
+    else:
+        n_rows = int(ceil((ymax - ymin) / (bl + ls))) + 2
+        l = np.full((n_cols, n_rows), bl, dtype=np.float64)
+        if d.random_offset:
+            v = bl * d.offset_variance * 0.0049
+            l[:, 0] = 0.5 * bl + rng.uniform(-v, v, n_cols)
+        else:
+            # odd columns are offset
+            l[1::2, 0] = bl * o
+
+    y = ymin + np.concatenate((np.zeros((n_cols, 1)), np.cumsum(l + ls, axis=1)[:, :-1]), axis=1)
+    # last board fill the column up to the end
+    if d.vary_length:
+        l[:, -1] = np.where(n_rows == d.max_boards, ymax - y[:, -1], l[:, -1])
+    l = np.minimum(l, ymax - y)
+    mask = y < ymax
+    xx = np.broadcast_to(x[:, None], y.shape)
+    ww = np.broadcast_to(w[:, None], y.shape)
+    tiles.rects(xx[mask], y[mask], ww[mask], l[mask], rotate_uv=True)
+
+
+def square_parquet(d, tiles, xmin, ymin, xmax, ymax, rng):
+    """
+    ||--||-- Alternating groups oriented either horizontally, or forwards and backwards.
+    ||--||-- self.spacing is used because it is the same spacing for width and length
+    --||--|| Board width is calculated using number of boards and the length.
+    --||--||
+    """
+    sp = d.spacing
+    n = d.boards_in_group
+    bl = d.short_board_length
+    bw = (bl - (n - 1) * sp) / n
+
+    # groups are bl + sp squares, alternate orientation
+    xx, yy = np.meshgrid(
+        steps(xmin, xmax, bl + sp),
+        steps(ymin, ymax, bl + sp))
+    col, row = np.meshgrid(np.arange(xx.shape[1]), np.arange(xx.shape[0]))
+    along = (col + row) % 2 == 0
+    i = np.arange(n)
+
+    # boards oriented along y
+    x = xx[along][:, None] + i[None, :] * (bw + sp)
+    y = np.broadcast_to(yy[along][:, None], x.shape)
+    mask = x < xmax
+    tiles.rects(x[mask], y[mask], bw, bl, rotate_uv=True)
+
+    # boards oriented along x
+    y = yy[~along][:, None] + i[None, :] * (bw + sp)
+    x = np.broadcast_to(xx[~along][:, None], y.shape)
+    mask = y < ymax
+    tiles.rects(x[mask], y[mask], bl, bw)
+
+
+def herringbone(d, tiles, xmin, ymin, xmax, ymax, rng):
+    """
+    Boards are at 45 degree angle, in chevron pattern, ends are angled
+    """
+    sp = d.spacing
+    width_dif = d.board_width / cos(radians(45))
+    x_dif = d.short_board_length * cos(radians(45))
+    y_dif = d.short_board_length * sin(radians(45))
+    total_y_dif = width_dif + y_dif
+    sp_dif = sp / cos(radians(45))
+
+    x = steps(xmin, xmax, x_dif + sp)
+    y = steps(ymin - y_dif, ymax, width_dif + sp_dif)
+    # left side on even columns, right side on odd ones
+    for side in (0, 1):
+        xx, yy = np.meshgrid(x[side::2], y)
+        xx, yy = xx.ravel(), yy.ravel()
+        x1 = xx + x_dif
+        if side == 0:
+            tiles.quads(
+                np.stack((xx, yy), axis=-1),
+                np.stack((x1, yy + y_dif), axis=-1),
+                np.stack((x1, yy + total_y_dif), axis=-1),
+                np.stack((xx, yy + width_dif), axis=-1))
+        else:
+            tiles.quads(
+                np.stack((xx, yy + y_dif), axis=-1),
+                np.stack((x1, yy), axis=-1),
+                np.stack((x1, yy + width_dif), axis=-1),
+                np.stack((xx, yy + total_y_dif), axis=-1))
+
+
+def herringbone_parquet(d, tiles, xmin, ymin, xmax, ymax, rng):
+    """
+    Boards are at 45 degree angle, in chevron pattern, ends are square, not angled
+    """
+    an_45 = 0.5 * sqrt(2)
+
+    x_dif = d.short_board_length * an_45
+    y_dif = d.short_board_length * an_45
+    y_dif_45 = d.board_width * an_45
+    x_dif_45 = d.board_width * an_45
+    total_y_dif = y_dif + y_dif_45
+
+    sp_dif = (d.spacing / an_45) / 2  # divide by two since it is used for both x and y
+    width_dif = d.board_width / an_45
+
+    # continue as long as bottom left corner is still good
+    y = steps(ymin - y_dif, ymax + y_dif_45, width_dif + 2 * sp_dif)
+    # continue as long as top left corner is still good
+    x = steps(xmin, xmax + x_dif_45, 2 * x_dif + 2 * sp_dif)
+
+    # left side
+    xx, yy = np.meshgrid(x, y)
+    xx, yy = xx.ravel(), yy.ravel()
+    tiles.quads(
+        np.stack((xx, yy), axis=-1),
+        np.stack((xx + x_dif, yy + y_dif), axis=-1),
+        np.stack((xx + x_dif - x_dif_45, yy + total_y_dif), axis=-1),
+        np.stack((xx - x_dif_45, yy + y_dif_45), axis=-1))
+
+    # right side
+    xx = xx + x_dif - x_dif_45 + sp_dif
+    y0 = yy + y_dif - y_dif_45 - sp_dif
+    mask = xx < xmax
+    xx, y0 = xx[mask], y0[mask]
+    tiles.quads(
+        np.stack((xx, y0), axis=-1),
+        np.stack((xx + x_dif, y0 - y_dif), axis=-1),
+        np.stack((xx + x_dif + x_dif_45, y0 - y_dif + y_dif_45), axis=-1),
+        np.stack((xx + x_dif_45, y0 + y_dif_45), axis=-1))
+
+
+PATTERNS = {
+    'regular_tile': regular_tile,
+    'hopscotch': hopscotch,
+    'stepping_stone': stepping_stone,
+    'hexagon': hexagon,
+    'windmill': windmill,
+    'boards': boards,
+    'square_parquet': square_parquet,
+    'herringbone': herringbone,
+    'herringbone_parquet': herringbone_parquet
+    }
+
+
+def generate(d, xmin, ymin, xmax, ymax, top, tM, seed=0):
+    """
+        Fill bounds with d.pattern tiles
+        d: floor parameters
+        top: tiles altitude
+        tM: 4x4 transform of tiles
+        return arrays as BmeshEdit.as_arrays does
+    """
+    rng = np.random.RandomState(seed)
+    tiles = TileArrays()
+    pattern = PATTERNS.get(d.pattern)
+    if pattern is not None:
+        pattern(d, tiles, xmin, ymin, xmax, ymax, rng)
+    if d.vary_thickness and d.thickness_variance > 0:
+        z_variance = d.thickness / 100 * d.thickness_variance
+    else:
+        z_variance = 0
+    return tiles.arrays(tM, top, z_variance, d.matid, d.vary_materials, rng)
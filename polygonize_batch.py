@@ -0,0 +1,275 @@
+# -*- coding:utf-8 -*-
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110- 1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+# ----------------------------------------------------------
+# Author: Stephen Leger (s-leger)
+#
+# ----------------------------------------------------------
+"""
+    Batch polygonize by independent components
+
+    Input lines are plain coordinate arrays [(x, y, z), ...] in a common
+    coordsys, see archipack_polylines.Io.curves_to_coords to serialize
+    blender curves. Closed lines repeat their first point.
+
+    Lines are split in segments, segments are grouped into independent
+    connected components (segments boxes extended by extend overlap),
+    each component is split by archipack_polylines.Polygonizer.split
+    and polygonized, in this process or on demand in a process pool.
+    Split relies on mathutils, so this runs in blender only.
+
+    Polygons come back as pygeos polygons, pool workers send them
+    as pygeos.io_binary buffers.
+
+    The process pool is opt in and only runs with the fork start method
+    (linux, macos), workers inherit imported modules. Spawn would start
+    sys.executable, the blender binary inside blender, so windows runs
+    in this process. On site plan inputs the pool gives no measurable
+    gain, see benchmarks/bench_polygonize_batch.py
+"""
+import time
+from array import array
+from .spatialindex import new_index, SweepOverlaps, GRID
+from .pygeos.geom import GeometryFactory
+from .pygeos.shared import Coordinate, fork_executor
+from .pygeos.op_polygonize import PolygonizeOp
+from .pygeos.io_binary import geometries_to_buffer, geometries_from_buffer
+
+import logging
+logger = logging.getLogger("archipack")
+
+
+# precision 1e-4 = 0.1mm
+EPSILON = 1.0e-4
+# components are grouped in chunks of at least CHUNK_SIZE segments
+# to lower inter process transfers
+CHUNK_SIZE = 2000
+# points snapping grid cell size
+SNAP_CELL_SIZE = 0.1
+
+
+class PointSnap():
+    """
+        Merge points closer than EPSILON, return point index
+    """
+    def __init__(self):
+        self._index = new_index(GRID, 0, 0, cell_size=SNAP_CELL_SIZE)
+        self.coords = []
+
+    def add(self, co):
+        x, y = co[0], co[1]
+        found = self._index._intersect((x - EPSILON, y - EPSILON, x + EPSILON, y + EPSILON))
+        if len(found) > 0:
+            return min(found)
+        index = len(self.coords)
+        self.coords.append((x, y, co[2] if len(co) > 2 else 0))
+        self._index._insert(index, (x, y, x, y))
+        return index
+
+
+def _bbox(c0, c1, extend):
+    return (min(c0[0], c1[0]) - extend,
+        min(c0[1], c1[1]) - extend,
+        max(c0[0], c1[0]) + extend,
+        max(c0[1], c1[1]) + extend)
+
+
+def _components(coords, segs, extend):
+    """
+        Group segments with overlapping boxes
+        return list of segments index lists
+    """
+    extend = max(extend, EPSILON)
+    boxes = [_bbox(coords[i0], coords[i1], extend) for i0, i1 in segs]
+    parent = list(range(len(segs)))
+
+    def root(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in SweepOverlaps(boxes).pairs():
+        ri, rj = root(i), root(j)
+        if ri != rj:
+            parent[max(ri, rj)] = min(ri, rj)
+
+    groups = {}
+    for i in range(len(segs)):
+        groups.setdefault(root(i), []).append(i)
+    return list(groups.values())
+
+
+class ComponentBounds():
+    """
+        Component region size, stand for Qtree coordsys
+        coords: flat array of x, y, z
+    """
+    def __init__(self, coords):
+        x, y = coords[0::3], coords[1::3]
+        self.width = max(x) - min(x)
+        self.height = max(y) - min(y)
+
+
+def polygonize_component(coords, segs, extend=0.0, all_segs=False, factory=None):
+    """
+        Split with Polygonizer.split and polygonize one component
+        coords: flat array of x, y, z
+        segs: flat array of points index pairs
+        return polygons, invalid polygons
+    """
+    # archipack_polylines imports this module
+    from .archipack_polylines import Polygonizer, Qtree, SWEEP
+
+    bounds = ComponentBounds(coords)
+    # grid backends, components are not centered on origin
+    Q_points = Qtree(bounds, backend=GRID)
+    Q_segs = Qtree(bounds, backend=GRID)
+    points = [Q_points.newPoint(Coordinate(coords[i], coords[i + 1], coords[i + 2]))
+        for i in range(0, len(coords), 3)]
+    for i in range(0, len(segs), 2):
+        Q_segs.newSegment(points[segs[i]], points[segs[i + 1]])
+
+    Polygonizer(bounds).split(Q_points, Q_segs, extend=extend, all_segs=all_segs, engine=SWEEP)
+
+    gf = factory
+    if gf is None:
+        gf = GeometryFactory()
+    lines = gf.buildGeometry([gf.createLineString([seg.c0.coord, seg.c1.coord])
+        for seg in Q_segs._geoms
+        if seg.available and seg.c0 is not seg.c1])
+    merged = lines.line_merge()
+    polys, dangles, cuts, invalids = PolygonizeOp.polygonize_full(merged, skip_validity_check=True)
+    return polys, invalids
+
+
+def _polygonize_chunk(chunk, extend, all_segs, factory=None):
+    polys, invalids = [], []
+    for coords, segs in chunk:
+        _polys, _invalids = polygonize_component(coords, segs, extend, all_segs, factory)
+        polys.extend(_polys)
+        invalids.extend(_invalids)
+    return polys, invalids
+
+
+def _polygonize_chunk_buffer(chunk, extend, all_segs):
+    """
+        Process pool worker, return polygons count and
+        polygons followed by invalid ones as io_binary buffer
+    """
+    polys, invalids = _polygonize_chunk(chunk, extend, all_segs)
+    return len(polys), geometries_to_buffer(polys + invalids)
+
+
+def lines_to_segments(lines):
+    """
+        Merge points closer than EPSILON and build unique segments
+        lines: list of coords arrays [(x, y, z), ...]
+        return coords, segs
+    """
+    points = PointSnap()
+    unique = set()
+    segs = []
+    for line in lines:
+        pts = [points.add(co) for co in line]
+        for i in range(1, len(pts)):
+            i0, i1 = pts[i - 1], pts[i]
+            key = (min(i0, i1), max(i0, i1))
+            if i0 != i1 and key not in unique:
+                unique.add(key)
+                segs.append((i0, i1))
+    return points.coords, segs
+
+
+def _chunks(coords, segs, groups, chunk_size):
+    """
+        Pack components in chunks of at least chunk_size segments,
+        largest components first, points index remapped per component
+    """
+    chunks = []
+    chunk, size = [], 0
+    for group in sorted(groups, key=lambda g: -len(g)):
+        remap = {}
+        _coords = array('d')
+        _segs = array('l')
+        for s in group:
+            for i in segs[s]:
+                if i not in remap:
+                    remap[i] = len(remap)
+                    _coords.extend(coords[i])
+                _segs.append(remap[i])
+        chunk.append((_coords, _segs))
+        size += len(group)
+        if size >= chunk_size:
+            chunks.append(chunk)
+            chunk, size = [], 0
+    if len(chunk) > 0:
+        chunks.append(chunk)
+    return chunks
+
+
+def polygonize_batch(lines, extend=0.0, all_segs=False, max_workers=0, chunk_size=CHUNK_SIZE):
+    """
+        Polygonize lines by independent components
+        lines: list of coords arrays [(x, y, z), ...]
+        extend: extend line ends to closest intersecting segment
+        all_segs: extend all segments ends, not only free ones
+        max_workers: 0 to run in this process, processes count or None
+            for cpu count to use a fork process pool when available
+        return polygons, invalid polygons
+    """
+    t = time.time()
+    coords, segs = lines_to_segments(lines)
+    groups = _components(coords, segs, extend)
+    chunks = _chunks(coords, segs, groups, chunk_size)
+
+    logger.debug("polygonize_batch() segs:%s components:%s chunks:%s :%.2f seconds",
+        len(segs),
+        len(groups),
+        len(chunks),
+        time.time() - t)
+
+    executor = None
+    if max_workers != 0 and len(chunks) > 1:
+        executor = fork_executor(max_workers)
+
+    gf = GeometryFactory()
+    polys, invalids = [], []
+    if executor is None:
+        for chunk in chunks:
+            _polys, _invalids = _polygonize_chunk(chunk, extend, all_segs, gf)
+            polys.extend(_polys)
+            invalids.extend(_invalids)
+    else:
+        with executor:
+            futures = [executor.submit(_polygonize_chunk_buffer, chunk, extend, all_segs) for chunk in chunks]
+            for future in futures:
+                npolys, buf = future.result()
+                geoms = geometries_from_buffer(buf, gf)
+                polys.extend(geoms[:npolys])
+                invalids.extend(geoms[npolys:])
+
+    logger.debug("polygonize_batch() polygons:%s invalids:%s :%.2f seconds",
+        len(polys),
+        len(invalids),
+        time.time() - t)
+    return polys, invalids
@@ -0,0 +1,286 @@
+# -*- coding:utf-8 -*-
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110- 1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+# ----------------------------------------------------------
+# Author: Stephen Leger (s-leger)
+#
+# ----------------------------------------------------------
+"""
+    Hot path instrumentation
+
+    Targets are wrapped in place on enable() and restored on disable(),
+    so disabled profiler cost nothing, not even a flag test.
+    Targets are:
+    - update and update_* / make_* methods of archipack_* classes
+    - pattern methods of *Generator classes
+    - BmeshEdit public methods
+    - pygeos top level ops
+
+    Stats are aggregated by (object type, function) where object type
+    is the innermost archipack_* class on the call stack:
+    calls, cumulative time (recursion accounted once) and self time.
+
+    Does not depend on bpy.
+"""
+import sys
+import json
+import time
+from functools import wraps
+import logging
+logger = logging.getLogger("archipack")
+
+
+# methods of *Generator classes, in addition to make_*
+GENERATOR_METHODS = {
+    'floor', 'cut', 'generate_pattern',
+    'couverture', 'lambris', 'rafter', 'bargeboard', 'fascia', 'gutter',
+    'beam_primary', 'hips', 'make_hole', 'make_wall_fit',
+    'cull', 'bissect', 'cut_holes', 'cut_boundary'
+    }
+
+
+# (module, qualified name), relative to the add-on package
+TARGETS = (
+    ('pygeos.geom', 'Geometry.intersects'),
+    ('pygeos.geom', 'Geometry.contains'),
+    ('pygeos.geom', 'Geometry.within'),
+    ('pygeos.geom', 'Geometry.covers'),
+    ('pygeos.geom', 'Geometry.relate'),
+    ('pygeos.geom', 'Geometry.intersection'),
+    ('pygeos.geom', 'Geometry.union'),
+    ('pygeos.geom', 'Geometry.difference'),
+    ('pygeos.geom', 'Geometry.buffer'),
+    ('pygeos.geom', 'Geometry.simplify'),
+    ('pygeos.op_polygonize', 'PolygonizeOp.polygonize_full'),
+    ('pygeos.op_polygonize', 'PolygonizeOp.polygonize'),
+    ('pygeos.op_union', 'UnaryUnionOp.union'),
+    ('pygeos.op_union', 'CascadedPolygonUnion.union'),
+    ('pygeos.op_linemerge', 'LineMerger.merge'),
+    ('archipack_polylines', 'Qtree.build'),
+    ('archipack_polylines', 'Polygonizer.split'),
+    ('archipack_polylines', 'Polygonizer.polygonize'),
+    # archipack_polylines imports polygonize_batch by name, patch its caller
+    ('archipack_polylines', 'Polygonizer.polygonize_batch'),
+    ('polygonize_batch', 'polygonize_component'),
+    )
+
+
+class Profiler():
+    """
+        Aggregate calls, cumulative and self time
+        of wrapped functions
+    """
+    def __init__(self):
+        self.enabled = False
+        self.package = None
+        self.stats = {}
+        self.stack = []
+        self.depth = {}
+        self.patched = []
+
+    def reset(self):
+        self.stats.clear()
+        self.depth.clear()
+        self.stack.clear()
+
+    def _call(self, typ, name, func, args, kwargs):
+        stack = self.stack
+        if typ is None:
+            if stack:
+                typ = stack[-1][0][0]
+            else:
+                typ = ""
+        key = (typ, name)
+        depth = self.depth.get(key, 0)
+        self.depth[key] = depth + 1
+        # key, children time
+        frame = [key, 0]
+        stack.append(frame)
+        t = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            dt = time.perf_counter() - t
+            stack.pop()
+            self.depth[key] = depth
+            s = self.stats.get(key)
+            if s is None:
+                s = self.stats[key] = [0, 0, 0]
+            s[0] += 1
+            s[2] += dt - frame[1]
+            if depth == 0:
+                s[1] += dt
+            if stack:
+                stack[-1][1] += dt
+
+    def wrap(self, func, name, typ=None):
+        """
+            Return a profiled version of func
+            @typ: object type, None to use the caller one
+        """
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return self._call(typ, name, func, args, kwargs)
+        return wrapper
+
+    def section(self, name, typ=None):
+        """
+            Context manager to profile a block,
+            use as a no-op when disabled
+        """
+        return ProfileSection(self, name, typ)
+
+    def _patch(self, cls, attr, typ=None):
+        func = cls.__dict__.get(attr)
+        static = isinstance(func, staticmethod)
+        if static:
+            func = func.__func__
+        if not callable(func) or isinstance(func, type):
+            return
+        name = "%s.%s" % (cls.__name__, attr)
+        wrapper = self.wrap(func, name, typ)
+        if static:
+            wrapper = staticmethod(wrapper)
+        self.patched.append((cls, attr, cls.__dict__[attr]))
+        setattr(cls, attr, wrapper)
+
+    def _patch_function(self, mod, attr):
+        func = mod.__dict__.get(attr)
+        if not callable(func) or isinstance(func, type):
+            return
+        self.patched.append((mod, attr, func))
+        setattr(mod, attr, self.wrap(func, attr))
+
+    def _patch_module(self, mod):
+        short = mod.__name__[len(self.package) + 1:]
+        for cls in list(mod.__dict__.values()):
+            if not isinstance(cls, type) or cls.__module__ != mod.__name__:
+                continue
+            if cls.__name__.startswith("archipack_"):
+                for attr in list(cls.__dict__.keys()):
+                    if attr == "update" or attr.startswith("update_") or attr.startswith("make_"):
+                        self._patch(cls, attr, cls.__name__)
+            elif cls.__name__.endswith("Generator"):
+                for attr in list(cls.__dict__.keys()):
+                    if attr in GENERATOR_METHODS or attr.startswith("make_"):
+                        self._patch(cls, attr)
+            elif short == "bmesh_utils" and cls.__name__ == "BmeshEdit":
+                for attr in list(cls.__dict__.keys()):
+                    if not attr.startswith("_"):
+                        self._patch(cls, attr)
+
+    def enable(self, package):
+        """
+            Wrap targets of loaded modules from package
+        """
+        if self.enabled:
+            return
+        self.package = package
+        prefix = package + "."
+        for name, mod in list(sys.modules.items()):
+            if mod is not None and name.startswith(prefix):
+                self._patch_module(mod)
+        for mod_name, qualname in TARGETS:
+            mod = sys.modules.get(prefix + mod_name)
+            if mod is None:
+                continue
+            if "." in qualname:
+                cls_name, attr = qualname.split(".")
+                cls = mod.__dict__.get(cls_name)
+                if isinstance(cls, type) and attr in cls.__dict__:
+                    self._patch(cls, attr)
+            else:
+                self._patch_function(mod, qualname)
+        self.enabled = True
+        logger.debug("Profiler.enable() %s functions", len(self.patched))
+
+    def disable(self):
+        """
+            Restore original functions, keep stats
+        """
+        for owner, attr, func in reversed(self.patched):
+            setattr(owner, attr, func)
+        self.patched.clear()
+        self.stack.clear()
+        self.depth.clear()
+        self.enabled = False
+
+    def report(self, sort="self", limit=None):
+        """
+            Return list of dict sorted by self or cumulative time
+        """
+        rows = [
+            {'type': typ, 'name': name, 'calls': s[0], 'cumulative': s[1], 'self': s[2]}
+            for (typ, name), s in self.stats.items()
+            ]
+        rows.sort(key=lambda row: row[sort], reverse=True)
+        if limit is not None:
+            rows = rows[:limit]
+        return rows
+
+    def dump(self, filepath):
+        with open(filepath, 'w') as f:
+            json.dump({'stats': self.report()}, f, indent=1)
+
+
+class ProfileSection():
+
+    def __init__(self, profiler, name, typ):
+        self.profiler = profiler
+        self.name = name
+        self.typ = typ
+        self.frame = None
+
+    def __enter__(self):
+        p = self.profiler
+        if not p.enabled:
+            return self
+        typ = self.typ
+        if typ is None:
+            typ = p.stack[-1][0][0] if p.stack else ""
+        self.frame = [(typ, self.name), 0]
+        p.stack.append(self.frame)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.frame is None:
+            return False
+        p = self.profiler
+        dt = time.perf_counter() - self.start
+        # disable() may occur in between
+        if p.stack and p.stack[-1] is self.frame:
+            p.stack.pop()
+        key = self.frame[0]
+        s = p.stats.get(key)
+        if s is None:
+            s = p.stats[key] = [0, 0, 0]
+        s[0] += 1
+        s[1] += dt
+        s[2] += dt - self.frame[1]
+        if p.stack:
+            p.stack[-1][1] += dt
+        self.frame = None
+        return False
+
+
+profiler = Profiler()
@@ -27,7 +27,7 @@ import logging
 logger = logging.getLogger("pygeos.algorithms")
 from math import floor, isfinite, sqrt, pi, atan2
 from .shared import (
-    quicksort,
+    sort_by_cmp,
     GeomTypeId,
     Location,
     Envelope,
@@ -372,6 +372,8 @@ class LineSegment():
     """
      * A line segment
     """
+    __slots__ = ('p0', 'p1')
+
     def __init__(self, x0=None, y0=None, x1=None, y1=None):
 
         if x0 is None:
@@ -499,6 +501,9 @@ class ReallyLessThen():
     def compare(self, p1, p2) -> bool:
         return self.polarCompare(self.origin, p1, p2) == -1
 
+    def cmp(self, p1, p2) -> int:
+        return self.polarCompare(self.origin, p1, p2)
+
     def polarCompare(self, o, p, q) -> int:
 
         dxp = p.x - o.x
@@ -764,7 +769,7 @@ class ConvexHull():
 
         # sort the points radially around the focal point.
         rls = ReallyLessThen(coords[0])
-        quicksort(coords, rls.compare)
+        sort_by_cmp(coords, rls.cmp)
 
         logger.debug("ConvexHull.preSort() after radial sort: %s", [str(co) for co in coords])
 
@@ -2731,6 +2736,32 @@ class IndexedPointInAreaLocator():
         return rcc.location
 
 
+class IndexedPointInRingLocator(IntervalIndexedGeometry):
+    """
+     * Determines the location of {@link Coordinate}s relative to
+     * a ring given as a coordinate sequence, using indexing for efficiency.
+     *
+     * Give same results as CGAlgorithms.locatePointInRing,
+     * suitable when many points are tested against large rings.
+    """
+    def __init__(self, coords):
+        """
+         * @param coords the CoordinateSequence of the ring
+        """
+        # index.intervalrtree.SortedPackedIntervalRTree
+        self.index = SortedPackedIntervalRTree()
+        self.addLine(coords)
+
+    def locate(self, coord) -> int:
+        rcc = RayCrossingCounter(coord)
+        visitor = SegmentVisitor(rcc)
+        self.index.query(coord.y, coord.y, visitor)
+        return rcc.location
+
+    def isPointInRing(self, coord) -> bool:
+        return self.locate(coord) != Location.EXTERIOR
+
+
 class SimplePointInAreaLocator():
     @staticmethod
     def locate(p, geom):
@@ -33,6 +33,7 @@ from .shared import (
     PrecisionModel,
     Coordinate,
     CoordinateSequence,
+    PackedCoordinateSequence,
     CoordinateSequenceFilter,
     CoordinateFilter,
     GeometryFilter,
@@ -54,11 +55,20 @@ from .op_binary import BinaryOp
 from .op_union import UnaryUnionOp
 from .op_relate import RelateOp
 from .op_buffer import BufferOp
+from .prepared import (
+    RectangleIntersects,
+    RectangleContains,
+    RectangleIntersection
+    )
 from .simplify import (
     TopologyPreservingSimplifier,
     DouglasPeukerSimplifier
 )
 from .affine import affine_transform
+from .io_binary import (
+    geometries_to_buffer,
+    geometries_from_buffer
+    )
 from .geomgraph import GeometryGraph
 
 
@@ -179,6 +189,13 @@ class Geometry():
         self.geometryChangedFilter = GeometryChangedFilter()
         self.has_z = False
 
+    def to_buffer(self) -> bytes:
+        """
+         * Encode this Geometry as compact binary, see io_binary
+         * Use GeometryFactory.from_buffer to decode
+        """
+        return geometries_to_buffer([self])
+
     @property
     def numpoints(self):
         """
@@ -386,7 +403,11 @@ class Geometry():
     def intersects(self, other) -> bool:
         if not self.envelope.intersects(other.envelope):
             return False
-        # @TODO: optimization for rectangles
+        # optimization for rectangles
+        if self.is_rectangle:
+            return RectangleIntersects.intersects(self, other)
+        if other.is_rectangle:
+            return RectangleIntersects.intersects(other, self)
         im = self.relate(other)
         return im.isIntersects
 
@@ -408,6 +429,9 @@ class Geometry():
     def contains(self, other) -> bool:
         if not self.envelope.intersects(other.envelope):
             return False
+        # optimization for rectangles
+        if self.is_rectangle:
+            return RectangleContains.contains(self, other)
         im = self.relate(other)
         return im.isContains
 
@@ -506,7 +530,15 @@ class Geometry():
             geoms = [geom.intersection(other) for geom in self.geoms]
             return self._factory.buildGeometry(geoms)
 
-        # @TODO: Use rectangle intersection optimization
+        # optimization for rectangles, None when not handled
+        res = None
+        if self.is_rectangle:
+            res = RectangleIntersection.intersection(self, other)
+        elif other.is_rectangle:
+            res = RectangleIntersection.intersection(other, self)
+        if res is not None:
+            return res
+
         self.checkNotGeometryCollection(self)
         self.checkNotGeometryCollection(other)
 
@@ -1473,6 +1505,15 @@ class CoordinateSequenceFactory():
         return CoordinateSequence(coords, allowRepeated, direction)
 
 
+class PackedCoordinateSequenceFactory(CoordinateSequenceFactory):
+    """
+     * Create array('d') backed PackedCoordinateSequence
+     * to keep large coordinate sets compact in memory.
+    """
+    def create(self, coords=None, allowRepeated: bool=True, direction: bool=True):
+        return PackedCoordinateSequence(coords, allowRepeated, direction)
+
+
 class gfCoordinateOperation(CoordinateOperation):
 
     def __init__(self, gsf):
@@ -1550,6 +1591,16 @@ class GeometryFactory():
         coordOp = gfCoordinateOperation(self.coordinateSequenceFactory)
         return editor.edit(geom, coordOp)
 
+    def from_buffer(self, buf, offset: int=0):
+        """
+         * Decode a Geometry encoded with Geometry.to_buffer
+         * buf is read in place, may be bytes, mmap or shared memory
+        """
+        geoms = geometries_from_buffer(buf, self, offset)
+        if len(geoms) != 1:
+            raise ValueError("Buffer contains {} geometries, expected 1".format(len(geoms)))
+        return geoms[0]
+
     def buildGeometry(self, newGeoms):
 
         isHeterogeneous = False
@@ -26,7 +26,8 @@ from math import atan2
 import logging
 logger = logging.getLogger("pygeos.geomgraph")
 from .shared import (
-    quicksort,
+    sort_by_key,
+    sort_by_cmp,
     GeomTypeId,
     TopologyException,
     Location,
@@ -747,10 +748,6 @@ class NodeMap(dict):
         return "\n".join([str(node) for node in self.values()])
 
 
-def EdgeEndLT(s1, s2) -> bool:
-    return s1.compareTo(s2) < 0
-
-
 class DirectedEdgeMap(dict):
 
     def __init__(self):
@@ -761,7 +758,7 @@ class DirectedEdgeMap(dict):
     def edges(self):
         if self._edgeList is None:
             self._edgeList = list(self.values())
-            quicksort(self._edgeList, EdgeEndLT)
+            sort_by_cmp(self._edgeList)
 
         return self._edgeList
 
@@ -776,6 +773,8 @@ class DirectedEdgeMap(dict):
 
 class GraphComponent():
 
+    __slots__ = ('label', 'isInResult', '_isCovered', 'isCoveredSet', 'isVisited')
+
     def __init__(self, newLabel=None):
         if newLabel is None:
             self.label = Label(0, Location.UNDEF)
@@ -810,6 +809,8 @@ class Node(GraphComponent):
      * @param newCoord Coordinate
      * @param newEdges EdgeEndStar
     """
+    __slots__ = ('coord', 'star')
+
     def __init__(self, coord, star):
         GraphComponent.__init__(self)
         # Coordinate
@@ -2241,10 +2242,6 @@ class DirectedEdgeStar(EdgeEndStar):
         )
 
 
-def EdgeIntersectionLessThen(ei1, ei2) -> bool:
-    return ei1.compareTo(ei2) < 0
-
-
 class EdgeIntersection():
     """
      * Represents a point on an edge which intersects with another edge.
@@ -2289,6 +2286,10 @@ class EdgeIntersection():
 
         return 0
 
+    @staticmethod
+    def sort_key(ei):
+        return (ei.segmentIndex, ei.dist)
+
     def __gt__(self, other):
         return self.compareTo(other) == 1
 
@@ -2331,7 +2332,7 @@ class EdgeIntersectionList(dict):
     def intersections(self) -> list:
         if not self._sorted:
             self._ei = list(self.values())
-            quicksort(self._ei, EdgeIntersectionLessThen)
+            sort_by_key(self._ei, EdgeIntersection.sort_key)
             self._sorted = True
         return self._ei
 
@@ -24,7 +24,7 @@
 # ----------------------------------------------------------
 
 
-from .shared import quicksort
+from .shared import sort_by_key
 
 
 class SortedPackedIntervalRTree():
@@ -74,7 +74,7 @@ class SortedPackedIntervalRTree():
 
     # IntervalRTreeNode
     def buildTree(self):
-        quicksort(self.leaves, IntervalRTreeNode.compare)
+        sort_by_key(self.leaves, IntervalRTreeNode.sort_key, reverse=True)
         src = self.leaves
         dest = []
         while(True):
@@ -125,10 +125,8 @@ class IntervalRTreeNode():
         return True
 
     @staticmethod
-    def compare(n1, n2) -> bool:
-        mid1 = (n1.mini + n1.maxi) / 2
-        mid2 = (n2.mini + n2.maxi) / 2
-        return mid1 > mid2
+    def sort_key(n):
+        return (n.mini + n.maxi) / 2
 
 
 class IntervalRTreeLeafNode(IntervalRTreeNode):
@@ -574,7 +574,7 @@ class STRtree(AbstractSTRtree, SpatialIndex):
         """
         minLeafCount = int(ceil(len(childs) / self.nodeCapacity))
         # BoundableList
-        sortedChildBoundables = self._sortBoundables(childs)
+        sortedChildBoundables = self._sortBoundablesX(childs)
         # BoundableList
         verticalSlices = self._verticalSlices(sortedChildBoundables, int(ceil(sqrt(minLeafCount))))
         return self._createParentBoundablesFromVerticalSlices(verticalSlices, newLevel)
@@ -593,6 +593,9 @@ class STRtree(AbstractSTRtree, SpatialIndex):
     def _sortBoundables(self, input: list) -> list:
         return list(sorted(input, key=lambda n: (n.bounds.miny + n.bounds.maxy) / 2.0))
 
+    def _sortBoundablesX(self, input: list) -> list:
+        return list(sorted(input, key=lambda n: (n.bounds.minx + n.bounds.maxx) / 2.0))
+
     def _createParentBoundablesFromVerticalSlice(self, childs: list, newLevel: int) -> list:
         return AbstractSTRtree._createParentBoundables(self, childs, newLevel)
 
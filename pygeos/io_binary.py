@@ -0,0 +1,297 @@
+# -*- coding:utf-8 -*-
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110- 1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+# ----------------------------------------------------------
+# Author: Stephen Leger (s-leger)
+#
+# ----------------------------------------------------------
+"""
+    Compact binary encoding of geometries
+
+    Layout, little endian, sections are 8 bytes aligned:
+    - header: magic b'PGEO', version uint16, flags uint16,
+      geometries uint32, nodes uint32, points uint32, reserved uint32
+    - coords: float64 x, y, z of points
+    - types: int32 GeomTypeId of nodes
+    - counts: int32 of nodes, sub geometries of collections,
+      rings of polygons, points of points, linestrings and rings
+    Nodes are stored depth first, geometries one after the other.
+
+    Reading does not copy the buffer, so any object supporting
+    the buffer protocol can be read in place: bytes, bytearray, mmap,
+    multiprocessing.shared_memory.SharedMemory.buf
+    Writing goes into a caller provided buffer with write_buffer,
+    so geometries can be written straight into shared memory.
+
+    Factories are not encoded, decoded geometries use the given one.
+"""
+import sys
+import mmap
+import struct
+from array import array
+from .shared import (
+    Coordinate,
+    GeomTypeId
+    )
+
+
+MAGIC = b'PGEO'
+VERSION = 1
+
+_header = struct.Struct('<4sHHIIII')
+
+_collections = {
+    GeomTypeId.GEOS_MULTIPOINT,
+    GeomTypeId.GEOS_MULTILINESTRING,
+    GeomTypeId.GEOS_MULTIPOLYGON,
+    GeomTypeId.GEOS_GEOMETRYCOLLECTION
+    }
+
+_lines = {
+    GeomTypeId.GEOS_LINESTRING,
+    GeomTypeId.GEOS_LINEARRING
+    }
+
+# arrays are in native byte order
+_swap = sys.byteorder != 'little'
+
+
+def _align(size: int) -> int:
+    return (size + 7) & ~7
+
+
+class _Encoder():
+    """
+     * Flatten geometries into coords, types and counts arrays
+    """
+    def __init__(self, geoms):
+        self.coords = array('d')
+        self.types = array('i')
+        self.counts = array('i')
+        self.ngeoms = 0
+        for geom in geoms:
+            self.add(geom)
+            self.ngeoms += 1
+
+    def add_coords(self, coords):
+        self.coords.extend(v for co in coords for v in (co.x, co.y, co.z))
+
+    def add(self, geom):
+        type_id = geom.type_id
+        self.types.append(type_id)
+        if type_id in _collections:
+            self.counts.append(geom.numgeoms)
+            for g in geom.geoms:
+                self.add(g)
+        elif type_id == GeomTypeId.GEOS_POLYGON:
+            self.counts.append(1 + len(geom.interiors))
+            self.add(geom.exterior)
+            for hole in geom.interiors:
+                self.add(hole)
+        elif type_id in _lines:
+            self.counts.append(len(geom.coords))
+            self.add_coords(geom.coords)
+        elif geom.coord is None:
+            self.counts.append(0)
+        else:
+            self.counts.append(1)
+            self.add_coords([geom.coord])
+
+    @property
+    def size(self) -> int:
+        return (_align(_header.size) +
+            _align(8 * len(self.coords)) +
+            2 * _align(4 * len(self.types)))
+
+    def write(self, buf, offset: int=0) -> int:
+        npoints = len(self.coords) // 3
+        nnodes = len(self.types)
+        mv = memoryview(buf).cast('B')
+        try:
+            _header.pack_into(mv, offset, MAGIC, VERSION, 0, self.ngeoms, nnodes, npoints, 0)
+            offset += _align(_header.size)
+            for arr, itemsize in ((self.coords, 8), (self.types, 4), (self.counts, 4)):
+                if _swap:
+                    arr = array(arr.typecode, arr)
+                    arr.byteswap()
+                size = itemsize * len(arr)
+                mv[offset:offset + size] = arr.tobytes()
+                offset += _align(size)
+        finally:
+            mv.release()
+        return offset
+
+
+def buffer_size(geoms) -> int:
+    """
+     * Size in bytes of encoded geometries
+    """
+    return _Encoder(geoms).size
+
+
+def write_buffer(geoms, buf, offset: int=0) -> int:
+    """
+     * Encode geometries into a writable buffer
+     * @param buf bytearray, mmap, shared memory, at least buffer_size(geoms) long
+     * @return offset of the end of encoded data
+    """
+    return _Encoder(geoms).write(buf, offset)
+
+
+def geometries_to_buffer(geoms) -> bytes:
+    """
+     * Encode geometries as bytes
+    """
+    enc = _Encoder(geoms)
+    buf = bytearray(enc.size)
+    enc.write(buf)
+    return bytes(buf)
+
+
+class _Decoder():
+    """
+     * Rebuild geometries from coords, types and counts views
+    """
+    def __init__(self, coords, types, counts, factory):
+        self.coords = coords
+        self.types = types
+        self.counts = counts
+        self.factory = factory
+        self.node = 0
+        self.point = 0
+
+    def read_coords(self, count: int):
+        c = self.coords
+        i = 3 * self.point
+        self.point += count
+        return [Coordinate(c[j], c[j + 1], c[j + 2]) for j in range(i, i + 3 * count, 3)]
+
+    def read(self):
+        from .geom import LineString
+        gf = self.factory
+        type_id = self.types[self.node]
+        count = self.counts[self.node]
+        self.node += 1
+        if type_id in _collections:
+            geoms = [self.read() for i in range(count)]
+            if type_id == GeomTypeId.GEOS_MULTIPOINT:
+                return gf.createMultiPoint(geoms)
+            elif type_id == GeomTypeId.GEOS_MULTILINESTRING:
+                return gf.createMultiLineString(geoms)
+            elif type_id == GeomTypeId.GEOS_MULTIPOLYGON:
+                return gf.createMultiPolygon(geoms)
+            return gf.createGeometryCollection(geoms)
+        elif type_id == GeomTypeId.GEOS_POLYGON:
+            rings = [self.read() for i in range(count)]
+            if len(rings) == 0:
+                return gf.createPolygon()
+            return gf.createPolygon(rings[0], rings[1:])
+        elif type_id == GeomTypeId.GEOS_LINEARRING:
+            return gf.createLinearRing(self.read_coords(count))
+        elif type_id == GeomTypeId.GEOS_LINESTRING:
+            # factory does not create empty linestrings
+            return LineString(self.read_coords(count), gf)
+        elif type_id == GeomTypeId.GEOS_POINT:
+            if count == 0:
+                return gf.createPoint(None)
+            return gf.createPoint(self.read_coords(1)[0])
+        raise ValueError("Unknown geometry type {}".format(type_id))
+
+
+def _views(mv, offset: int):
+    """
+     * Parse header and return coords, types, counts views
+    """
+    magic, version, flags, ngeoms, nnodes, npoints, reserved = _header.unpack_from(mv, offset)
+    if magic != MAGIC:
+        raise ValueError("Not a geometry buffer")
+    if version > VERSION:
+        raise ValueError("Unsupported geometry buffer version {}".format(version))
+    offset += _align(_header.size)
+    views = []
+    for typecode, itemsize, count in (('d', 8, 3 * npoints), ('i', 4, nnodes), ('i', 4, nnodes)):
+        size = itemsize * count
+        view = mv[offset:offset + size].cast(typecode)
+        if _swap:
+            view = array(typecode, view)
+            view.byteswap()
+        views.append(view)
+        offset += _align(size)
+    return ngeoms, views, offset
+
+
+def geometries_from_buffer(buf, factory=None, offset: int=0):
+    """
+     * Decode geometries, read buf in place
+     * @param buf bytes, bytearray, mmap, shared memory
+     * @param factory GeometryFactory of decoded geometries, default to a new one
+     * @return list of geometries
+    """
+    if factory is None:
+        from .geom import GeometryFactory
+        factory = GeometryFactory()
+    mv = memoryview(buf).cast('B')
+    views = []
+    try:
+        ngeoms, views, end = _views(mv, offset)
+        decoder = _Decoder(*views, factory)
+        geoms = [decoder.read() for i in range(ngeoms)]
+    finally:
+        # release views so shared memory and mmap can be closed
+        for view in views:
+            if isinstance(view, memoryview):
+                view.release()
+        mv.release()
+    return geoms
+
+
+def coords_view(buf, offset: int=0):
+    """
+     * Flat x, y, z coords of all points, without copy
+     * caller must release the view before closing buf
+    """
+    mv = memoryview(buf).cast('B')
+    try:
+        ngeoms, views, end = _views(mv, offset)
+        for view in views[1:]:
+            if isinstance(view, memoryview):
+                view.release()
+    finally:
+        mv.release()
+    return views[0]
+
+
+def save(geoms, filepath: str) -> None:
+    """
+     * Write geometries to a file, for on disk cache
+    """
+    with open(filepath, 'wb') as f:
+        f.write(geometries_to_buffer(geoms))
+
+
+def load(filepath: str, factory=None):
+    """
+     * Read geometries from a file through mmap
+    """
+    with open(filepath, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return geometries_from_buffer(mm, factory)
@@ -34,7 +34,7 @@ from .algorithms import (
     )
 from .shared import (
     logger,
-    quicksort,
+    sort_by_cmp,
     TopologyException,
     CoordinateFilter,
     CoordinateSequence,
@@ -237,17 +237,12 @@ class SegmentPointComparator():
         return 0
 
 
-def segmentNodeLT(s1, s2):
-    """
-     * sort segment nodes
-    """
-    return s1.compareTo(s2) < 0
-
-
 class SegmentNode():
     """
      * Represents an intersection point between two NodedSegmentString
     """
+    __slots__ = ('segString', 'coord', 'segmentIndex', 'segmentOctant', 'isInterior')
+
     def __init__(self, edge, coord, segmentIndex: int, segmentOctant: int):
 
         # NodedSegmentString
@@ -298,10 +293,10 @@ class SegmentNodeMap(dict):
 
     @property
     def nodes(self):
-        if not self._sorded:
+        if not self._sorted:
             self._sorted = True
             self._nodes = list(self.values())
-            quicksort(self._nodes, segmentNodeLT)
+            sort_by_cmp(self._nodes)
         # SegmentNode
         return self._nodes
 
@@ -319,7 +314,7 @@ class SegmentNodeMap(dict):
         if node is None:
             node = newNode
 
-        self._sorded = False
+        self._sorted = False
 
         self[key] = node
 
@@ -338,7 +333,7 @@ class SegmentNodeList():
     def __init__(self, edge):
         # NodedSegmentString parent edge
         self.edge = edge
-        # SegmentNode segmentNodeLT
+        # SegmentNode
         self.nodeMap = SegmentNodeMap()
 
     @property
@@ -760,7 +755,7 @@ class MCIndexSegmentSetMutualIntersector(SegmentSetMutualIntersector):
                 queryChain.computeOverlaps(testChain, overlapAction)
                 self.nOverlaps += 1
 
-                if self.si.isDone:
+                if self.si.isDone():
                     return
 
     def addToMonoChains(self, segStr) -> None:
@@ -27,7 +27,8 @@
 from math import pi, cos, sin, log, pow, atan2, sqrt
 from .shared import (
     logger,
-    quicksort,
+    sort_by_key,
+    sort_by_cmp,
     TopologyException,
     GeomTypeId,
     PrecisionModel,
@@ -478,10 +479,6 @@ class BufferOp():
         return scaleFactor
 
 
-def bufferSubgraphGT(first, second) -> bool:
-    return first.compareTo(second) > 0
-
-
 class RightmostEdgeFinder():
     """
      * A RightmostEdgeFinder find the geomgraph.DirectedEdge in a list which has
@@ -828,6 +825,10 @@ class BufferSubGraph():
             return 1
         return 0
 
+    @staticmethod
+    def sort_key(subGraph):
+        return subGraph.rightMostCoord.x
+
     @property
     def envelope(self):
         """
@@ -911,10 +912,6 @@ class DepthSegment():
         return DepthSegment.compareX(self.upwardSeg, other.upwardSeg)
 
 
-def depthSegmentLessThen(first, second) -> bool:
-    return first.compareTo(second) < 0
-
-
 class SubgraphDepthLocater():
     """
      * Locates a subgraph inside a set of subgraphs,
@@ -938,7 +935,7 @@ class SubgraphDepthLocater():
         if len(stabbedSegments) == 0:
             return 0
 
-        quicksort(stabbedSegments, depthSegmentLessThen)
+        sort_by_cmp(stabbedSegments)
         ds = stabbedSegments[0]
         return ds.leftDepth
 
@@ -2747,7 +2744,7 @@ class BufferBuilder():
          * subgraphs for exteriors will have been built before the subgraphs for
          * any interiors they contain
         """
-        quicksort(subGraphList, bufferSubgraphGT)
+        sort_by_key(subGraphList, BufferSubGraph.sort_key, reverse=True)
 
     def buildSubGraphs(self, subGraphList: list, polyBuilder) -> None:
         """
@@ -26,7 +26,8 @@
 
 import time
 from .algorithms import (
-    CGAlgorithms
+    CGAlgorithms,
+    IndexedPointInRingLocator
     )
 from .planargraph import (
     PlanarGraph,
@@ -35,6 +36,7 @@ from .planargraph import (
     Node
     )
 from .geom import GeometryFactory
+from .index_strtree import STRtree
 from .shared import logger
 
 
@@ -288,6 +290,125 @@ class EdgeRing():
         return poly
 
 
+class EdgeRingIndex():
+    """
+    * Spatial index of exterior EdgeRings, to find the innermost
+    * exterior containing a hole without scanning the whole list.
+    *
+    * Exteriors are bulk loaded into a STRtree, candidates are
+    * tested smallest envelope first, so exteriors enclosing the first
+    * containing one are not tested, large exteriors use an indexed
+    * point in ring locator.
+    * Give the same results as EdgeRing.findEdgeRingContaining.
+    """
+    # exteriors with more coords use an indexed locator
+    LOCATOR_MIN_COORDS = 32
+
+    def __init__(self, exteriorList):
+        self._index = STRtree()
+        # index: set of Coordinate
+        self._coords = {}
+        # index: IndexedPointInRingLocator
+        self._locators = {}
+        for i, shell in enumerate(exteriorList):
+            ring = shell.linearRing
+            if ring is None:
+                continue
+            env = ring.envelope
+            self._index.insert(env, (env.area, i, shell, env))
+
+    def _ptNotInList(self, testPts, i, coords):
+        pts = self._coords.get(i)
+        if pts is None:
+            pts = self._coords[i] = set(coords)
+        for testPt in testPts:
+            if testPt not in pts:
+                return testPt
+        return None
+
+    def _isPointInRing(self, pt, i, coords):
+        if len(coords) < EdgeRingIndex.LOCATOR_MIN_COORDS:
+            return CGAlgorithms.isPointInRing(pt, coords)
+        locator = self._locators.get(i)
+        if locator is None:
+            locator = self._locators[i] = IndexedPointInRingLocator(coords)
+        return locator.isPointInRing(pt)
+
+    def _contains(self, testRing, testEnv, i, tryShell, tryEnv):
+        # the hole envelope cannot equal the exterior envelope
+        if tryEnv.equals(testEnv) or not tryEnv.contains(testEnv):
+            return False
+        tryCoords = tryShell.linearRing.coords
+        testPt = self._ptNotInList(testRing.coords, i, tryCoords)
+        # testPt my be None !
+        return testPt is not None and self._isPointInRing(testPt, i, tryCoords)
+
+    def findEdgeRingContaining(self, testEr):
+        """
+        * Find the innermost enclosing exterior EdgeRing
+        * containing the argument EdgeRing, if any.
+        *
+        * @return containing EdgeRing, if there is one
+        * @return null if no containing EdgeRing is found
+        """
+        # LinearRing
+        testRing = testEr.linearRing
+
+        if testRing is None:
+            return None
+
+        # Envelope
+        testEnv = testRing.envelope
+
+        candidates = []
+        self._index.query(testEnv, candidates)
+        # smallest envelope first, then exteriorList order
+        candidates.sort(key=lambda c: (c[0], c[1]))
+
+        # containing exteriors as (index, EdgeRing, Envelope)
+        found = []
+        nested = True
+        innerEnv = None
+        innerArea = 0
+
+        for area, i, tryShell, tryEnv in candidates:
+
+            # for noded input containing exteriors envelopes are nested,
+            # larger ones enclosing the smallest can't be the innermost
+            if innerEnv is not None and area > innerArea and tryEnv.contains(innerEnv):
+                continue
+
+            if self._contains(testRing, testEnv, i, tryShell, tryEnv):
+                if innerEnv is None:
+                    innerEnv = tryEnv
+                    innerArea = area
+                elif not tryEnv.contains(innerEnv):
+                    nested = False
+                found.append((i, tryShell, tryEnv))
+
+        if not nested:
+            # crossing rings, result depends on skipped exteriors
+            found = [
+                (i, tryShell, tryEnv)
+                for area, i, tryShell, tryEnv in candidates
+                if self._contains(testRing, testEnv, i, tryShell, tryEnv)
+                ]
+
+        # same selection rule as linear scan, in exteriorList order
+        found.sort(key=lambda c: c[0])
+
+        # EdgeRing
+        minShell = None
+        minEnv = None
+
+        for i, tryShell, tryEnv in found:
+            if minShell is None or minEnv.contains(tryEnv):
+                minShell = tryShell
+                minEnv = tryEnv
+
+        return minShell
+
+
 class PolygonizeDirectedEdge(DirectedEdge):
     """
     * A DirectedEdge of a PolygonizeGraph, which represents
@@ -917,12 +1038,14 @@ class Polygonizer():
 
     def _assignHolesToShells(self, holeList, exteriorList):
         t = time.time()
-        for hole in holeList:
-            self._assignHoleToShell(hole, exteriorList)
+        if len(holeList) > 0:
+            index = EdgeRingIndex(exteriorList)
+            for hole in holeList:
+                self._assignHoleToShell(hole, index)
         logger.debug("Polygonizer._assignHolesToShells() :%.4f seconds", (time.time() - t))
 
-    def _assignHoleToShell(self, hole, exteriorList):
-        exterior = EdgeRing.findEdgeRingContaining(hole, exteriorList)
+    def _assignHoleToShell(self, hole, index):
+        exterior = index.findEdgeRingContaining(hole)
         if exterior is not None:
             exterior.addHole(hole.getLinearRing())
 
@@ -30,7 +30,7 @@ from .op_polygonize import PolygonizeOp
 from .op_linemerge import LineMerger
 from .shared import (
     logger,
-    quicksort,
+    sort_by_key,
     CoordinateSequence
     )
 
@@ -103,30 +103,54 @@ class PolygonsUnionOp():
         return op._union()
     
     @staticmethod
-    def poly_area_gt(a, b):
-        return a.exterior_area > b.exterior_area
+    def poly_area_key(a):
+        return a.exterior_area
         
+    @staticmethod
+    def ring_key(ring):
+        """
+         * Hash key of a closed ring, made of its envelope and vertices,
+         * invariant to orientation and start point
+        """
+        env = ring.envelope
+        coords = ring.coords
+        # closing point is the first one
+        return (env.minx, env.miny, env.maxx, env.maxy, len(coords),
+            sum(hash(co) for co in coords[1:]))
+
     @staticmethod
     def filter_nested(polys):
         """
           Filter out nested touching holes
+          Polygons matching a hole of a larger polygon are found
+          through a map of exteriors ring_key
         """
-        quicksort(polys, PolygonsUnionOp.poly_area_gt)
-        to_remove = []
-        n_polys = len(polys)
-        
+        sort_by_key(polys, PolygonsUnionOp.poly_area_key, reverse=True)
+
+        # ring_key: indexes of polygons
+        exteriors = {}
+        for j, poly in enumerate(polys):
+            key = PolygonsUnionOp.ring_key(poly.exterior)
+            if key in exteriors:
+                exteriors[key].append(j)
+            else:
+                exteriors[key] = [j]
+
+        to_remove = set()
+
         for i, poly in enumerate(polys):
             if i in to_remove:
                 continue
             for hole in poly.interiors:
-                for j in range(i + 1, n_polys):
-                    other = polys[j]
-                    if (hole.envelope.equals(other.envelope) and
-                            CoordinateSequence.equals_unoriented(hole.coords, other.exterior.coords)):
-                        to_remove.append(j)
-        to_remove.sort()
-        for i in reversed(to_remove):
-            polys.pop(i)
+                others = exteriors.get(PolygonsUnionOp.ring_key(hole))
+                if others is None:
+                    continue
+                for j in others:
+                    if j > i and CoordinateSequence.equals_ring(hole.coords, polys[j].exterior.coords):
+                        to_remove.add(j)
+
+        if len(to_remove) > 0:
+            polys[:] = [poly for j, poly in enumerate(polys) if j not in to_remove]
         
     def _union(self):
         # copy points from input Geometries.
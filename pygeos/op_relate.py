@@ -323,6 +323,8 @@ class RelateNode(Node):
      * Represents a node in the topological graph used to compute spatial
      * relationships.
     """
+    __slots__ = ()
+
     def __init__(self, coord, star):
         Node.__init__(self, coord, star)
 
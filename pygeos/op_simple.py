@@ -115,12 +115,12 @@ class IsSimpleOp():
         type_id = self._geom.type_id
 
         if type_id in [
-                GeomeTypeId.GEOS_LINESTRING,
-                GeomeTypeId.GEOS_MULTILINESTRING
+                GeomTypeId.GEOS_LINESTRING,
+                GeomTypeId.GEOS_MULTILINESTRING
                 ]:
             return self.isSimpleLinearGeometry(self._geom)
 
-        if type_id == GeomeTypeId.GEOS_MULTIPOINT:
+        if type_id == GeomTypeId.GEOS_MULTIPOINT:
             return self.isSimpleMultiPoint(self._geom)
 
         # all other geometry types are simple by definition
@@ -36,6 +36,8 @@ class GraphComponent():
      *
      * Each GraphComponent can carry a Label.
     """
+    __slots__ = ('marked', 'visited', 'label')
+
     def __init__(self):
         self.marked = False
         self.visited = False
@@ -332,6 +334,8 @@ class Node(GraphComponent):
      * subclass Node to add their own application-specific
      * data and methods.
     """
+    __slots__ = ('coord', 'deStar')
+
     def __init__(self, coord, deStar=None):
         # Coordinate The location of this Node
         self.coord = coord
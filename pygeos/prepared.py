@@ -25,6 +25,7 @@
 
 
 from .algorithms import (
+    CGAlgorithms,
     PointLocator,
     LineIntersector,
     SimplePointInAreaLocator,
@@ -32,6 +33,8 @@ from .algorithms import (
     )
 from .shared import (
     logger,
+    Coordinate,
+    CoordinateSequence,
     Envelope,
     LinearComponentExtracter,
     ComponentCoordinateExtracter,
@@ -381,6 +384,248 @@ class RectangleContains():
         return True
 
 
+class RectangleIntersection():
+    """
+     * Optimized implementation of intersection
+     * for cases where the first Geometry is a rectangle.
+     *
+     * Clip linestrings (Liang-Barsky) and convex polygons
+     * (Sutherland-Hodgman) against the rectangle.
+     * Results follow overlay conventions: polygon exteriors are cw,
+     * interiors ccw, empty result is an empty collection.
+     * Return None when the case is not handled (points, rings,
+     * concave polygons, degenerated results), so caller falls back to overlay.
+    """
+    def __init__(self, rect):
+        """
+         * @param rect a rectangular geometry
+        """
+        self.rectangle = rect
+        self.rectEnv = rect.envelope
+        self._factory = rect._factory
+
+    @staticmethod
+    def intersection(rect, geom):
+        ri = RectangleIntersection(rect)
+        return ri._intersection(geom)
+
+    def _intersection(self, geom):
+
+        if not self.rectEnv.intersects(geom.envelope):
+            return self._factory.createGeometryCollection()
+
+        if geom.type_id == GeomTypeId.GEOS_POLYGON:
+            return self.clipPolygon(geom)
+
+        if geom.type_id == GeomTypeId.GEOS_LINESTRING:
+            return self.clipLineString(geom)
+
+        return None
+
+    @staticmethod
+    def orientedRing(coords, cw: bool):
+        coords = [co.clone() for co in coords]
+        if CGAlgorithms.isCCW(coords) == cw:
+            coords.reverse()
+        return coords
+
+    @staticmethod
+    def isConvex(coords) -> bool:
+        """
+         * Tests if all turns of a closed ring have the same direction
+        """
+        sign = 0
+        p0 = coords[-2]
+        p1 = coords[0]
+        for i in range(1, len(coords)):
+            p2 = coords[i]
+            cross = (p1.x - p0.x) * (p2.y - p1.y) - (p1.y - p0.y) * (p2.x - p1.x)
+            if cross > 0:
+                if sign < 0:
+                    return False
+                sign = 1
+            elif cross < 0:
+                if sign > 0:
+                    return False
+                sign = -1
+            if cross != 0 or p1 != p2:
+                p0 = p1
+            p1 = p2
+        return True
+
+    def clipPolygon(self, geom):
+
+        gf = self._factory
+
+        # polygon inside rectangle
+        if self.rectEnv.contains(geom.envelope):
+            return gf.createPolygon(
+                gf.createLinearRing(RectangleIntersection.orientedRing(geom.exterior.coords, True)),
+                [gf.createLinearRing(RectangleIntersection.orientedRing(hole.coords, False))
+                    for hole in geom.interiors]
+                )
+
+        if len(geom.interiors) > 0:
+            return None
+
+        coords = geom.exterior.coords
+
+        if len(coords) < 4 or not RectangleIntersection.isConvex(coords):
+            return None
+
+        pts = self.clipRing(coords)
+
+        if len(pts) == 0:
+            return gf.createGeometryCollection()
+
+        pts.append(pts[0].clone())
+        pts = CoordinateSequence.removeRepeatedPoints(pts)
+
+        # touching along an edge or a point
+        if len(pts) < 4 or CGAlgorithms.signedArea(pts) == 0:
+            return None
+
+        return gf.createPolygon(gf.createLinearRing(RectangleIntersection.orientedRing(pts, True)))
+
+    def _isInside(self, co, side: int) -> bool:
+        env = self.rectEnv
+        if side == 0:
+            return co.x >= env.minx
+        elif side == 1:
+            return co.y >= env.miny
+        elif side == 2:
+            return co.x <= env.maxx
+        return co.y <= env.maxy
+
+    def _cut(self, p0, p1, side: int):
+        env = self.rectEnv
+        if side == 0 or side == 2:
+            x = env.minx if side == 0 else env.maxx
+            t = (x - p0.x) / (p1.x - p0.x)
+            return Coordinate(x, p0.y + t * (p1.y - p0.y), p0.z + t * (p1.z - p0.z))
+        y = env.miny if side == 1 else env.maxy
+        t = (y - p0.y) / (p1.y - p0.y)
+        return Coordinate(p0.x + t * (p1.x - p0.x), y, p0.z + t * (p1.z - p0.z))
+
+    def clipRing(self, coords):
+        """
+         * Sutherland-Hodgman clip of a closed ring, valid for convex rings
+         * @return list of Coordinate, not closed
+        """
+        pts = list(coords[:-1])
+        for side in range(4):
+            if len(pts) == 0:
+                break
+            res = []
+            prec = pts[-1]
+            precInside = self._isInside(prec, side)
+            for co in pts:
+                inside = self._isInside(co, side)
+                if inside != precInside:
+                    res.append(self._cut(prec, co, side))
+                if inside:
+                    res.append(co.clone())
+                prec, precInside = co, inside
+            pts = res
+        return pts
+
+    def clipSegment(self, p0, p1):
+        """
+         * Liang-Barsky clip of a segment
+         * @return parameters t0, t1 of clipped part or None
+        """
+        env = self.rectEnv
+        dx = p1.x - p0.x
+        dy = p1.y - p0.y
+        t0, t1 = 0.0, 1.0
+        for p, q in (
+                (-dx, p0.x - env.minx),
+                (dx, env.maxx - p0.x),
+                (-dy, p0.y - env.miny),
+                (dy, env.maxy - p0.y)):
+            if p == 0:
+                # parallel and outside
+                if q < 0:
+                    return None
+            else:
+                t = q / p
+                if p < 0:
+                    if t > t1:
+                        return None
+                    if t > t0:
+                        t0 = t
+                else:
+                    if t < t0:
+                        return None
+                    if t < t1:
+                        t1 = t
+        return t0, t1
+
+    @staticmethod
+    def _interpolate(p0, p1, t):
+        if t == 0:
+            return p0.clone()
+        if t == 1:
+            return p1.clone()
+        return Coordinate(
+            p0.x + t * (p1.x - p0.x),
+            p0.y + t * (p1.y - p0.y),
+            p0.z + t * (p1.z - p0.z))
+
+    def _isOnBoundary(self, co) -> bool:
+        env = self.rectEnv
+        return co.x == env.minx or co.x == env.maxx or co.y == env.miny or co.y == env.maxy
+
+    def clipLineString(self, geom):
+
+        gf = self._factory
+        coords = geom.coords
+
+        # overlay splits lines at self intersections
+        if len(coords) > 2 and not geom.is_simple:
+            return None
+
+        if self.rectEnv.contains(geom.envelope) and not any(self._isOnBoundary(co) for co in coords[1:-1]):
+            return gf.createLineString([co.clone() for co in coords])
+
+        lines = []
+        part = []
+        for i in range(1, len(coords)):
+            p0, p1 = coords[i - 1], coords[i]
+            res = self.clipSegment(p0, p1)
+            # skip segments touching rectangle at a single point
+            if res is None or res[0] >= res[1]:
+                if len(part) > 1:
+                    lines.append(part)
+                part = []
+                continue
+            t0, t1 = res
+            if t0 > 0 or len(part) == 0:
+                if len(part) > 1:
+                    lines.append(part)
+                part = [RectangleIntersection._interpolate(p0, p1, t0)]
+            end = RectangleIntersection._interpolate(p0, p1, t1)
+            part.append(end)
+            # overlay splits lines at nodes on rectangle boundary
+            if t1 < 1 or self._isOnBoundary(end):
+                lines.append(part)
+                part = []
+
+        if len(part) > 1:
+            lines.append(part)
+
+        lines = [gf.createLineString(CoordinateSequence.removeRepeatedPoints(part)) for part in lines]
+        lines = [line for line in lines if line is not None]
+
+        if len(lines) == 0:
+            return gf.createGeometryCollection()
+
+        if len(lines) == 1:
+            return lines[0]
+
+        return gf.createMultiLineString(lines)
+
+
 # prepared
 
 
@@ -696,9 +941,7 @@ class PreparedPolygonPredicate():
          * @param repPts the representative points of the target geometry
          * @return true if any component intersects the areal test geometry
         """
-        pts = []
-        ComponentCoordinateExtracter.getCoordinates(geom, pts)
-        for pt in pts:
+        for pt in targetPts:
             loc = SimplePointInAreaLocator.locate(pt, geom)
             if loc != Location.EXTERIOR:
                 return True
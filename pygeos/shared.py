@@ -25,36 +25,82 @@
 
 
 from math import sqrt, log, ceil, floor
+from array import array
+from functools import cmp_to_key
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import logging
 logger = logging.getLogger("pygeos")
 
 
-def quicksort(array, sortFunc, begin=0, end=None):
+def fork_executor(max_workers=None):
+    """
+     * ProcessPoolExecutor using the fork start method
+     * Workers inherit imported modules, spawn would start
+     * sys.executable, the blender binary when running in blender.
+     * @return executor or None when fork is not available (windows)
+    """
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        return None
+    try:
+        return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('fork'))
+    except TypeError:
+        # python < 3.7 use default start method
+        if multiprocessing.get_start_method() != 'fork':
+            return None
+        return ProcessPoolExecutor(max_workers=max_workers)
+
+
+def _sort_range(array, begin, end, key, reverse) -> None:
+    if begin == 0 and (end is None or end >= len(array) - 1):
+        array.sort(key=key, reverse=reverse)
+    else:
+        if end is None:
+            end = len(array) - 1
+        array[begin:end + 1] = sorted(array[begin:end + 1], key=key, reverse=reverse)
+
+
+def sort_by_key(array, key, reverse: bool=False, begin: int=0, end=None) -> None:
     """
-     * Quick sort in place array
+     * Stable in place sort of array (Timsort)
      * @param array: the array to sort in place
-     * @param sortFunc: function(@a, @b) -> bool to compare two items
-    """
-    if end is None:
-        end = len(array) - 1
-
-    def _partition(array, begin, end):
-        pivot = begin
-        for i in range(begin + 1, end + 1):
-            if sortFunc(array[i], array[begin]):
-                pivot += 1
-                array[i], array[pivot] = array[pivot], array[i]
-        array[pivot], array[begin] = array[begin], array[pivot]
-        return pivot
-
-    def _quicksort(array, begin, end):
-        if begin >= end:
-            return
-        pivot = _partition(array, begin, end)
-        _quicksort(array, begin, pivot - 1)
-        _quicksort(array, pivot + 1, end)
+     * @param key: function(@a) -> sort key, computed once per item
+     * @param reverse: sort in descending order
+     * @param begin, end: optional inclusive range to sort
+    """
+    _sort_range(array, begin, end, key, reverse)
+
 
-    return _quicksort(array, begin, end)
+def compareTo(a, b) -> int:
+    return a.compareTo(b)
+
+
+def sort_by_cmp(array, cmp=compareTo, reverse: bool=False, begin: int=0, end=None) -> None:
+    """
+     * Stable in place sort of array (Timsort)
+     * Use when order is not expressible as a key (eg: robust orientation tests)
+     * @param array: the array to sort in place
+     * @param cmp: function(@a, @b) -> int, defaults to a.compareTo(b)
+     * @param reverse: sort in descending order
+     * @param begin, end: optional inclusive range to sort
+    """
+    _sort_range(array, begin, end, cmp_to_key(cmp), reverse)
+
+
+def quicksort(array, sortFunc, begin=0, end=None):
+    """
+     * Sort in place array
+     * Kept for compatibility, use sort_by_key or sort_by_cmp instead
+     * @param array: the array to sort in place
+     * @param sortFunc: function(@a, @b) -> bool True when a is before b
+    """
+    def _cmp(a, b):
+        if sortFunc(a, b):
+            return -1
+        if sortFunc(b, a):
+            return 1
+        return 0
+    sort_by_cmp(array, _cmp, False, begin, end)
 
 
 class CAP_STYLE():
@@ -637,6 +683,8 @@ class Envelope():
      * the supplies extent values are automatically sorted into the correct order.
      *
     """
+    __slots__ = ('minx', 'maxx', 'miny', 'maxy')
+
     def __init__(self, x1=None, y1=None, x2=None, y2=None):
         """
          * Creates an Envelope for a region defined by
@@ -1475,6 +1523,8 @@ class Coordinate():
     * The standard comparison functions will ignore the z-ordinate.
     *
     """
+    __slots__ = ('x', 'y', 'z')
+
     def __init__(self, x: float=0, y: float=0, z: float=0):
         self.x = x
         self.y = y
@@ -1846,6 +1896,47 @@ class CoordinateSequence(list):
                 return False
         return True
 
+    @staticmethod
+    def equals_ring(cs1, cs2) -> bool:
+        """
+         * compare two closed rings for equalness
+         * the coordinates of cs1 are the same as the coordinates of cs2
+         * in any direction, starting from any vertex
+        """
+        if cs1 is cs2:
+            return True
+
+        if cs1 is None or cs2 is None:
+            return False
+
+        nCoords = len(cs1)
+
+        if nCoords != len(cs2):
+            return False
+
+        if nCoords < 2:
+            return CoordinateSequence.equals(cs1, cs2)
+
+        # skip closing point
+        nCoords -= 1
+        first = cs1[0]
+        for k in range(nCoords):
+            if cs2[k] != first:
+                continue
+            isEqualForward = True
+            isEqualReverse = True
+            for i in range(1, nCoords):
+                coord = cs1[i]
+                if isEqualForward and coord != cs2[(k + i) % nCoords]:
+                    isEqualForward = False
+                if isEqualReverse and coord != cs2[(k - i) % nCoords]:
+                    isEqualReverse = False
+                if (not isEqualForward) and (not isEqualReverse):
+                    break
+            if isEqualForward or isEqualReverse:
+                return True
+        return False
+
     def almost_equals(self, other, tolerance):
         if self is other:
             return True
@@ -1871,6 +1962,232 @@ class CoordinateSequence(list):
         return "({})".format(", ".join([str(c) for c in self[::-1]]))
 
 
+class PackedCoordinate(Coordinate):
+    """
+     * A Coordinate view over one vertex of a PackedCoordinateSequence.
+     *
+     * Ordinates are read from and written to the sequence buffer,
+     * use clone() to get a detached Coordinate.
+    """
+    __slots__ = ('_data', '_offset')
+
+    def __init__(self, data, index: int):
+        self._data = data
+        self._offset = 3 * index
+
+    @property
+    def x(self) -> float:
+        return self._data[self._offset]
+
+    @x.setter
+    def x(self, x: float) -> None:
+        self._data[self._offset] = x
+
+    @property
+    def y(self) -> float:
+        return self._data[self._offset + 1]
+
+    @y.setter
+    def y(self, y: float) -> None:
+        self._data[self._offset + 1] = y
+
+    @property
+    def z(self) -> float:
+        return self._data[self._offset + 2]
+
+    @z.setter
+    def z(self, z: float) -> None:
+        self._data[self._offset + 2] = z
+
+
+class PackedCoordinateSequence():
+    """
+     * A CoordinateSequence storing ordinates in a contiguous array('d')
+     * as interleaved x, y, z values, 24 bytes per vertex.
+     *
+     * Coordinates are handed out lazily as PackedCoordinate views,
+     * so large inputs only pay for python objects while in use.
+     * toCoordinateArray() returns a regular CoordinateSequence.
+    """
+    __slots__ = ('_data', )
+
+    def __init__(self, coords=None, allowRepeated: bool=True, direction: bool=True):
+        self._data = array('d')
+        if coords is not None:
+            self.add(coords, allowRepeated, direction)
+
+    @staticmethod
+    def fromArray(data):
+        """
+         * Create a sequence from a flat x, y, z iterable / buffer
+        """
+        cs = PackedCoordinateSequence()
+        cs._data = array('d', data)
+        if len(cs._data) % 3 != 0:
+            raise ValueError("Packed coordinates size must be a multiple of 3")
+        return cs
+
+    @property
+    def buffer(self):
+        """
+         * Underlying array('d'), x, y, z interleaved
+        """
+        return self._data
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self._data) == 0
+
+    def __len__(self) -> int:
+        return len(self._data) // 3
+
+    def __getitem__(self, index):
+        if type(index) is slice:
+            return PackedCoordinateSequence([self[i] for i in range(*index.indices(len(self)))])
+        n = len(self)
+        if index < 0:
+            index += n
+        if index < 0 or index >= n:
+            raise IndexError("PackedCoordinateSequence index out of range")
+        return PackedCoordinate(self._data, index)
+
+    def __setitem__(self, index: int, coord) -> None:
+        if index < 0:
+            index += len(self)
+        i = 3 * index
+        self._data[i:i + 3] = array('d', (coord.x, coord.y, coord.z))
+
+    def __iter__(self):
+        data = self._data
+        for i in range(len(self)):
+            yield PackedCoordinate(data, i)
+
+    def getX(self, index: int) -> float:
+        return self._data[3 * index]
+
+    def getY(self, index: int) -> float:
+        return self._data[3 * index + 1]
+
+    def getZ(self, index: int) -> float:
+        return self._data[3 * index + 2]
+
+    def _append(self, coord) -> None:
+        if hasattr(coord, "x"):
+            self._data.extend((coord.x, coord.y, coord.z))
+        elif len(coord) > 2:
+            self._data.extend((coord[0], coord[1], coord[2]))
+        else:
+            self._data.extend((coord[0], coord[1], 0))
+
+    def append(self, coord) -> None:
+        self._append(coord)
+
+    def add(self, coords, allowRepeated: bool=True, direction: bool=True) -> bool:
+        """
+         *  Add a Coordinate or an array of coordinates
+         *
+         *  Coordinates may be Coordinate, or any x, y[, z] indexable
+         *
+         *  @param allowRepeated
+         *  if set to false, repeated coordinates are collapsed
+         *
+         *  @param direction if false, the array is added in reverse order
+         *
+         *  @return true (as by general collection contract)
+        """
+        if isinstance(coords, Coordinate):
+            if not allowRepeated and len(self) > 0 and coords == self[-1]:
+                return False
+            self._append(coords)
+            return True
+
+        if type(coords) is PackedCoordinateSequence and allowRepeated and direction:
+            self._data.extend(coords._data)
+            return True
+
+        if not direction:
+            coords = list(reversed(coords))
+
+        data = self._data
+        n = len(self)
+        for coord in coords:
+            self._append(coord)
+            if not allowRepeated and len(self) > n + 1:
+                i = len(data) - 6
+                if data[i] == data[i + 3] and data[i + 1] == data[i + 4]:
+                    del data[i + 3:]
+        return True
+
+    def extend(self, coords) -> None:
+        self.add(coords)
+
+    def clear(self) -> None:
+        del self._data[:]
+
+    def setPoints(self, coords) -> None:
+        self.clear()
+        self.add(coords)
+
+    def index(self, coord) -> int:
+        data = self._data
+        x, y = coord.x, coord.y
+        for i in range(0, len(data), 3):
+            if data[i] == x and data[i + 1] == y:
+                return i // 3
+        raise ValueError("Coordinate not in sequence")
+
+    def reverse(self) -> None:
+        data = self._data
+        for k in range(3):
+            data[k::3] = data[k::3][::-1]
+
+    def expandEnvelope(self, env) -> None:
+        if self.is_empty:
+            return
+        data = self._data
+        env.expandToInclude(Envelope(min(data[0::3]), min(data[1::3]), max(data[0::3]), max(data[1::3])))
+
+    def applyCoordinateFilter(self, f) -> None:
+        for c in self:
+            f.filter(c)
+
+    def apply_ro(self, filter):
+        for coord in self:
+            filter.filter_ro(coord)
+
+    def apply_rw(self, filter):
+        for coord in self:
+            filter.filter_rw(coord)
+
+    def toCoordinateArray(self):
+        """
+         * Detached CoordinateSequence of Coordinate
+        """
+        data = self._data
+        return CoordinateSequence([
+            Coordinate(data[i], data[i + 1], data[i + 2]) for i in range(0, len(data), 3)
+            ])
+
+    def clone(self):
+        cs = PackedCoordinateSequence()
+        cs._data = array('d', self._data)
+        return cs
+
+    def __eq__(self, other) -> bool:
+        if type(other) is PackedCoordinateSequence:
+            data, odata = self._data, other._data
+            if len(data) != len(odata):
+                return False
+            return data[0::3] == odata[0::3] and data[1::3] == odata[1::3]
+        return CoordinateSequence.equals(self, other)
+
+    def __ne__(self, other) -> bool:
+        return not self.__eq__(other)
+
+    def __str__(self) -> str:
+        return "({})".format(", ".join([str(c) for c in self]))
+
+
 class CoordinateFilter():
     """
      * Geometry classes support the concept of applying a
@@ -288,6 +288,8 @@ class TaggedLineSegment(LineSegment):
      * Used to index the segments in a geometry and recover the segment locations
      * from the index.
     """
+    __slots__ = ('parent', 'index')
+
     def __init__(self, p0, p1=None, parent=None, index: int=0):
 
         if p1 is None:
@@ -0,0 +1,416 @@
+# -*- coding:utf-8 -*-
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110- 1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+# ----------------------------------------------------------
+# Author: Stephen Leger (s-leger)
+#
+# ----------------------------------------------------------
+"""
+    Bounding box index backends for archipack_polylines.Qtree
+
+    Every backend expose the pyqtree _QuadTree internal api:
+    _insert(item, bbox) and _intersect(rect, results=None) -> set
+    bbox and rect are (xmin, ymin, xmax, ymax) tuples
+
+    QUADTREE: pyqtree recursive quadtree, items crossing node centers
+              are duplicated in children, sized to the coordsys bounds
+    STRTREE: bulk loaded STR packed R-tree, balanced and without
+             duplication, suited to static sets queried many times
+    GRID: uniform grid hash, fastest for point snapping
+    GridIndex3d: uniform 3d grid hash of world bounding boxes
+
+    SweepOverlaps: report all overlapping pairs of a static set of boxes
+"""
+from math import floor
+from heapq import heappush, heappop
+from .pyqtree import _QuadTree
+from .pygeos.shared import Envelope
+from .pygeos.index_strtree import STRtree, AbstractNode
+
+
+QUADTREE = 'QUADTREE'
+STRTREE = 'STRTREE'
+GRID = 'GRID'
+
+
+class PackedRtree():
+    """
+        STR packed R-tree, built in bulk by pygeos STRtree and flattened
+        into (is_leaf, [(minx, miny, maxx, maxy, node or item)]) tuples for queries.
+        Items inserted after a build go to a pending grid hash,
+        the R-tree is rebuilt once pending items outnumber
+        rebuild_ratio of indexed ones.
+    """
+    def __init__(self, width, height, node_capacity=10, rebuild_ratio=1.0, min_pending=256):
+        self.width = width
+        self.height = height
+        self.node_capacity = node_capacity
+        self.rebuild_ratio = rebuild_ratio
+        self.min_pending = min_pending
+        # (item, bbox)
+        self._items = []
+        self._root = None
+        self._n_indexed = 0
+        self._pending = self._new_pending()
+
+    def _new_pending(self):
+        return GridIndex(grid_cell_size(self.width, self.height))
+
+    def _insert(self, item, bbox):
+        self._items.append((item, bbox))
+        self._pending._insert(item, bbox)
+
+    def _flatten(self, node):
+        childs = []
+        is_leaf = True
+        for child in node.childs:
+            b = child.bounds
+            if b is None:
+                continue
+            if isinstance(child, AbstractNode):
+                is_leaf = False
+                childs.append((b.minx, b.miny, b.maxx, b.maxy, self._flatten(child)))
+            else:
+                childs.append((b.minx, b.miny, b.maxx, b.maxy, child.item))
+        return (is_leaf, childs)
+
+    def build(self):
+        tree = STRtree(self.node_capacity)
+        for item, bbox in self._items:
+            tree.insert(Envelope(bbox[0], bbox[1], bbox[2], bbox[3]), item)
+        tree.build()
+        self._root = self._flatten(tree.root)
+        self._n_indexed = len(self._items)
+        self._pending = self._new_pending()
+
+    def _intersect(self, rect, results=None):
+        if results is None:
+            results = set()
+
+        n_pending = len(self._items) - self._n_indexed
+        if n_pending > max(self.min_pending, self.rebuild_ratio * self._n_indexed):
+            self.build()
+            n_pending = 0
+
+        if n_pending > 0:
+            self._pending._intersect(rect, results)
+
+        x0, y0, x1, y1 = rect
+
+        if self._root is not None:
+            stack = [self._root]
+            while stack:
+                is_leaf, childs = stack.pop()
+                if is_leaf:
+                    for cx0, cy0, cx1, cy1, item in childs:
+                        if cx1 >= x0 and cx0 <= x1 and cy1 >= y0 and cy0 <= y1:
+                            results.add(item)
+                else:
+                    for cx0, cy0, cx1, cy1, node in childs:
+                        if cx1 >= x0 and cx0 <= x1 and cy1 >= y0 and cy0 <= y1:
+                            stack.append(node)
+
+        return results
+
+
+class GridIndex():
+    """
+        Uniform grid hash, items are stored in every cell their bbox covers.
+        Items covering more than max_cells are kept aside
+        and tested on every query.
+    """
+    def __init__(self, cell_size, max_cells=64):
+        self.cell_size = cell_size
+        self.max_cells = max_cells
+        self._inv = 1.0 / cell_size
+        self._cells = {}
+        self._large = []
+
+    def _range(self, bbox):
+        inv = self._inv
+        return (int(floor(bbox[0] * inv)),
+            int(floor(bbox[1] * inv)),
+            int(floor(bbox[2] * inv)),
+            int(floor(bbox[3] * inv)))
+
+    def _insert(self, item, bbox):
+        i0, j0, i1, j1 = self._range(bbox)
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > self.max_cells:
+            self._large.append((item, bbox))
+            return
+        entry = (item, bbox)
+        cells = self._cells
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                cell = cells.get((i, j))
+                if cell is None:
+                    cells[(i, j)] = [entry]
+                else:
+                    cell.append(entry)
+
+    def _intersect(self, rect, results=None):
+        if results is None:
+            results = set()
+        x0, y0, x1, y1 = rect
+        i0, j0, i1, j1 = self._range(rect)
+        cells = self._cells
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > len(cells):
+            # query larger than populated area
+            candidates = (entry for cell in cells.values() for entry in cell)
+        else:
+            candidates = (entry
+                for i in range(i0, i1 + 1)
+                for j in range(j0, j1 + 1)
+                for entry in cells.get((i, j), ()))
+        for item, b in candidates:
+            if b[2] >= x0 and b[0] <= x1 and b[3] >= y0 and b[1] <= y1:
+                results.add(item)
+        for item, b in self._large:
+            if b[2] >= x0 and b[0] <= x1 and b[3] >= y0 and b[1] <= y1:
+                results.add(item)
+        return results
+
+
+class GridIndex3d():
+    """
+        Uniform 3d grid hash, same as GridIndex with z.
+        bbox and rect are (xmin, ymin, zmin, xmax, ymax, zmax) tuples,
+        query ranges are clamped to populated cells so unbounded
+        axis (+-1e32) are supported.
+    """
+    def __init__(self, cell_size, max_cells=512):
+        self.cell_size = cell_size
+        self.max_cells = max_cells
+        self._inv = 1.0 / cell_size
+        self._cells = {}
+        self._large = []
+        self._min = None
+        self._max = None
+
+    def _range(self, bbox):
+        inv = self._inv
+        return (int(floor(bbox[0] * inv)),
+            int(floor(bbox[1] * inv)),
+            int(floor(bbox[2] * inv)),
+            int(floor(bbox[3] * inv)),
+            int(floor(bbox[4] * inv)),
+            int(floor(bbox[5] * inv)))
+
+    def _insert(self, item, bbox):
+        i0, j0, k0, i1, j1, k1 = self._range(bbox)
+        if (i1 - i0 + 1) * (j1 - j0 + 1) * (k1 - k0 + 1) > self.max_cells:
+            self._large.append((item, bbox))
+            return
+        if self._min is None:
+            self._min = [i0, j0, k0]
+            self._max = [i1, j1, k1]
+        else:
+            self._min = [min(a, b) for a, b in zip(self._min, (i0, j0, k0))]
+            self._max = [max(a, b) for a, b in zip(self._max, (i1, j1, k1))]
+        entry = (item, bbox)
+        cells = self._cells
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                for k in range(k0, k1 + 1):
+                    cell = cells.get((i, j, k))
+                    if cell is None:
+                        cells[(i, j, k)] = [entry]
+                    else:
+                        cell.append(entry)
+
+    def _intersect(self, rect, results=None):
+        if results is None:
+            results = set()
+        x0, y0, z0, x1, y1, z1 = rect
+        for item, b in self._large:
+            if (b[3] >= x0 and b[0] <= x1 and b[4] >= y0 and
+                    b[1] <= y1 and b[5] >= z0 and b[2] <= z1):
+                results.add(item)
+        if self._min is None:
+            return results
+        r = self._range(rect)
+        i0, j0, k0 = [max(a, b) for a, b in zip(r[0:3], self._min)]
+        i1, j1, k1 = [min(a, b) for a, b in zip(r[3:6], self._max)]
+        if i0 > i1 or j0 > j1 or k0 > k1:
+            return results
+        cells = self._cells
+        if (i1 - i0 + 1) * (j1 - j0 + 1) * (k1 - k0 + 1) > len(cells):
+            # query larger than populated area
+            candidates = (entry for cell in cells.values() for entry in cell)
+        else:
+            candidates = (entry
+                for i in range(i0, i1 + 1)
+                for j in range(j0, j1 + 1)
+                for k in range(k0, k1 + 1)
+                for entry in cells.get((i, j, k), ()))
+        for item, b in candidates:
+            if (b[3] >= x0 and b[0] <= x1 and b[4] >= y0 and
+                    b[1] <= y1 and b[5] >= z0 and b[2] <= z1):
+                results.add(item)
+        return results
+
+
+class SweepOverlaps():
+    """
+        Report all pairs of overlapping boxes with an x sweep line.
+        Active boxes are kept in two structures over ranked y values:
+        - a segment tree reporting boxes stabbed by the query bottom
+        - a count tree reporting boxes starting inside the query
+        O((n + k) log n) for n boxes and k overlapping pairs.
+        Overlap test is inclusive, as _intersect of backends.
+    """
+    def __init__(self, boxes):
+        self.boxes = boxes
+        ys = sorted(set(y for b in boxes for y in (b[1], b[3])))
+        self._rank = {y: i for i, y in enumerate(ys)}
+        size = 1
+        while size < len(ys):
+            size <<= 1
+        self._size = size
+        # segment tree nodes, set of items covering node range
+        self._stab = [None] * (2 * size)
+        # active items count under node, and items by start rank
+        self._count = [0] * (2 * size)
+        self._start = [None] * size
+
+    def _ranks(self, item):
+        b = self.boxes[item]
+        return self._rank[b[1]], self._rank[b[3]]
+
+    def _add(self, item):
+        r0, r1 = self._ranks(item)
+        stab = self._stab
+        lo, hi = r0 + self._size, r1 + self._size + 1
+        while lo < hi:
+            if lo & 1:
+                if stab[lo] is None:
+                    stab[lo] = set()
+                stab[lo].add(item)
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                if stab[hi] is None:
+                    stab[hi] = set()
+                stab[hi].add(item)
+            lo >>= 1
+            hi >>= 1
+        if self._start[r0] is None:
+            self._start[r0] = set()
+        self._start[r0].add(item)
+        pos = r0 + self._size
+        while pos > 0:
+            self._count[pos] += 1
+            pos >>= 1
+
+    def _remove(self, item):
+        r0, r1 = self._ranks(item)
+        stab = self._stab
+        lo, hi = r0 + self._size, r1 + self._size + 1
+        while lo < hi:
+            if lo & 1:
+                stab[lo].discard(item)
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                stab[hi].discard(item)
+            lo >>= 1
+            hi >>= 1
+        self._start[r0].discard(item)
+        pos = r0 + self._size
+        while pos > 0:
+            self._count[pos] -= 1
+            pos >>= 1
+
+    def _query(self, item, found):
+        r0, r1 = self._ranks(item)
+        size = self._size
+        stab = self._stab
+        # active boxes containing r0
+        pos = r0 + size
+        while pos > 0:
+            if stab[pos]:
+                found.extend(stab[pos])
+            pos >>= 1
+        # active boxes starting in ]r0, r1]
+        count = self._count
+        nodes = []
+        lo, hi = r0 + 1 + size, r1 + size + 1
+        while lo < hi:
+            if lo & 1:
+                nodes.append(lo)
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                nodes.append(hi)
+            lo >>= 1
+            hi >>= 1
+        while nodes:
+            pos = nodes.pop()
+            if count[pos] == 0:
+                continue
+            if pos >= size:
+                found.extend(self._start[pos - size])
+            else:
+                nodes.append(2 * pos)
+                nodes.append(2 * pos + 1)
+
+    def pairs(self):
+        """
+            Return list of (i, j) overlapping pairs with i < j, unordered
+        """
+        boxes = self.boxes
+        order = sorted(range(len(boxes)), key=lambda i: boxes[i][0])
+        active = []
+        pairs = []
+        found = []
+        for i in order:
+            x0 = boxes[i][0]
+            while active and active[0][0] < x0:
+                self._remove(heappop(active)[1])
+            self._query(i, found)
+            pairs.extend((j, i) if j < i else (i, j) for j in found)
+            del found[:]
+            self._add(i)
+            heappush(active, (boxes[i][2], i))
+        return pairs
+
+
+def grid_cell_size(width, height, grid_size=256):
+    cell_size = max(width, height) / grid_size
+    if cell_size <= 0:
+        return 1.0
+    return cell_size
+
+
+def new_index(backend, width, height, max_items=10, max_depth=20, cell_size=None, grid_size=256):
+    """
+        Create an index backend for a region of width x height
+        centered on origin
+        cell_size: GRID cell size, default to region size / grid_size
+    """
+    if backend == STRTREE:
+        return PackedRtree(width, height, max_items)
+    if backend == GRID:
+        if cell_size is None:
+            cell_size = grid_cell_size(width, height, grid_size)
+        return GridIndex(cell_size)
+    return _QuadTree(0, 0, width, height, max_items, max_depth)